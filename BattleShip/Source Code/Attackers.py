@@ -0,0 +1,149 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: Attacker strategies for playing Battleship without the GUI. An attacker picks the next
+#              coordinate to fire at with choose() and is told the outcome with observe(). Strategies are
+#              registered by name in ATTACKERS so the simulation runner can select them from the command line.
+
+import random
+
+
+class RandomAttacker:
+    def __init__(self, size=10, rng=None):
+        """
+        Initialize an attacker that fires at every cell once, in random order.
+
+        Args:
+            size (int): The size of the board being attacked.
+            rng (random.Random): The random number generator to use.
+        """
+        self.size = size
+        self.rng = rng if rng is not None else random.Random()
+        self.targets = [(row, col) for row in range(size) for col in range(size)]
+        self.rng.shuffle(self.targets)
+
+    def choose(self):
+        """
+        Pick the next coordinate to attack.
+
+        Returns:
+            tuple: The coordinates (row, col) to attack.
+        """
+        return self.targets.pop()
+
+    def observe(self, coord, result, sunk=False):
+        """
+        Record the outcome of an attack. The random attacker ignores it.
+
+        Args:
+            coord (tuple): The coordinates (row, col) that were attacked.
+            result (str): 'Hit', 'Miss' or 'Already Attacked'.
+            sunk (bool): True if the attack sank a ship.
+        """
+
+
+class HuntTargetAttacker:
+    def __init__(self, size=10, rng=None):
+        """
+        Initialize a hunt/target attacker.
+
+        While hunting it fires at random cells of one checkerboard colour first, since every
+        ship longer than one cell covers that colour, then at the remaining cells. After a hit
+        it targets the neighbours of the hit cells until the ship is sunk. Hits that do not
+        belong to a sunk ship stay targeted, so a second ship found while sinking the first is
+        finished next.
+
+        Args:
+            size (int): The size of the board being attacked.
+            rng (random.Random): The random number generator to use.
+        """
+        self.size = size
+        self.rng = rng if rng is not None else random.Random()
+        even = [(row, col) for row in range(size) for col in range(size) if (row + col) % 2 == 0]
+        odd = [(row, col) for row in range(size) for col in range(size) if (row + col) % 2 == 1]
+        self.rng.shuffle(even)
+        self.rng.shuffle(odd)
+        self.hunt = odd + even  # Popped from the end, so the even colour goes first
+        self.targets = []
+        self.attacked = set()
+        self.hits = set()  # Hits not yet known to belong to a sunk ship
+
+    def choose(self):
+        """
+        Pick the next coordinate to attack.
+
+        Returns:
+            tuple: The coordinates (row, col) to attack.
+        """
+        while self.targets:
+            coord = self.targets.pop()
+            if coord not in self.attacked:
+                return coord
+        while True:
+            coord = self.hunt.pop()
+            if coord not in self.attacked:
+                return coord
+
+    def observe(self, coord, result, sunk=False):
+        """
+        Record the outcome of an attack and queue the neighbours of a hit. When a ship sinks,
+        the targets are rebuilt from the hits that remain.
+
+        Args:
+            coord (tuple): The coordinates (row, col) that were attacked.
+            result (str): 'Hit', 'Miss' or 'Already Attacked'.
+            sunk (bool): True if the attack sank a ship.
+        """
+        self.attacked.add(coord)
+        if result != 'Hit':
+            return
+        self.hits.add(coord)
+        if not sunk:
+            self.queue_neighbours(coord)
+            return
+        self.hits -= self.sunk_cells(coord)
+        self.targets = []
+        for hit in sorted(self.hits):
+            self.queue_neighbours(hit)
+
+    def sunk_cells(self, coord):
+        """
+        Work out which hits belong to the ship sunk by an attack: the line of hits through the
+        attacked cell. If hits run both across and down from it, only the attacked cell is taken,
+        since the line cannot be told apart from a neighbouring ship.
+
+        Args:
+            coord (tuple): The coordinates (row, col) of the attack that sank the ship.
+
+        Returns:
+            set: The coordinates of the sunk ship's cells.
+        """
+        lines = []
+        for step_row, step_col in ((0, 1), (1, 0)):
+            line = {coord}
+            for sign in (1, -1):
+                row, col = coord[0] + sign * step_row, coord[1] + sign * step_col
+                while (row, col) in self.hits:
+                    line.add((row, col))
+                    row, col = row + sign * step_row, col + sign * step_col
+            if len(line) > 1:
+                lines.append(line)
+        return lines[0] if len(lines) == 1 else {coord}
+
+    def queue_neighbours(self, coord):
+        """
+        Queue the neighbours of a cell that have not been attacked yet.
+
+        Args:
+            coord (tuple): The coordinates (row, col) of the cell.
+        """
+        row, col = coord
+        for neighbour in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if 0 <= neighbour[0] < self.size and 0 <= neighbour[1] < self.size \
+                    and neighbour not in self.attacked:
+                self.targets.append(neighbour)
+
+
+ATTACKERS = {
+    'random': RandomAttacker,
+    'hunt_target': HuntTargetAttacker,
+}
@@ -5,37 +5,73 @@
 #              and Logger to facilitate the game logic and maintain game state.
 
 from Player import Player
-from Ship import Ship
 from Board import Board
+from FleetLayout import FleetLayout
 from GLogger import Logger
-import random
 
 
 class Game:
-    def __init__(self):
-        self.board = Board()
+    ship_sizes = [5, 4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
+
+    def __init__(self, board=None, logger=None, salvo=False):
+        """
+        Initialize the game with a board, a player and a logger.
+
+        Args:
+            board (Board): The board to play on. Any object with the Board API works, such as a
+                           BitBoard; a new 10x10 Board is used if none is given.
+            logger (Logger): Where moves are recorded, such as a Logger or a MoveJournal. A text
+                             Logger writing to ./game_log.txt is used if none is given.
+            salvo (bool): If True, each turn fires one shot per ship still afloat.
+        """
+        self.board = board if board is not None else Board()
         self.player = Player("Player 1")
-        self.logger = Logger("./game_log.txt")
+        self.logger = logger if logger is not None else Logger("./game_log.txt")
+        self.salvo = salvo
 
     def setup(self):
-        # Place ships randomly on the board
-        ship_sizes = [5, 4, 3, 3, 2, 2, 2, 1, 1, 1, 1]
-        for size in ship_sizes:
-            while True:
-                try:
-                    start = (random.randint(0, 9), random.randint(0, 9))
-                    orientation = random.choice(['H', 'V'])
-                    ship = Ship(size)
-                    self.board.place_ship(ship, start, orientation)
-                    break
-                except ValueError:
-                    continue
+        # Place ships randomly on the board, drawn uniformly from every legal fleet layout
+        generator = FleetLayout(self.board.size, self.ship_sizes)
+        generator.apply(self.board, generator.sample())
 
     def play_turn(self, coord):
         result = self.player.make_move(self.board, coord)
         self.logger.log_move(self.board, coord, result)
         return result
 
+    def shots_allowed(self):
+        """
+        Return how many shots the player may fire this turn.
+
+        Returns:
+            int: One shot per ship still afloat in salvo mode, otherwise 1.
+        """
+        if not self.salvo:
+            return 1
+        return sum(1 for ship in self.board.ships if not ship.is_sunk)
+
+    def play_salvo(self, coords):
+        """
+        Fire a salvo of shots in one turn and log each of them.
+
+        Args:
+            coords (list): The coordinates (row, col) to attack, as tuples or as rows of an
+                           (n, 2) array.
+
+        Returns:
+            tuple: A list with the result of each shot and a list of the ships sunk.
+
+        Raises:
+            ValueError: If more shots are fired than shots_allowed() permits.
+        """
+        coords = [(int(row), int(col)) for row, col in coords]
+        if len(coords) > self.shots_allowed():
+            raise ValueError(f"Only {self.shots_allowed()} shots are allowed this turn")
+        results, sunk = self.player.make_moves(self.board, coords)
+        for coord, result in zip(coords, results):
+            self.logger.log_move(self.board, coord, result)
+        return results, sunk
+
     def is_game_over(self):
         return self.board.is_all_ships_sunk()
 
@@ -0,0 +1,258 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The BitBoard class is a drop-in replacement for Board that stores ship occupancy, hits and
+#              misses as integer bitmasks instead of a grid of characters. Cell (row, col) maps to bit
+#              row * size + col, and a flat cell-to-ship index resolves an attack to its ship in O(1),
+#              so placements and attacks no longer scan every ship's position list.
+
+class BitBoard:
+    def __init__(self, size=10):
+        """
+        Initialize an empty bitboard with a given size.
+
+        Args:
+            size (int): The size of the board (default is 10x10).
+        """
+        self.size = size
+        self.ships = []
+        self.hits = []
+        self.misses = []
+        self.occupied = 0  # Bits set for every cell covered by a ship
+        self.hit_mask = 0  # Bits set for every attacked cell that contained a ship
+        self.miss_mask = 0  # Bits set for every attacked cell that was empty
+        self.cell_ship = [-1] * (size * size)  # Index into self.ships for each cell, -1 if empty
+        self.remaining = []  # Unhit cells of each ship, as a bitmask
+        self._grid = None  # Cached character grid, rebuilt lazily when the board changes
+
+    def ship_mask(self, size, start, orientation):
+        """
+        Compute the bitmask covered by a ship without placing it.
+
+        Args:
+            size (int): The length of the ship.
+            start (tuple): The starting position (row, col) for the ship.
+            orientation (str): 'H' for horizontal, 'V' for vertical.
+
+        Returns:
+            int: The bitmask of the covered cells, or 0 if the ship would leave the board.
+        """
+        row, col = start
+        if row < 0 or col < 0:
+            return 0
+        if orientation == 'H':
+            if row >= self.size or col + size > self.size:
+                return 0
+            return ((1 << size) - 1) << (row * self.size + col)
+        if orientation == 'V':
+            if col >= self.size or row + size > self.size:
+                return 0
+            mask = 0
+            bit = 1 << (row * self.size + col)
+            for _ in range(size):
+                mask |= bit
+                bit <<= self.size
+            return mask
+        return 0
+
+    def place_ship(self, ship, start, orientation):
+        """
+        Place a ship on the board at the specified start position and orientation.
+
+        The placement is validated as a whole before anything is written, so a failed
+        placement leaves the board untouched.
+
+        Args:
+            ship (Ship): The ship to place.
+            start (tuple): The starting position (row, col) for the ship.
+            orientation (str): The orientation of the ship, 'H' for horizontal, 'V' for vertical.
+
+        Raises:
+            ValueError: If the ship cannot be placed at the specified location.
+        """
+        mask = self.ship_mask(ship.size, start, orientation)
+        if not mask or mask & self.occupied:
+            raise ValueError("Invalid position for ship placement")
+        ship.place(start, orientation)
+        index = len(self.ships)
+        for row, col in ship.positions:
+            self.cell_ship[row * self.size + col] = index
+        self.occupied |= mask
+        self.remaining.append(mask)
+        self.ships.append(ship)
+        self._grid = None
+
+    def is_valid_position(self, pos):
+        """
+        Check if a position is valid for placing a ship.
+
+        Args:
+            pos (tuple): The position (row, col) to check.
+
+        Returns:
+            bool: True if the position is on the board and not covered by a ship, False otherwise.
+        """
+        row, col = pos
+        if row < 0 or row >= self.size or col < 0 or col >= self.size:
+            return False
+        return not (self.occupied >> (row * self.size + col)) & 1
+
+    def receive_attack(self, coord):
+        """
+        Handle an attack at the specified coordinates.
+
+        Args:
+            coord (tuple): The coordinates (row, col) of the attack.
+
+        Returns:
+            str: 'Hit' if a ship is hit, 'Miss' if no ship is at the location,
+                 'Already Attacked' if the position was already attacked.
+
+        Raises:
+            IndexError: If the coordinates are outside the board.
+        """
+        return self.receive_attacks((coord,))[0][0]
+
+    def receive_attacks(self, coords):
+        """
+        Handle several attacks in one pass, such as a salvo.
+
+        Every coordinate is checked before any is applied, so an invalid salvo leaves the
+        board untouched. The attacks are then resolved in order, so a repeated coordinate
+        within the same call is 'Already Attacked' the second time.
+
+        Args:
+            coords (list): The coordinates (row, col) of the attacks, as tuples or as rows of
+                           an (n, 2) array.
+
+        Returns:
+            tuple: A list with the result of each attack ('Hit', 'Miss' or 'Already Attacked')
+                   and a list of the ships sunk by these attacks.
+
+        Raises:
+            IndexError: If any of the coordinates are outside the board.
+        """
+        size = self.size
+        for row, col in coords:
+            if row < 0 or row >= size or col < 0 or col >= size:
+                raise IndexError("Attack coordinates are outside the board")
+        attacked = self.hit_mask | self.miss_mask
+        results = []
+        sunk = []
+        for row, col in coords:
+            cell = int(row) * size + int(col)
+            bit = 1 << cell
+            if attacked & bit:
+                results.append('Already Attacked')
+                continue
+            attacked |= bit
+            if self.occupied & bit:
+                self.hit_mask |= bit
+                self.hits.append(divmod(cell, size))
+                index = self.cell_ship[cell]
+                self.remaining[index] &= ~bit
+                if not self.remaining[index]:
+                    self.ships[index].is_sunk = True
+                    sunk.append(self.ships[index])
+                results.append('Hit')
+            else:
+                self.miss_mask |= bit
+                self.misses.append(divmod(cell, size))
+                results.append('Miss')
+            self._grid = None
+        return results, sunk
+
+    def restore(self, hit_mask, miss_mask):
+        """
+        Set the attacked cells of the board directly from bitmasks, such as a journal keyframe.
+
+        The ships must already be placed. The hits and misses lists are rebuilt in cell order.
+
+        Args:
+            hit_mask (int): The bitmask of cells that were hit.
+            miss_mask (int): The bitmask of cells that were missed.
+        """
+        self.hit_mask = hit_mask
+        self.miss_mask = miss_mask
+        self.hits = []
+        self.misses = []
+        for mask, cells in ((hit_mask, self.hits), (miss_mask, self.misses)):
+            while mask:
+                low = mask & -mask
+                cells.append(divmod(low.bit_length() - 1, self.size))
+                mask ^= low
+        for index, ship in enumerate(self.ships):
+            placed = self.ship_mask(ship.size, ship.start, ship.orientation)
+            self.remaining[index] = placed & ~hit_mask
+            ship.is_sunk = not self.remaining[index]
+        self._grid = None
+
+    def is_all_ships_sunk(self):
+        """
+        Check if all ships on the board have been sunk.
+
+        Returns:
+            bool: True if all ships are sunk, False otherwise.
+        """
+        return not self.occupied & ~self.hit_mask
+
+    def cell_state(self, coord):
+        """
+        Return the character shown for a single cell, without building the grid.
+
+        Args:
+            coord (tuple): The coordinates (row, col) of the cell.
+
+        Returns:
+            str: 'S' for a ship, 'X' for a hit, 'O' for a miss or '-' for untouched water.
+        """
+        bit = 1 << (coord[0] * self.size + coord[1])
+        if self.hit_mask & bit:
+            return 'X'
+        if self.miss_mask & bit:
+            return 'O'
+        if self.occupied & bit:
+            return 'S'
+        return '-'
+
+    @property
+    def grid(self):
+        """
+        The board as a list of rows of characters, in the same format as Board.grid.
+
+        Ships are 'S', hits 'X', misses 'O' and untouched water '-'. The grid is only
+        built when something reads it, so headless code never pays for it.
+
+        Returns:
+            list: A list of rows, each a list of single-character strings.
+        """
+        if self._grid is None:
+            grid = []
+            for row in range(self.size):
+                base = row * self.size
+                line = []
+                for col in range(self.size):
+                    bit = 1 << (base + col)
+                    if self.hit_mask & bit:
+                        line.append('X')
+                    elif self.miss_mask & bit:
+                        line.append('O')
+                    elif self.occupied & bit:
+                        line.append('S')
+                    else:
+                        line.append('-')
+                grid.append(line)
+            self._grid = grid
+        return self._grid
+
+    def display(self, show_ships=False):
+        """
+        Display the current state of the board.
+
+        Args:
+            show_ships (bool): If True, reveal the positions of the ships.
+                               If False, hide the ships and only show hits and misses.
+        """
+        for row in self.grid:
+            if not show_ships:
+                row = ['-' if cell == 'S' else cell for cell in row]
+            print(" ".join(row))
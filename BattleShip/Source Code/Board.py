@@ -33,11 +33,11 @@ class Board:
             ValueError: If the ship cannot be placed at the specified location.
         """
         ship.place(start, orientation)
+        # Check every cell before writing any, so a failed placement leaves no stray cells
+        if not all(self.is_valid_position(pos) for pos in ship.positions):
+            raise ValueError("Invalid position for ship placement")
         for pos in ship.positions:
-            if self.is_valid_position(pos):
-                self.grid[pos[0]][pos[1]] = 'S'
-            else:
-                raise ValueError("Invalid position for ship placement")
+            self.grid[pos[0]][pos[1]] = 'S'
         self.ships.append(ship)
 
     def is_valid_position(self, pos):
@@ -72,18 +72,66 @@ class Board:
             str: 'Hit' if a ship is hit, 'Miss' if no ship is at the location,
                  'Already Attacked' if the position was already attacked.
         """
-        row, col = coord
-        if self.grid[row][col] == 'S':
-            self.grid[row][col] = 'X'
-            self.hits.append(coord)
-            for ship in self.ships:
-                if ship.check_hit(coord):
-                    return 'Hit'
-        elif self.grid[row][col] == '-':
-            self.grid[row][col] = 'O'
-            self.misses.append(coord)
-            return 'Miss'
-        return 'Already Attacked'
+        return self.receive_attacks((coord,))[0][0]
+
+    def receive_attacks(self, coords):
+        """
+        Handle several attacks in one call, such as a salvo.
+
+        Every coordinate is checked before any is applied, so an invalid salvo leaves the
+        board untouched. The attacks are then resolved in order, so a repeated coordinate
+        within the same call is 'Already Attacked' the second time.
+
+        Args:
+            coords (list): The coordinates (row, col) of the attacks, as tuples or as rows of
+                           an (n, 2) array.
+
+        Returns:
+            tuple: A list with the result of each attack ('Hit', 'Miss' or 'Already Attacked')
+                   and a list of the ships sunk by these attacks.
+
+        Raises:
+            IndexError: If any of the coordinates are outside the board.
+        """
+        size = self.size
+        coords = [(int(row), int(col)) for row, col in coords]
+        for row, col in coords:
+            if row < 0 or row >= size or col < 0 or col >= size:
+                raise IndexError("Attack coordinates are outside the board")
+        grid = self.grid
+        results = []
+        sunk = []
+        for coord in coords:
+            row, col = coord
+            cell = grid[row][col]
+            if cell == 'S':
+                grid[row][col] = 'X'
+                self.hits.append(coord)
+                for ship in self.ships:
+                    if ship.check_hit(coord):
+                        if ship.is_sunk:
+                            sunk.append(ship)
+                        break
+                results.append('Hit')
+            elif cell == '-':
+                grid[row][col] = 'O'
+                self.misses.append(coord)
+                results.append('Miss')
+            else:
+                results.append('Already Attacked')
+        return results, sunk
+
+    def cell_state(self, coord):
+        """
+        Return the character shown for a single cell.
+
+        Args:
+            coord (tuple): The coordinates (row, col) of the cell.
+
+        Returns:
+            str: 'S' for a ship, 'X' for a hit, 'O' for a miss or '-' for untouched water.
+        """
+        return self.grid[coord[0]][coord[1]]
 
     def is_all_ships_sunk(self):
         """
@@ -0,0 +1,223 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The CanvasBoardRenderer class draws the Battleship board on a single tkinter Canvas instead of
+#              one Button per cell. Only the cells inside the visible viewport are ever drawn, the viewport
+#              can be scrolled and zoomed, and after each attack only the cells that changed are updated, so
+#              start-up and per-move cost depend on the window size rather than the board size.
+
+import tkinter as tk
+
+COLOURS = {'X': 'red', 'O': 'blue'}
+
+
+class CanvasBoardRenderer:
+    def __init__(self, parent, board, on_click, cell_size=40, min_cell_size=8, max_cell_size=80, view_cells=10):
+        """
+        Create the canvas, its scrollbars and the event bindings.
+
+        Args:
+            parent (tk.Widget): The widget to place the renderer in.
+            board (Board): The board to draw.
+            on_click (callable): Called with (row, col) when a cell is clicked.
+            cell_size (int): The initial width of a cell in pixels.
+            min_cell_size (int): The smallest cell width zooming out can reach.
+            max_cell_size (int): The largest cell width zooming in can reach.
+            view_cells (int): How many cells wide the canvas starts out, at most.
+        """
+        self.board = board
+        self.on_click = on_click
+        self.cell_size = cell_size
+        self.min_cell_size = min_cell_size
+        self.max_cell_size = max_cell_size
+        self.markers = {}  # (row, col) -> canvas item of a hit or miss marker in the viewport
+        self.view = (0, 0, 0, 0)  # First row, first col, last row, last col currently drawn
+
+        self.frame = tk.Frame(parent)
+        visible = min(board.size, view_cells) * cell_size
+        self.canvas = tk.Canvas(self.frame, width=visible, height=visible, bg='white', highlightthickness=0)
+        self.x_scroll = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.scroll_x)
+        self.y_scroll = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.scroll_y)
+        self.canvas.config(xscrollcommand=self.x_scroll.set, yscrollcommand=self.y_scroll.set)
+        self.canvas.grid(row=0, column=0, sticky='nsew')
+        self.y_scroll.grid(row=0, column=1, sticky='ns')
+        self.x_scroll.grid(row=1, column=0, sticky='ew')
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        self.canvas.bind('<Configure>', lambda event: self.redraw())
+        self.canvas.bind('<Button-1>', self.click)
+        self.canvas.bind('<MouseWheel>', self.wheel)  # Windows and macOS
+        self.canvas.bind('<Button-4>', lambda event: self.wheel(event, 120))  # X11 wheel up
+        self.canvas.bind('<Button-5>', lambda event: self.wheel(event, -120))  # X11 wheel down
+        self.update_scroll_region()
+
+    def grid(self, **options):
+        """
+        Place the renderer with the grid geometry manager.
+
+        Args:
+            **options: Passed on to tk.Frame.grid.
+        """
+        self.frame.grid(**options)
+
+    def update_scroll_region(self):
+        """
+        Size the scrollable area to the whole board at the current zoom.
+        """
+        extent = self.board.size * self.cell_size
+        self.canvas.config(scrollregion=(0, 0, extent, extent), xscrollincrement=self.cell_size,
+                           yscrollincrement=self.cell_size)
+
+    def scroll_x(self, *args):
+        """
+        Scroll horizontally from the scrollbar and redraw the newly visible cells.
+
+        Args:
+            *args: The scrollbar command arguments.
+        """
+        self.canvas.xview(*args)
+        self.redraw()
+
+    def scroll_y(self, *args):
+        """
+        Scroll vertically from the scrollbar and redraw the newly visible cells.
+
+        Args:
+            *args: The scrollbar command arguments.
+        """
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def wheel(self, event, delta=None):
+        """
+        Scroll with the mouse wheel, or zoom around the pointer when Control is held.
+
+        Args:
+            event (tk.Event): The wheel event.
+            delta (int): The wheel movement on X11, where it is not part of the event.
+        """
+        delta = delta if delta is not None else event.delta
+        if event.state & 0x4:  # Control
+            self.zoom(1.25 if delta > 0 else 0.8, event.x, event.y)
+        elif event.state & 0x1:  # Shift scrolls sideways
+            self.scroll_x('scroll', -1 if delta > 0 else 1, 'units')
+        else:
+            self.scroll_y('scroll', -1 if delta > 0 else 1, 'units')
+
+    def zoom(self, factor, x=0, y=0):
+        """
+        Change the cell size, keeping the board point under (x, y) in place.
+
+        Args:
+            factor (float): The zoom factor, above 1 to zoom in.
+            x (int): The pointer x position in window coordinates.
+            y (int): The pointer y position in window coordinates.
+        """
+        new_size = max(self.min_cell_size, min(self.max_cell_size, int(round(self.cell_size * factor))))
+        if new_size == self.cell_size:
+            return
+        # Board position under the pointer, in cells, before zooming
+        cell_x = self.canvas.canvasx(x) / self.cell_size
+        cell_y = self.canvas.canvasy(y) / self.cell_size
+        self.cell_size = new_size
+        self.update_scroll_region()
+        extent = float(self.board.size * new_size)
+        self.canvas.xview_moveto(max(0.0, (cell_x * new_size - x) / extent))
+        self.canvas.yview_moveto(max(0.0, (cell_y * new_size - y) / extent))
+        self.view = (0, 0, 0, 0)  # Force a full viewport redraw
+        self.redraw()
+
+    def visible_cells(self):
+        """
+        Work out which cells are inside the viewport.
+
+        Returns:
+            tuple: The first row, first col, last row and last col (exclusive) that are visible.
+        """
+        size = self.cell_size
+        left = int(self.canvas.canvasx(0)) // size
+        top = int(self.canvas.canvasy(0)) // size
+        right = int(self.canvas.canvasx(self.canvas.winfo_width())) // size + 1
+        bottom = int(self.canvas.canvasy(self.canvas.winfo_height())) // size + 1
+        return (max(0, top), max(0, left), min(self.board.size, bottom), min(self.board.size, right))
+
+    def redraw(self):
+        """
+        Draw the grid lines and markers of the visible cells, if the viewport has moved.
+        """
+        view = self.visible_cells()
+        if view == self.view:
+            return
+        self.view = view
+        self.canvas.delete('view')
+        self.markers = {}
+        top, left, bottom, right = view
+        size = self.cell_size
+        for row in range(top, bottom + 1):
+            self.canvas.create_line(left * size, row * size, right * size, row * size, fill='grey', tags='view')
+        for col in range(left, right + 1):
+            self.canvas.create_line(col * size, top * size, col * size, bottom * size, fill='grey', tags='view')
+        for row in range(top, bottom):
+            for col in range(left, right):
+                self.draw_cell(row, col)
+
+    def draw_cell(self, row, col):
+        """
+        Draw, replace or remove the marker of one cell.
+
+        Args:
+            row (int): The row of the cell.
+            col (int): The column of the cell.
+        """
+        state = self.board.cell_state((row, col))
+        item = self.markers.pop((row, col), None)
+        if item is not None:
+            self.canvas.delete(item)
+        if state not in COLOURS:
+            return
+        size = self.cell_size
+        pad = max(1, size // 8)
+        self.markers[(row, col)] = self.canvas.create_rectangle(
+            col * size + pad, row * size + pad, (col + 1) * size - pad, (row + 1) * size - pad,
+            fill=COLOURS[state], outline='', tags='view')
+
+    def refresh(self, coords):
+        """
+        Update the cells changed by the last turn. Cells outside the viewport are skipped and
+        drawn when they scroll into view.
+
+        Args:
+            coords (list): The coordinates (row, col) that were attacked.
+        """
+        top, left, bottom, right = self.view
+        for row, col in coords:
+            if top <= row < bottom and left <= col < right:
+                self.draw_cell(row, col)
+
+    def show(self, coord):
+        """
+        Scroll the viewport so that a cell is visible.
+
+        Args:
+            coord (tuple): The coordinates (row, col) to show.
+        """
+        top, left, bottom, right = self.view
+        row, col = coord
+        extent = float(self.board.size)
+        if not top <= row < bottom:
+            self.canvas.yview_moveto(max(0.0, (row - (bottom - top) // 2) / extent))
+        if not left <= col < right:
+            self.canvas.xview_moveto(max(0.0, (col - (right - left) // 2) / extent))
+        self.redraw()
+
+    def click(self, event):
+        """
+        Report the cell under a mouse click.
+
+        Args:
+            event (tk.Event): The click event.
+        """
+        col = int(self.canvas.canvasx(event.x)) // self.cell_size
+        row = int(self.canvas.canvasy(event.y)) // self.cell_size
+        if 0 <= row < self.board.size and 0 <= col < self.board.size:
+            self.on_click(row, col)
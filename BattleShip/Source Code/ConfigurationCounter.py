@@ -0,0 +1,268 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The ConfigurationCounter class computes exact per-cell hit probabilities for a Battleship
+#              position. It enumerates every placement of the ships still afloat that is consistent with the
+#              hits, misses and sunk ships on the Board, using a depth-first search over the precomputed
+#              placement bitmasks from FleetLayout. Results for the ships still to place are memoized by the
+#              occupied mask, and when a node or time budget runs out it falls back to importance sampling.
+
+import random
+import time
+import numpy as np
+from FleetLayout import FleetLayout
+
+
+class BudgetExceeded(Exception):
+    """Raised inside the search when the node or time budget has been used up."""
+
+
+class ConfigurationCounter:
+    def __init__(self, node_budget=2000000, time_budget=5.0, samples=20000, sample_time=1.0, max_memo=200000,
+                 rng=None):
+        """
+        Initialize the counter.
+
+        Args:
+            node_budget (int): The largest number of search nodes to visit before falling back
+                               to sampling.
+            time_budget (float): The longest time in seconds to search before falling back.
+            samples (int): How many consistent configurations to sample in the fallback.
+            sample_time (float): The longest time in seconds to spend sampling.
+            max_memo (int): The largest number of sub-fleet results to keep in the memo.
+            rng (random.Random): The random number generator used by the fallback.
+        """
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.samples = samples
+        self.sample_time = sample_time
+        self.max_memo = max_memo
+        self.rng = rng if rng is not None else random.Random()
+
+    def evaluate(self, board):
+        """
+        Compute the hit probability of every cell of a board.
+
+        Args:
+            board (Board): The board being attacked. Sunk ships must have been placed with a
+                           start and orientation, as Board and BitBoard do.
+
+        Returns:
+            dict: 'probabilities' (size x size numpy array), 'exact' (bool), 'configurations'
+                  (the number of consistent configurations, or of samples accepted when not
+                  exact),
+                  'nodes' (search nodes visited) and 'seconds'.
+        """
+        start_time = time.perf_counter()
+        self.prepare(board)
+        self.nodes = 0
+        self.deadline = start_time + self.time_budget
+        self.memo = {}
+        try:
+            count, cells = self.search(0, 0, -1)
+            exact = True
+            total = float(count)
+        except BudgetExceeded:
+            count, total, cells = self.sample()
+            exact = False
+        size = board.size
+        if count:
+            probabilities = (cells / total).reshape(size, size)
+        else:
+            probabilities = np.zeros((size, size))
+        return {
+            'probabilities': probabilities,
+            'exact': exact,
+            'configurations': count,
+            'nodes': self.nodes,
+            'seconds': time.perf_counter() - start_time,
+        }
+
+    def best_target(self, board):
+        """
+        Choose the unattacked cell most likely to hold a ship.
+
+        Args:
+            board (Board): The board being attacked.
+
+        Returns:
+            tuple: The coordinates (row, col) to attack.
+        """
+        probabilities = self.evaluate(board)['probabilities']
+        for row, col in board.hits + board.misses:
+            probabilities[row, col] = -1
+        return divmod(int(np.argmax(probabilities)), board.size)
+
+    def prepare(self, board):
+        """
+        Work out the constraints of a position and the placements each remaining ship can use.
+
+        Args:
+            board (Board): The board being attacked.
+        """
+        size = board.size
+        cells = size * size
+        blocked = 0
+        for row, col in board.misses:
+            blocked |= 1 << (row * size + col)
+        hit_mask = 0
+        for row, col in board.hits:
+            hit_mask |= 1 << (row * size + col)
+        sizes = []
+        sunk = 0
+        for ship in board.ships:
+            if ship.is_sunk:
+                row, col = ship.start
+                step = 1 if ship.orientation == 'H' else size
+                for i in range(ship.size):
+                    sunk |= 1 << (row * size + col + i * step)
+            else:
+                sizes.append(ship.size)
+        blocked |= sunk
+        self.cells = cells
+        self.need = hit_mask & ~sunk  # Hits every configuration has to cover
+        self.sizes = sorted(sizes, reverse=True)
+        generator = FleetLayout(size, self.sizes or [1])
+        self.placements = []  # Per ship: the legal placement masks
+        self.vectors = []  # Per ship: a (placements x cells) 0/1 matrix
+        for ship_size in self.sizes:
+            masks = [p[0] for p in generator.placements[ship_size] if not p[0] & blocked]
+            self.placements.append(masks)
+            matrix = np.zeros((len(masks), cells), dtype=np.int64)
+            for index, mask in enumerate(masks):
+                matrix[index] = mask_to_vector(mask, cells)
+            self.vectors.append(matrix)
+        # reach[i]: every cell some ship from i onwards could cover, for pruning
+        self.reach = [0] * (len(self.sizes) + 1)
+        for i in range(len(self.sizes) - 1, -1, -1):
+            union = 0
+            for mask in self.placements[i]:
+                union |= mask
+            self.reach[i] = self.reach[i + 1] | union
+
+    def search(self, i, occupied, previous):
+        """
+        Count the configurations of ships i onwards given the cells already occupied.
+
+        Ships of equal size are placed in increasing placement order, so each set of
+        positions is counted once rather than once per ordering of identical ships.
+
+        Args:
+            i (int): The index of the next ship to place.
+            occupied (int): The mask of cells covered by the ships already placed.
+            previous (int): The placement index of ship i - 1, or -1.
+
+        Returns:
+            tuple: The number of configurations and a numpy vector counting, per cell, the
+                   configurations that cover it (or None when there are none).
+
+        Raises:
+            BudgetExceeded: If the node or time budget runs out.
+        """
+        need = self.need & ~occupied
+        if i == len(self.sizes):
+            if need:
+                return 0, None
+            return 1, np.zeros(self.cells, dtype=np.int64)
+        if need & ~self.reach[i]:
+            return 0, None
+        first = previous + 1 if i and self.sizes[i] == self.sizes[i - 1] else 0
+        key = (i, occupied, first)
+        cached = self.memo.get(key)
+        if cached is not None:
+            return cached
+
+        self.nodes += 1
+        if self.nodes > self.node_budget or (not self.nodes & 1023 and time.perf_counter() > self.deadline):
+            raise BudgetExceeded()
+
+        placements = self.placements[i]
+        if i == len(self.sizes) - 1:
+            # Last ship: every free placement that covers the outstanding hits is one configuration
+            legal = [index for index in range(first, len(placements))
+                     if not placements[index] & occupied and not need & ~placements[index]]
+            if not legal:
+                return 0, None
+            return len(legal), self.vectors[i][legal].sum(axis=0)
+
+        total = 0
+        cells = np.zeros(self.cells, dtype=np.int64)
+        weights = np.zeros(len(placements), dtype=np.int64)
+        for index in range(first, len(placements)):
+            mask = placements[index]
+            if mask & occupied:
+                continue
+            count, sub_cells = self.search(i + 1, occupied | mask, index)
+            if count:
+                if total + count > 2 ** 62:
+                    raise BudgetExceeded()  # Too many to count exactly in 64 bits
+                total += count
+                weights[index] = count
+                cells += sub_cells
+        result = (total, cells + weights @ self.vectors[i]) if total else (0, None)
+        if len(self.memo) < self.max_memo:
+            self.memo[key] = result
+        return result
+
+    def sample(self):
+        """
+        Estimate the per-cell probabilities by sequential importance sampling.
+
+        Each remaining ship is drawn from the placements that do not overlap the ships already
+        drawn, favouring placements that cover outstanding hits, and every complete draw that
+        covers all of the hits is weighted by the inverse of its proposal probability. The
+        probabilities are the weight covering each cell divided by the total weight, a ratio
+        estimate that is biased for a finite number of samples but converges to the exact
+        probabilities as the samples grow.
+
+        Returns:
+            tuple: The number of accepted samples, their total weight and a numpy vector of the
+                   weight covering each cell.
+        """
+        cells = np.zeros(self.cells)
+        accepted = 0
+        total = 0.0
+        random_value = self.rng.random
+        deadline = time.perf_counter() + self.sample_time
+        attempts = 0
+        while accepted < self.samples and (attempts & 255 or time.perf_counter() < deadline):
+            attempts += 1
+            occupied = 0
+            weight = 1.0
+            for i, masks in enumerate(self.placements):
+                need = self.need & ~occupied
+                if need & ~self.reach[i]:
+                    break
+                legal = [mask for mask in masks if not mask & occupied]
+                if not legal:
+                    break
+                # Placements covering an outstanding hit are proposed ten times as often
+                scores = [10.0 if mask & need else 1.0 for mask in legal]
+                threshold = random_value() * sum(scores)
+                for mask, score in zip(legal, scores):
+                    threshold -= score
+                    if threshold < 0:
+                        break
+                weight *= sum(scores) / score
+                occupied |= mask
+            else:
+                if self.need & ~occupied:
+                    continue
+                accepted += 1
+                total += weight
+                cells += weight * mask_to_vector(occupied, self.cells)
+        return accepted, total, cells
+
+
+def mask_to_vector(mask, cells):
+    """
+    Convert a cell bitmask to a 0/1 numpy vector.
+
+    Args:
+        mask (int): The bitmask, bit i for cell i.
+        cells (int): The number of cells on the board.
+
+    Returns:
+        numpy.ndarray: An int64 vector with one entry per cell.
+    """
+    raw = np.frombuffer(mask.to_bytes((cells + 7) // 8, 'little'), dtype=np.uint8)
+    return np.unpackbits(raw, bitorder='little')[:cells].astype(np.int64)
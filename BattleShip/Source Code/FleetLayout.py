@@ -0,0 +1,232 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The FleetLayout class generates random fleet layouts for the Battleship game. It precomputes
+#              every legal placement of each ship size as a bitmask once, then samples complete fleets
+#              either uniformly over all legal layouts or with caller-supplied placement weights. Layouts
+#              can be applied to any Board or BitBoard, or streamed in bulk for simulations.
+
+import random
+from Ship import Ship
+
+
+class FleetLayout:
+    def __init__(self, size=10, ship_sizes=(5, 4, 3, 3, 2, 2, 2, 1, 1, 1, 1), rng=None, max_rejections=1000):
+        """
+        Initialize the generator for a board size and fleet.
+
+        Args:
+            size (int): The size of the board the layouts are for.
+            ship_sizes (list): The length of every ship in the fleet.
+            rng (random.Random): The random number generator to use. A new unseeded one is
+                                 created if none is given.
+            max_rejections (int): How many whole-fleet rejections the uniform policy tolerates
+                                  before it falls back to sequential sampling.
+
+        Raises:
+            ValueError: If a ship does not fit on the board at all, or the fleet covers more
+                        cells than the board has.
+        """
+        self.size = size
+        self.ship_sizes = sorted(ship_sizes, reverse=True)  # Largest first fails fastest
+        self.rng = rng if rng is not None else random.Random()
+        self.max_rejections = max_rejections
+        if sum(self.ship_sizes) > size * size:
+            raise ValueError("The fleet does not fit on the board")
+        if self.ship_sizes and self.ship_sizes[0] > size:
+            raise ValueError(f"A ship of size {self.ship_sizes[0]} does not fit on the board")
+        self._placements = None
+        self._columns = {}  # Ship size -> mask of a vertical ship in the top-left corner
+
+    @property
+    def placements(self):
+        """
+        Every placement of each ship size, listed on first use.
+
+        Returns:
+            dict: Ship size -> list of (mask, start, orientation) tuples.
+        """
+        if self._placements is None:
+            self._placements = {ship_size: self.compute_placements(ship_size) for ship_size in set(self.ship_sizes)}
+        return self._placements
+
+    def placement_count(self, ship_size):
+        """
+        Count the placements of a ship on an empty board without listing them.
+
+        Args:
+            ship_size (int): The length of the ship.
+
+        Returns:
+            int: The number of horizontal plus vertical placements.
+        """
+        horizontal = self.size * (self.size - ship_size + 1)
+        return horizontal * 2 if ship_size > 1 else horizontal
+
+    def placement(self, ship_size, index):
+        """
+        Decode a placement from its index, so large boards can be sampled without listing
+        every placement. Horizontal placements come first, then vertical ones.
+
+        Args:
+            ship_size (int): The length of the ship.
+            index (int): A number from 0 to placement_count(ship_size) - 1.
+
+        Returns:
+            tuple: (mask, start, orientation).
+        """
+        size = self.size
+        span = size - ship_size + 1
+        if index < size * span:
+            row, col = divmod(index, span)
+            return ((1 << ship_size) - 1) << (row * size + col), (row, col), 'H'
+        row, col = divmod(index - size * span, size)
+        column = self._columns.get(ship_size)
+        if column is None:
+            column = sum(1 << (i * size) for i in range(ship_size))
+            self._columns[ship_size] = column
+        return column << (row * size + col), (row, col), 'V'
+
+    def compute_placements(self, ship_size):
+        """
+        List every placement of a ship on an empty board.
+
+        Ships of size 1 only get horizontal placements so that each cell is listed once and
+        single-cell ships are not weighted twice as heavily as longer ones.
+
+        Args:
+            ship_size (int): The length of the ship.
+
+        Returns:
+            list: A list of (mask, start, orientation) tuples.
+        """
+        size = self.size
+        placements = []
+        run = (1 << ship_size) - 1
+        column = 0
+        for i in range(ship_size):
+            column |= 1 << (i * size)
+        for row in range(size):
+            for col in range(size):
+                cell = row * size + col
+                if col + ship_size <= size:
+                    placements.append((run << cell, (row, col), 'H'))
+                if ship_size > 1 and row + ship_size <= size:
+                    placements.append((column << cell, (row, col), 'V'))
+        return placements
+
+    def sample(self, weights=None):
+        """
+        Sample one complete fleet layout.
+
+        Without weights the layout is drawn uniformly from every legal layout: each ship is
+        drawn independently from all of its placements and the whole fleet is redrawn on the
+        first overlap. If that keeps failing (very crowded boards) the sequential sampler is
+        used instead.
+
+        Args:
+            weights (callable): Optional function weights(size, start, orientation) returning a
+                                non-negative weight for a placement. When given, each ship is
+                                drawn from the placements still legal, in proportion to weight.
+
+        Returns:
+            list: A list of (size, start, orientation) tuples, one per ship.
+        """
+        if weights is None:
+            layout = self.sample_uniform()
+            if layout is not None:
+                return layout
+        return self.sample_sequential(weights)
+
+    def sample_uniform(self):
+        """
+        Draw a layout uniformly at random by whole-fleet rejection.
+
+        Returns:
+            list: A list of (size, start, orientation) tuples, or None if max_rejections
+                  attempts all overlapped.
+        """
+        choice = self.rng.randrange
+        counts = {ship_size: self.placement_count(ship_size) for ship_size in set(self.ship_sizes)}
+        for _ in range(self.max_rejections):
+            occupied = 0
+            picks = []
+            for ship_size in self.ship_sizes:
+                placement = self.placement(ship_size, choice(counts[ship_size]))
+                if placement[0] & occupied:
+                    break
+                occupied |= placement[0]
+                picks.append(placement)
+            else:
+                return [(ship_size, p[1], p[2]) for ship_size, p in zip(self.ship_sizes, picks)]
+        return None
+
+    def sample_sequential(self, weights=None):
+        """
+        Draw a layout ship by ship from the placements that are still legal.
+
+        Each ship is drawn uniformly, or by weight, from the placements that do not overlap
+        the ships already placed. If a ship has nowhere left to go the fleet is restarted.
+
+        Args:
+            weights (callable): Optional function weights(size, start, orientation).
+
+        Returns:
+            list: A list of (size, start, orientation) tuples, one per ship.
+
+        Raises:
+            ValueError: If no layout could be found after max_rejections restarts.
+        """
+        for _ in range(self.max_rejections):
+            occupied = 0
+            layout = []
+            for ship_size in self.ship_sizes:
+                legal = [p for p in self.placements[ship_size] if not p[0] & occupied]
+                if weights is not None:
+                    scores = [weights(ship_size, p[1], p[2]) for p in legal]
+                    legal = [p for p, w in zip(legal, scores) if w > 0]
+                    scores = [w for w in scores if w > 0]
+                if not legal:
+                    break
+                if weights is None:
+                    placement = legal[self.rng.randrange(len(legal))]
+                else:
+                    placement = self.rng.choices(legal, scores)[0]
+                occupied |= placement[0]
+                layout.append((ship_size, placement[1], placement[2]))
+            else:
+                return layout
+        raise ValueError("Could not find a legal fleet layout")
+
+    def layouts(self, count=None, weights=None):
+        """
+        Yield fleet layouts in bulk, for simulations.
+
+        Args:
+            count (int): How many layouts to yield. Yields forever if None.
+            weights (callable): Optional placement weights, as for sample().
+
+        Yields:
+            list: A list of (size, start, orientation) tuples, one per ship.
+        """
+        produced = 0
+        while count is None or produced < count:
+            yield self.sample(weights)
+            produced += 1
+
+    def apply(self, board, layout):
+        """
+        Place the ships of a layout on a board.
+
+        Args:
+            board (Board): An empty Board or BitBoard of the same size as the generator.
+            layout (list): A layout as returned by sample().
+
+        Returns:
+            list: The Ship objects that were placed.
+        """
+        ships = []
+        for ship_size, start, orientation in layout:
+            ship = Ship(ship_size)
+            board.place_ship(ship, start, orientation)
+            ships.append(ship)
+        return ships
@@ -8,18 +8,26 @@
 import tkinter as tk
 from tkinter import messagebox
 from BattleshipGame import Game
+from MoveJournal import MoveJournal, JournalReader
+from CanvasRenderer import CanvasBoardRenderer
+from BitBoard import BitBoard
 import time
 
 
 class BattleshipGUI:
-    def __init__(self, root):
+    def __init__(self, root, size=10, renderer=None, salvo=False):
         """
         Initialize the BattleshipGUI with a root window and setup the game.
 
         Args:
             root (tk.Tk): The root window for the tkinter application.
+            size (int): The size of the board.
+            renderer (str): 'buttons' for one button per cell or 'canvas' for a scrollable,
+                            zoomable canvas. Defaults to buttons up to 20x20 and canvas above.
+            salvo (bool): If True, each turn fires one shot per ship still afloat.
         """
-        self.game = Game()
+        self.renderer_mode = renderer if renderer is not None else ('buttons' if size <= 20 else 'canvas')
+        self.game = Game(BitBoard(size), logger=MoveJournal("./game_log.bsj"), salvo=salvo)
         self.game.setup()
         self.root = root
         self.root.title("Battleship Game")
@@ -36,8 +44,15 @@ class BattleshipGUI:
         self.board_frame = tk.Frame(root, padx=10, pady=10)
         self.board_frame.grid(row=0, column=0, sticky='nsew')
 
-        # Setup board with larger buttons
-        self.setup_board()
+        # Setup board with larger buttons, or a canvas for large boards
+        self.renderer = None
+        if self.renderer_mode == 'canvas':
+            self.renderer = CanvasBoardRenderer(self.board_frame, self.game.board, self.on_click)
+            self.renderer.grid(row=0, column=0, sticky='nsew')
+            self.board_frame.grid_rowconfigure(0, weight=1)
+            self.board_frame.grid_columnconfigure(0, weight=1)
+        else:
+            self.setup_board()
 
         # Create a frame for controls
         self.controls_frame = tk.Frame(root, padx=10, pady=10)
@@ -46,6 +61,7 @@ class BattleshipGUI:
         # Message label for instructions
         self.message_label = tk.Label(self.controls_frame, text="Enter coordinates (row, col):", font=("Arial", 14))
         self.message_label.grid(row=0, column=0, pady=10)
+        self.update_message()
 
         # Entry widget for coordinates input with a larger font
         self.entry = tk.Entry(self.controls_frame, font=("Arial", 14), width=10)
@@ -65,12 +81,12 @@ class BattleshipGUI:
         Setup the game board with a grid of buttons.
 
         Each button represents a cell on the game board and is initially marked with a '-'.
-        The buttons are arranged in a 10x10 grid.
+        The buttons are arranged in a grid the size of the board.
         """
         self.buttons = []
-        for i in range(10):
+        for i in range(self.game.board.size):
             row = []
-            for j in range(10):
+            for j in range(self.game.board.size):
                 btn = tk.Button(self.board_frame, text='-', font=("Arial", 14), width=4, height=2,
                                 command=lambda i=i, j=j: self.on_click(i, j))
                 btn.grid(row=i, column=j, padx=5, pady=5)
@@ -81,15 +97,21 @@ class BattleshipGUI:
         """
         Handle the event when a board cell is clicked.
 
-        This method updates the entry widget with the coordinates of the clicked cell.
+        This method updates the entry widget with the coordinates of the clicked cell. In salvo
+        mode the cell is added to the coordinates already entered, up to the shots allowed.
 
         Args:
             row (int): The row index of the clicked cell.
             col (int): The column index of the clicked cell.
         """
         # Highlight the selected cell in the entry box
+        text = f"{row + 1},{col + 1}"
+        if self.game.salvo:
+            entered = [part for part in self.entry.get().split(';') if part.strip()]
+            if len(entered) < self.game.shots_allowed():
+                text = ';'.join(entered + [text])
         self.entry.delete(0, tk.END)
-        self.entry.insert(0, f"{row + 1},{col + 1}")
+        self.entry.insert(0, text)
 
     def attack(self):
         """
@@ -99,35 +121,59 @@ class BattleshipGUI:
         It also handles invalid inputs and displays appropriate messages.
         """
         try:
-            coord = tuple(map(lambda x: int(x) - 1, self.entry.get().split(',')))
-            if not (0 <= coord[0] < 10 and 0 <= coord[1] < 10):
+            coords = []
+            for part in self.entry.get().split(';'):
+                coord = tuple(map(lambda x: int(x) - 1, part.split(',')))
+                size = self.game.board.size
+                if len(coord) != 2 or not (0 <= coord[0] < size and 0 <= coord[1] < size):
+                    raise ValueError
+                coords.append(coord)
+            if self.game.salvo:
+                results, _ = self.game.play_salvo(coords)
+            elif len(coords) == 1:
+                results = [self.game.play_turn(coords[0])]
+            else:
                 raise ValueError
-            result = self.game.play_turn(coord)
-            self.update_board()
-            if result == 'Hit':
-                self.buttons[coord[0]][coord[1]].config(text='X', bg='red')
-            elif result == 'Miss':
-                self.buttons[coord[0]][coord[1]].config(text='O', bg='blue')
-            elif result == 'Already Attacked':
+            self.update_board(coords)
+            self.entry.delete(0, tk.END)
+            self.update_message()
+            if 'Already Attacked' in results:
                 messagebox.showinfo("Invalid Move", "This position has already been attacked.")
             if self.game.is_game_over():
                 self.handle_end_of_game()
         except (ValueError, IndexError):
             messagebox.showinfo("Invalid Input", "Please enter valid coordinates in the format 'row,col'.")
 
-    def update_board(self):
+    def update_message(self):
+        """
+        Show how many shots the player may fire this turn in salvo mode.
+        """
+        if self.game.salvo:
+            self.message_label.config(
+                text=f"Enter up to {self.game.shots_allowed()} coordinates (row,col; row,col):")
+
+    def update_board(self, coords=None):
         """
         Update the visual representation of the game board.
 
         This method refreshes the board display to show hits (marked as 'X' in red)
         and misses (marked as 'O' in blue) based on the game's current state.
+
+        Args:
+            coords (list): The cells changed by the last turn. Every cell is refreshed if None.
         """
-        for row in range(10):
-            for col in range(10):
-                if self.game.board.grid[row][col] == 'X':
-                    self.buttons[row][col].config(text='X', bg='red')
-                elif self.game.board.grid[row][col] == 'O':
-                    self.buttons[row][col].config(text='O', bg='blue')
+        board = self.game.board
+        if coords is None:
+            coords = [(row, col) for row in range(board.size) for col in range(board.size)]
+        if self.renderer is not None:
+            self.renderer.refresh(coords)
+            return
+        for row, col in coords:
+            state = board.cell_state((row, col))
+            if state == 'X':
+                self.buttons[row][col].config(text='X', bg='red')
+            elif state == 'O':
+                self.buttons[row][col].config(text='O', bg='blue')
 
     def update_timer(self):
         """
@@ -138,6 +184,7 @@ class BattleshipGUI:
         elapsed_time = time.time() - self.start_time
         minutes, seconds = divmod(int(elapsed_time), 60)
         self.timer_label.config(text=f"Time: {minutes}:{seconds:02}")
+        self.game.logger.maybe_flush()  # Write out buffered moves on the journal's timer
         self.root.after(1000, self.update_timer)
 
     def handle_end_of_game(self):
@@ -153,4 +200,9 @@ class BattleshipGUI:
         messagebox.showinfo("Game Over", f"All ships have been sunk!\nTime taken: {game_duration}")
         self.game.logger.log_move(self.game.board, None, "Game Over")
         self.game.logger.log_entry(f"Game duration: {game_duration}")
+        self.game.logger.flush()
+        # Keep the readable text log alongside the binary journal; it holds a full grid per
+        # move, so it is only written for boards small enough to read
+        if self.game.board.size <= 20:
+            JournalReader(self.game.logger.file_path).export_text("./game_log.txt")
         self.root.quit()
@@ -0,0 +1,477 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The MatchServer class hosts two-player Battleship matches over TCP with asyncio. Players are
+#              paired in the order they connect, each gets a BitBoard with a fleet from FleetLayout, and they
+#              take turns firing at each other's board. Every match is a small __slots__ object, turn timeouts
+#              are scheduled on the event loop, and nothing touches the disk. The module also contains a
+#              load generator that plays many matches against a server on localhost.
+#
+#              Protocol, one line of ASCII per message:
+#                client -> server: FIRE <row> <col> | QUIT
+#                server -> client: WAIT | START <size> <1 if you move first else 0>
+#                                  RESULT <row> <col> <HIT|MISS|SUNK|REPEAT>  (your shot)
+#                                  INCOMING <row> <col> <HIT|MISS|SUNK>       (opponent's shot)
+#                                  TIMEOUT | WIN | LOSE | ERROR <message>
+#              A shot at a cell already attacked answers REPEAT and the shooter keeps the turn. A peer that
+#              sends more than MAX_LINE bytes without a newline is disconnected.
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+
+from BattleshipGame import Game
+from BitBoard import BitBoard
+from FleetLayout import FleetLayout
+
+RESULT_CODES = {'Hit': b'HIT', 'Miss': b'MISS', 'Already Attacked': b'REPEAT'}
+MAX_LINE = 4096  # Longest unterminated line kept in a connection's buffer
+
+
+class Match:
+    __slots__ = ('players', 'boards', 'turn', 'timer', 'moves', 'over')
+
+    def __init__(self, players, boards):
+        """
+        Initialize a match between two connected players.
+
+        Args:
+            players (list): The two PlayerConnection objects; the first one moves first.
+            boards (list): The two players' own boards, with their fleets placed.
+        """
+        self.players = players
+        self.boards = boards
+        self.turn = 0  # Index of the player whose turn it is
+        self.timer = None  # Pending turn-timeout handle
+        self.moves = 0
+        self.over = False
+
+
+class PlayerConnection(asyncio.Protocol):
+    __slots__ = ('server', 'transport', 'match', 'index', 'buffer')
+
+    def __init__(self, server):
+        """
+        Initialize the connection of one player.
+
+        Args:
+            server (MatchServer): The server that accepted the connection.
+        """
+        self.server = server
+        self.transport = None
+        self.match = None
+        self.index = 0
+        self.buffer = b''
+
+    def connection_made(self, transport):
+        """
+        Queue the player for a match.
+
+        Args:
+            transport (asyncio.Transport): The connection transport.
+        """
+        self.transport = transport
+        self.server.join(self)
+
+    def data_received(self, data):
+        """
+        Split incoming data into lines and handle each command. The connection is closed if a
+        line grows past MAX_LINE bytes.
+
+        Args:
+            data (bytes): The bytes received.
+        """
+        self.buffer += data
+        while b'\n' in self.buffer:
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            self.server.handle(self, line.split())
+        if len(self.buffer) > MAX_LINE:
+            self.buffer = b''
+            self.send(b'ERROR line too long')
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        """
+        Forfeit the player's match, or remove them from the queue.
+
+        Args:
+            exc (Exception): The error that closed the connection, or None.
+        """
+        self.server.leave(self)
+
+    def send(self, message):
+        """
+        Send one line to the player.
+
+        Args:
+            message (bytes): The line, without the newline.
+        """
+        if not self.transport.is_closing():
+            self.transport.write(message + b'\n')
+
+
+class MatchServer:
+    def __init__(self, host='127.0.0.1', port=8765, size=10, ship_sizes=None, turn_timeout=30.0, seed=None):
+        """
+        Initialize the server.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on.
+            size (int): The size of every board.
+            ship_sizes (list): The fleet of each player. Defaults to Game.ship_sizes.
+            turn_timeout (float): Seconds a player has to fire before forfeiting the match.
+            seed (int): The seed for fleet layouts.
+        """
+        self.host = host
+        self.port = port
+        self.size = size
+        self.turn_timeout = turn_timeout
+        self.layouts = FleetLayout(size, ship_sizes if ship_sizes is not None else Game.ship_sizes,
+                                   rng=random.Random(seed))
+        self.waiting = None  # A player waiting for an opponent
+        self.matches = 0  # Matches currently in progress
+        self.moves = 0  # Shots resolved since the server started
+        self.server = None
+
+    async def start(self):
+        """
+        Start listening for players.
+        """
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(lambda: PlayerConnection(self), self.host, self.port)
+
+    async def serve_forever(self):
+        """
+        Start the server and run until cancelled.
+        """
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def new_board(self):
+        """
+        Create a board with a random fleet.
+
+        Returns:
+            BitBoard: The board.
+        """
+        board = BitBoard(self.size)
+        self.layouts.apply(board, self.layouts.sample())
+        return board
+
+    def join(self, player):
+        """
+        Pair a new player with the one waiting, or make them wait.
+
+        Args:
+            player (PlayerConnection): The player who connected.
+        """
+        if self.waiting is None:
+            self.waiting = player
+            player.send(b'WAIT')
+            return
+        first, self.waiting = self.waiting, None
+        match = Match([first, player], [self.new_board(), self.new_board()])
+        for index, each in enumerate(match.players):
+            each.match = match
+            each.index = index
+        self.matches += 1
+        size = str(self.size).encode()
+        first.send(b'START ' + size + b' 1')
+        player.send(b'START ' + size + b' 0')
+        self.schedule_timeout(match)
+
+    def leave(self, player):
+        """
+        Handle a player disconnecting.
+
+        Args:
+            player (PlayerConnection): The player who left.
+        """
+        if self.waiting is player:
+            self.waiting = None
+        match = player.match
+        if match is not None and not match.over:
+            self.finish(match, 1 - player.index)
+
+    def handle(self, player, words):
+        """
+        Handle one command from a player.
+
+        Args:
+            player (PlayerConnection): The player who sent the command.
+            words (list): The command split into words.
+        """
+        match = player.match
+        if not words:
+            return
+        if words[0] == b'QUIT':
+            player.transport.close()
+            return
+        if words[0] != b'FIRE' or len(words) != 3:
+            player.send(b'ERROR unknown command')
+            return
+        if match is None or match.over:
+            player.send(b'ERROR no match in progress')
+            return
+        if match.turn != player.index:
+            player.send(b'ERROR not your turn')
+            return
+        try:
+            row, col = int(words[1]), int(words[2])
+            target = match.boards[1 - player.index]
+            result = target.receive_attack((row, col))
+        except (ValueError, IndexError):
+            player.send(b'ERROR invalid coordinates')
+            return
+        code = RESULT_CODES[result]
+        if result == 'Already Attacked':
+            player.send(b'RESULT ' + words[1] + b' ' + words[2] + b' ' + code)
+            return
+        if result == 'Hit' and target.ships[target.cell_ship[row * target.size + col]].is_sunk:
+            code = b'SUNK'
+        self.moves += 1
+        match.moves += 1
+        player.send(b'RESULT ' + words[1] + b' ' + words[2] + b' ' + code)
+        match.players[1 - player.index].send(b'INCOMING ' + words[1] + b' ' + words[2] + b' ' + code)
+        if code == b'SUNK' and target.is_all_ships_sunk():
+            self.finish(match, player.index)
+            return
+        match.turn = 1 - match.turn
+        self.schedule_timeout(match)
+
+    def schedule_timeout(self, match):
+        """
+        (Re)start the turn timer of a match.
+
+        Args:
+            match (Match): The match whose turn has just started.
+        """
+        if match.timer is not None:
+            match.timer.cancel()
+        match.timer = asyncio.get_running_loop().call_later(self.turn_timeout, self.timeout, match)
+
+    def timeout(self, match):
+        """
+        End a match because the player to move ran out of time.
+
+        Args:
+            match (Match): The match that timed out.
+        """
+        match.timer = None
+        if match.over:
+            return
+        for player in match.players:
+            player.send(b'TIMEOUT')
+        self.finish(match, 1 - match.turn)
+
+    def finish(self, match, winner):
+        """
+        End a match, tell both players the result and close their connections.
+
+        Args:
+            match (Match): The match that ended.
+            winner (int): The index of the winning player.
+        """
+        match.over = True
+        if match.timer is not None:
+            match.timer.cancel()
+            match.timer = None
+        self.matches -= 1
+        for index, player in enumerate(match.players):
+            player.send(b'WIN' if index == winner else b'LOSE')
+            player.match = None
+            player.transport.close()
+
+
+class LoadClient(asyncio.Protocol):
+    def __init__(self, done, rng):
+        """
+        Initialize a client that plays one match by firing at random cells.
+
+        Args:
+            done (asyncio.Future): Resolved with the number of shots fired when the match ends.
+            rng (random.Random): The random number generator for choosing targets.
+        """
+        self.done = done
+        self.rng = rng
+        self.transport = None
+        self.buffer = b''
+        self.targets = []
+        self.shots = 0
+        self.sent_at = 0.0
+        self.latencies = []
+
+    def connection_made(self, transport):
+        """
+        Keep the transport for sending shots.
+
+        Args:
+            transport (asyncio.Transport): The connection transport.
+        """
+        self.transport = transport
+
+    def data_received(self, data):
+        """
+        Split incoming data into lines and handle each message. The connection is closed if a
+        line grows past MAX_LINE bytes.
+
+        Args:
+            data (bytes): The bytes received.
+        """
+        self.buffer += data
+        while b'\n' in self.buffer:
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            self.handle(line.split())
+        if len(self.buffer) > MAX_LINE:
+            self.buffer = b''
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        """
+        Report the match as finished.
+
+        Args:
+            exc (Exception): The error that closed the connection, or None.
+        """
+        if not self.done.done():
+            self.done.set_result((self.shots, self.latencies))
+
+    def handle(self, words):
+        """
+        React to one server message.
+
+        Args:
+            words (list): The message split into words.
+        """
+        kind = words[0]
+        if kind == b'START':
+            size = int(words[1])
+            self.targets = [(row, col) for row in range(size) for col in range(size)]
+            self.rng.shuffle(self.targets)
+            if words[2] == b'1':
+                self.fire()
+        elif kind == b'RESULT':
+            self.latencies.append(time.perf_counter() - self.sent_at)
+            if words[3] == b'REPEAT':
+                self.fire()
+        elif kind == b'INCOMING':
+            self.fire()
+
+    def fire(self):
+        """
+        Fire at the next target cell.
+        """
+        if self.targets:
+            row, col = self.targets.pop()
+            self.shots += 1
+            self.sent_at = time.perf_counter()
+            self.transport.write(b'FIRE %d %d\n' % (row, col))
+
+
+async def play_match(host, port, rng):
+    """
+    Connect two load clients and wait for their match to finish.
+
+    Args:
+        host (str): The server address.
+        port (int): The server port.
+        rng (random.Random): The random number generator for the clients.
+
+    Returns:
+        tuple: The total number of shots and the list of shot latencies in seconds.
+    """
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future(), loop.create_future()]
+    for future in futures:
+        await loop.create_connection(lambda future=future: LoadClient(future, rng), host, port)
+    results = await asyncio.gather(*futures)
+    return sum(shots for shots, _ in results), [latency for _, latencies in results for latency in latencies]
+
+
+async def load_test(host, port, concurrency=100, seconds=10.0, seed=None):
+    """
+    Keep a number of matches running against a server and measure its throughput.
+
+    Args:
+        host (str): The server address.
+        port (int): The server port.
+        concurrency (int): The number of matches kept in progress at once.
+        seconds (float): How long to generate load for.
+        seed (int): The seed for the clients' shots.
+
+    Returns:
+        dict: 'matches', 'moves', 'seconds', 'moves_per_sec' and latency percentiles in
+              milliseconds ('p50_ms', 'p99_ms').
+    """
+    rng = random.Random(seed)
+    deadline = time.perf_counter() + seconds
+    totals = {'matches': 0, 'moves': 0}
+    latencies = []
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            shots, match_latencies = await play_match(host, port, rng)
+            totals['matches'] += 1
+            totals['moves'] += shots
+            latencies.extend(match_latencies)
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start_time
+    latencies.sort()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        'matches': totals['matches'],
+        'moves': totals['moves'],
+        'seconds': elapsed,
+        'moves_per_sec': totals['moves'] / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99),
+    }
+
+
+def run_server(host, port, turn_timeout):
+    """
+    Run a server until the process is terminated. Used as a separate process by the load test.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        turn_timeout (float): Seconds a player has to fire.
+    """
+    asyncio.run(MatchServer(host, port, turn_timeout=turn_timeout).serve_forever())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Battleship match server and load generator.")
+    parser.add_argument("mode", choices=["serve", "loadtest"], help="run the server or generate load")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--turn-timeout", type=float, default=30.0, help="seconds allowed per turn")
+    parser.add_argument("--concurrency", type=int, default=100, help="matches in progress during the load test")
+    parser.add_argument("--seconds", type=float, default=10.0, help="load test duration")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="start a server in a separate process for the load test")
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(MatchServer(args.host, args.port, turn_timeout=args.turn_timeout).serve_forever())
+    else:
+        server_process = None
+        if args.spawn_server:
+            server_process = multiprocessing.Process(target=run_server,
+                                                     args=(args.host, args.port, args.turn_timeout), daemon=True)
+            server_process.start()
+            time.sleep(0.5)
+        report = asyncio.run(load_test(args.host, args.port, args.concurrency, args.seconds))
+        print(f"Matches: {report['matches']}, moves: {report['moves']} in {report['seconds']:.2f}s "
+              f"({report['moves_per_sec']:.0f} moves/sec)")
+        print(f"Shot latency: p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms")
+        if server_process is not None:
+            server_process.terminate()
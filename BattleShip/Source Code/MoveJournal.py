@@ -0,0 +1,239 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The MoveJournal class is a compact binary replacement for the text Logger. It records the
+#              initial fleet layout once, then a fixed-width record per move, with a keyframe of the hit and
+#              miss bitmasks every few moves. Records are buffered in memory and written out when the buffer
+#              fills, when a timer expires or when the game ends. The JournalReader class reads a journal
+#              back, rebuilds the board at any move from the nearest keyframe, and can export the same text
+#              log that Logger writes.
+
+import bisect
+import struct
+import time
+from BitBoard import BitBoard
+from Ship import Ship
+
+MAGIC = b'BSJ1'
+HEADER = struct.Struct('<4sHHH')  # Magic, board size, keyframe interval, ship count
+SHIP = struct.Struct('<HHHc')  # Size, row, col, orientation
+MOVE = struct.Struct('<cHHB')  # b'M', row, col, result code
+KEYFRAME = struct.Struct('<cI')  # b'K', number of moves applied, followed by the hit and miss masks
+TEXT = struct.Struct('<cH')  # b'T', length, followed by UTF-8 text
+
+RESULTS = ['Miss', 'Hit', 'Already Attacked', 'Game Over']
+NO_COORD = 0xFFFF  # Row and column stored for moves without coordinates, such as 'Game Over'
+
+
+class MoveJournal:
+    def __init__(self, file_path, keyframe_interval=16, flush_interval=5.0, buffer_size=65536):
+        """
+        Initialize the journal. Nothing is written until the first move is logged.
+
+        Args:
+            file_path (str): The path of the journal file. It is overwritten by a new game.
+            keyframe_interval (int): The number of moves between board keyframes.
+            flush_interval (float): The longest time in seconds records stay in memory.
+            buffer_size (int): The number of buffered bytes that triggers a write.
+        """
+        self.file_path = file_path
+        self.keyframe_interval = keyframe_interval
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.started = False
+        self.moves = 0
+        self.size = 0
+        self.hit_mask = 0  # Hits and misses so far, tracked from the logged moves for keyframes
+        self.miss_mask = 0
+        self.last_flush = time.monotonic()
+
+    def start(self, board):
+        """
+        Start a new journal with the fleet layout of a board, truncating the file. Text entries
+        logged before the journal was started are kept and follow the fleet layout.
+
+        Args:
+            board (Board): The board with its ships placed.
+        """
+        with open(self.file_path, 'wb'):
+            pass
+        pending = self.buffer if not self.started else b''  # Only text records, held until the layout is known
+        self.buffer = bytearray(HEADER.pack(MAGIC, board.size, self.keyframe_interval, len(board.ships)))
+        for ship in board.ships:
+            row, col = ship.start
+            self.buffer += SHIP.pack(ship.size, row, col, ship.orientation.encode())
+        self.buffer += pending
+        self.started = True
+        self.moves = 0
+        self.size = board.size
+        self.hit_mask = 0
+        self.miss_mask = 0
+
+    def log_move(self, board, coord, result):
+        """
+        Record a move, and a keyframe of the board every keyframe_interval moves.
+
+        Keyframes are built from the moves logged so far rather than read from the board,
+        so they stay correct when several shots are resolved before they are logged.
+
+        Args:
+            board (Board): The game board, used for the fleet layout of a new journal.
+            coord (tuple): The coordinates (row, col) of the move, or None.
+            result (str): The result of the move, which can be 'Hit', 'Miss', 'Already Attacked'
+                          or 'Game Over'.
+        """
+        if not self.started:
+            self.start(board)
+        row, col = coord if coord is not None else (NO_COORD, NO_COORD)
+        self.buffer += MOVE.pack(b'M', row, col, RESULTS.index(result))
+        if coord is not None:
+            self.moves += 1
+            if result == 'Hit':
+                self.hit_mask |= 1 << (row * self.size + col)
+            elif result == 'Miss':
+                self.miss_mask |= 1 << (row * self.size + col)
+            if self.moves % self.keyframe_interval == 0:
+                length = mask_length(self.size)
+                self.buffer += KEYFRAME.pack(b'K', self.moves)
+                self.buffer += self.hit_mask.to_bytes(length, 'little') + self.miss_mask.to_bytes(length, 'little')
+        self.maybe_flush()
+
+    def log_entry(self, entry):
+        """
+        Record a general text entry, such as the game duration. An entry logged before the
+        first move is held in memory until the journal starts.
+
+        Args:
+            entry (str): The entry to be logged.
+        """
+        data = entry.encode('utf-8')[:0xFFFF]
+        self.buffer += TEXT.pack(b'T', len(data)) + data
+        self.maybe_flush()
+
+    def maybe_flush(self):
+        """
+        Write the buffer out if it is full or has been held longer than flush_interval.
+        """
+        if len(self.buffer) >= self.buffer_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """
+        Append the buffered records to the journal file.
+        """
+        if self.buffer and self.started:
+            with open(self.file_path, 'ab') as file:
+                file.write(self.buffer)
+            self.buffer = bytearray()
+        self.last_flush = time.monotonic()
+
+
+class JournalReader:
+    def __init__(self, file_path):
+        """
+        Read a journal file.
+
+        Args:
+            file_path (str): The path of the journal file.
+
+        Raises:
+            ValueError: If the file is not a move journal.
+        """
+        with open(file_path, 'rb') as file:
+            data = file.read()
+        magic, self.size, self.keyframe_interval, ship_count = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a Battleship move journal")
+        offset = HEADER.size
+        self.layout = []  # (size, start, orientation) per ship
+        for _ in range(ship_count):
+            ship_size, row, col, orientation = SHIP.unpack_from(data, offset)
+            self.layout.append((ship_size, (row, col), orientation.decode()))
+            offset += SHIP.size
+        self.records = []  # ('move', coord, result) or ('text', entry), in file order
+        self.moves = []  # (coord, result) for every move with coordinates
+        self.keyframes = [0]  # Move counts that have a keyframe
+        self.keyframe_masks = [(0, 0)]
+        length = mask_length(self.size)
+        while offset < len(data):
+            kind = data[offset:offset + 1]
+            if kind == b'M':
+                _, row, col, code = MOVE.unpack_from(data, offset)
+                offset += MOVE.size
+                coord = (row, col) if row != NO_COORD else None
+                self.records.append(('move', coord, RESULTS[code]))
+                if coord is not None:
+                    self.moves.append((coord, RESULTS[code]))
+            elif kind == b'K':
+                _, moves = KEYFRAME.unpack_from(data, offset)
+                offset += KEYFRAME.size
+                hit_mask = int.from_bytes(data[offset:offset + length], 'little')
+                miss_mask = int.from_bytes(data[offset + length:offset + 2 * length], 'little')
+                offset += 2 * length
+                self.keyframes.append(moves)
+                self.keyframe_masks.append((hit_mask, miss_mask))
+            elif kind == b'T':
+                _, size = TEXT.unpack_from(data, offset)
+                offset += TEXT.size
+                self.records.append(('text', data[offset:offset + size].decode('utf-8')))
+                offset += size
+            else:
+                raise ValueError(f"Corrupt journal record at byte {offset}")
+
+    def board_at(self, index):
+        """
+        Rebuild the board as it was after a number of moves.
+
+        The board is restored from the nearest keyframe at or before the move and only the
+        moves after it are replayed.
+
+        Args:
+            index (int): The number of moves to apply, from 0 to len(self.moves).
+
+        Returns:
+            BitBoard: The board after the first index moves.
+        """
+        index = max(0, min(index, len(self.moves)))
+        board = BitBoard(self.size)
+        for ship_size, start, orientation in self.layout:
+            board.place_ship(Ship(ship_size), start, orientation)
+        position = bisect.bisect_right(self.keyframes, index) - 1
+        board.restore(*self.keyframe_masks[position])
+        for coord, _ in self.moves[self.keyframes[position]:index]:
+            board.receive_attack(coord)
+        return board
+
+    def export_text(self, file_path):
+        """
+        Write the journal as the text log that GLogger.Logger produces.
+
+        Args:
+            file_path (str): The path of the text file to append to.
+        """
+        board = self.board_at(0)
+        with open(file_path, 'a') as file:
+            for record in self.records:
+                if record[0] == 'text':
+                    file.write(f"{record[1]}\n")
+                    continue
+                _, coord, result = record
+                if coord is not None:
+                    board.receive_attack(coord)
+                file.write(f"Move: {coord}, Result: {result}\n")
+                for row in board.grid:
+                    file.write(" ".join(row) + "\n")
+                file.write("\n")
+
+
+def mask_length(size):
+    """
+    Return the number of bytes a board bitmask takes in a keyframe.
+
+    Args:
+        size (int): The size of the board.
+
+    Returns:
+        int: The number of bytes.
+    """
+    return (size * size + 7) // 8
+
@@ -25,8 +25,22 @@ class Player:
         Returns:
             str: The result of the attack, which can be 'Hit', 'Miss', or 'Already Attacked'.
         """
-        # Validate the move and update the board
-        result = board.receive_attack(coord)
-        self.moves.append(coord)
-        return result
+        return self.make_moves(board, (coord,))[0][0]
 
+    def make_moves(self, board, coords):
+        """
+        Make several moves at once by attacking a list of coordinates, such as a salvo.
+
+        Args:
+            board (Board): The game board where the moves will be made.
+            coords (list): The coordinates (row, col) to attack, as tuples or as rows of an
+                           (n, 2) array.
+
+        Returns:
+            tuple: A list with the result of each attack and a list of the ships it sank.
+        """
+        coords = [(int(row), int(col)) for row, col in coords]
+        # Validate the moves and update the board
+        results, sunk = board.receive_attacks(coords)
+        self.moves.extend(coords)
+        return results, sunk
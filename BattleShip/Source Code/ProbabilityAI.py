@@ -0,0 +1,161 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The ProbabilityPlayer class is a computer player for the Battleship game. Before each shot it
+#              counts, for every cell, how many legal placements of the ships still afloat would cover it,
+#              given the hits and misses recorded on the Board, and fires at the densest cell. The counts are
+#              computed with NumPy sliding-window sums over the whole board, with no per-cell Python loops.
+
+import random
+import numpy as np
+from Player import Player
+
+
+class ProbabilityPlayer(Player):
+    def __init__(self, name="Computer", hit_weight=50, rng=None):
+        """
+        Initialize the player.
+
+        Args:
+            name (str): The name of the player.
+            hit_weight (int): How much more a placement counts for every unresolved hit it
+                              covers. Large values make the player finish off a damaged ship
+                              before hunting elsewhere.
+            rng (random.Random): The random number generator used to break ties.
+        """
+        super().__init__(name)
+        self.hit_weight = hit_weight
+        self.rng = rng if rng is not None else random.Random()
+
+    def make_move(self, board, coord=None):
+        """
+        Attack the board, choosing the target cell if none is given.
+
+        Args:
+            board (Board): The game board where the move will be made.
+            coord (tuple): The coordinates (row, col) to attack, or None to pick the densest cell.
+
+        Returns:
+            str: The result of the attack, which can be 'Hit', 'Miss', or 'Already Attacked'.
+        """
+        if coord is None:
+            coord = self.choose_target(board)
+        return super().make_move(board, coord)
+
+    def choose_target(self, board):
+        """
+        Choose the unattacked cell covered by the most legal ship placements.
+
+        Args:
+            board (Board): The board being attacked.
+
+        Returns:
+            tuple: The coordinates (row, col) to attack.
+        """
+        heat = self.heatmap(board)
+        best = np.flatnonzero(heat == heat.max())
+        cell = int(best[self.rng.randrange(len(best))])
+        return divmod(cell, board.size)
+
+    def heatmap(self, board):
+        """
+        Compute the placement density of every cell.
+
+        Misses and the cells of sunk ships block placements. Each legal placement of each
+        ship still afloat adds its weight to the cells it covers, where the weight grows by a
+        factor of hit_weight for every hit not yet explained by a sunk ship that it covers.
+        Cells that have already been attacked score -1.
+
+        Args:
+            board (Board): The board being attacked.
+
+        Returns:
+            numpy.ndarray: A size x size array of densities.
+        """
+        size = board.size
+        blocked = np.zeros((size, size), dtype=np.int32)
+        hits = np.zeros((size, size), dtype=np.int32)
+        if board.misses:
+            misses = np.array(board.misses)
+            blocked[misses[:, 0], misses[:, 1]] = 1
+        if board.hits:
+            hit_cells = np.array(board.hits)
+            hits[hit_cells[:, 0], hit_cells[:, 1]] = 1
+        attacked = (blocked + hits) > 0
+
+        afloat = {}
+        for ship in board.ships:
+            if ship.is_sunk:
+                rows, cols = self.ship_cells(ship)
+                blocked[rows, cols] = 1
+                hits[rows, cols] = 0
+            else:
+                afloat[ship.size] = afloat.get(ship.size, 0) + 1
+
+        # Stack the board with its transpose so one pass covers both orientations
+        blocked_both = np.stack((blocked, blocked.T))
+        hits_both = np.stack((hits, hits.T))
+        heat = np.zeros((2, size, size), dtype=np.float64)
+        for ship_size, count in afloat.items():
+            if ship_size > size:
+                continue
+            if ship_size == 1:
+                heat[0] += count * self.coverage(blocked_both[:1], hits_both[:1], 1)[0]
+            else:
+                heat += count * self.coverage(blocked_both, hits_both, ship_size)
+        heat = heat[0] + heat[1].T
+        heat[attacked] = -1
+        return heat
+
+    def coverage(self, blocked, hits, ship_size):
+        """
+        Sum the weights of every horizontal placement of one ship over the cells it covers.
+
+        Args:
+            blocked (numpy.ndarray): A stack of boards, 1 where a ship cannot be.
+            hits (numpy.ndarray): A stack of boards, 1 for every unresolved hit.
+            ship_size (int): The length of the ship.
+
+        Returns:
+            numpy.ndarray: An array the shape of the stack with the summed weights.
+        """
+        blocked_in_window = window_sums(blocked, ship_size)
+        hits_in_window = window_sums(hits, ship_size)
+        weights = np.power(float(self.hit_weight), hits_in_window)
+        weights[blocked_in_window > 0] = 0.0
+        # Spread the weight of each start over the ship_size cells to its right
+        padded = np.zeros(weights.shape[:-1] + (weights.shape[-1] + 2 * (ship_size - 1),))
+        padded[..., ship_size - 1:padded.shape[-1] - ship_size + 1] = weights
+        return window_sums(padded, ship_size)
+
+    @staticmethod
+    def ship_cells(ship):
+        """
+        Return the cells a placed ship covers, whether or not they have been hit.
+
+        Args:
+            ship (Ship): A placed ship.
+
+        Returns:
+            tuple: Two lists, the rows and the columns of the ship's cells.
+        """
+        row, col = ship.start
+        offsets = list(range(ship.size))
+        if ship.orientation == 'H':
+            return [row] * ship.size, [col + i for i in offsets]
+        return [row + i for i in offsets], [col] * ship.size
+
+
+def window_sums(values, width):
+    """
+    Sum every window of a given width along the last axis.
+
+    Args:
+        values (numpy.ndarray): An array of boards.
+        width (int): The window width.
+
+    Returns:
+        numpy.ndarray: An array with one entry per window start along the last axis.
+    """
+    totals = np.zeros(values.shape[:-1] + (values.shape[-1] + 1,), dtype=values.dtype)
+    np.cumsum(values, axis=-1, out=totals[..., 1:])
+    return totals[..., width:] - totals[..., :-width]
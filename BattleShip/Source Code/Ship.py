@@ -9,6 +9,8 @@ class Ship:
         self.size = size
         self.positions = []  # List of tuples (row, col)
         self.is_sunk = False
+        self.start = None  # Starting coordinate (row, col) once placed
+        self.orientation = None  # 'H' or 'V' once placed
 
     def place(self, start, orientation):
         """
@@ -19,6 +21,8 @@ class Ship:
             orientation (str): 'H' for horizontal or 'V' for vertical orientation.
 
         """
+        self.start = start
+        self.orientation = orientation
         row, col = start
         if orientation == 'H':  # Horizontal
             self.positions = [(row, col + i) for i in range(self.size)]
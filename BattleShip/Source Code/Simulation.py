@@ -0,0 +1,186 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: The SimulationRunner class plays complete Battleship games without the GUI, using one of
+#              the attacker strategies from Attackers.py against fleets from FleetLayout on a BitBoard.
+#              Games are split into batches and spread over a process pool, each batch with its own seed,
+#              and the runner reports games per second, mean shots to win and the shot distribution.
+#              Nothing is written to disk unless a log path is given.
+
+import argparse
+import multiprocessing
+import random
+import time
+from collections import Counter
+
+from Attackers import ATTACKERS
+from BattleshipGame import Game
+from BitBoard import BitBoard
+from FleetLayout import FleetLayout
+from GLogger import Logger
+
+
+def play_game(attacker, board):
+    """
+    Play one game to completion.
+
+    Args:
+        attacker: An attacker with choose() and observe() methods.
+        board (BitBoard): A board with the fleet already placed.
+
+    Returns:
+        int: The number of shots fired to sink every ship.
+    """
+    shots = 0
+    size = board.size
+    while not board.is_all_ships_sunk():
+        coord = attacker.choose()
+        result = board.receive_attack(coord)
+        shots += 1
+        sunk = False
+        if result == 'Hit':
+            sunk = board.ships[board.cell_ship[coord[0] * size + coord[1]]].is_sunk
+        attacker.observe(coord, result, sunk)
+    return shots
+
+
+def run_batch(task):
+    """
+    Play a batch of games in a worker process.
+
+    Args:
+        task (tuple): (attacker name, board size, ship sizes, seed, number of games).
+
+    Returns:
+        Counter: How many games finished after each number of shots.
+    """
+    attacker_name, size, ship_sizes, seed, games = task
+    rng = random.Random(seed)
+    attacker_class = ATTACKERS[attacker_name]
+    generator = FleetLayout(size, ship_sizes, rng=rng)
+    distribution = Counter()
+    for layout in generator.layouts(games):
+        board = BitBoard(size)
+        generator.apply(board, layout)
+        distribution[play_game(attacker_class(size, rng), board)] += 1
+    return distribution
+
+
+class SimulationRunner:
+    def __init__(self, attacker='hunt_target', size=10, ship_sizes=None, processes=None, seed=None,
+                 batch_size=500, log_path=None):
+        """
+        Initialize the runner.
+
+        Args:
+            attacker (str): The name of the attacker strategy in Attackers.ATTACKERS.
+            size (int): The size of the board.
+            ship_sizes (list): The fleet to place. Defaults to Game.ship_sizes.
+            processes (int): The number of worker processes. Defaults to one per core; 1 runs
+                             the games in the current process.
+            seed (int): The master seed. Batch seeds are derived from it, so results do not
+                        depend on the number of processes. A random seed is used if None.
+            batch_size (int): The number of games each worker plays per task.
+            log_path (str): If given, the summary of each run is appended to this file
+                            through GLogger.Logger.
+
+        Raises:
+            ValueError: If the attacker name is unknown.
+        """
+        if attacker not in ATTACKERS:
+            raise ValueError(f"Unknown attacker '{attacker}', choose from {sorted(ATTACKERS)}")
+        self.attacker = attacker
+        self.size = size
+        self.ship_sizes = list(ship_sizes) if ship_sizes is not None else list(Game.ship_sizes)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.batch_size = batch_size
+        self.logger = Logger(log_path) if log_path else None
+
+    def tasks(self, games):
+        """
+        Split a number of games into batch tasks with their own seeds.
+
+        Args:
+            games (int): The total number of games to play.
+
+        Returns:
+            list: A list of task tuples for run_batch.
+        """
+        tasks = []
+        for index, start in enumerate(range(0, games, self.batch_size)):
+            count = min(self.batch_size, games - start)
+            tasks.append((self.attacker, self.size, self.ship_sizes, f"{self.seed}:{index}", count))
+        return tasks
+
+    def run(self, games):
+        """
+        Play a number of games and summarise the results.
+
+        Args:
+            games (int): The total number of games to play.
+
+        Returns:
+            dict: The report, with keys 'attacker', 'games', 'seconds', 'games_per_sec',
+                  'mean_shots', 'min_shots', 'max_shots' and 'distribution' (shots -> games).
+        """
+        start_time = time.perf_counter()
+        distribution = Counter()
+        tasks = self.tasks(games)
+        if self.processes == 1:
+            for task in tasks:
+                distribution.update(run_batch(task))
+        else:
+            with multiprocessing.Pool(self.processes) as pool:
+                for batch in pool.imap_unordered(run_batch, tasks):
+                    distribution.update(batch)
+        seconds = time.perf_counter() - start_time
+        played = sum(distribution.values())
+        report = {
+            'attacker': self.attacker,
+            'games': played,
+            'seconds': seconds,
+            'games_per_sec': played / seconds if seconds else 0.0,
+            'mean_shots': sum(shots * count for shots, count in distribution.items()) / played if played else 0.0,
+            'min_shots': min(distribution) if distribution else 0,
+            'max_shots': max(distribution) if distribution else 0,
+            'distribution': dict(sorted(distribution.items())),
+        }
+        if self.logger is not None:
+            self.logger.log_entry(format_report(report))
+        return report
+
+
+def format_report(report):
+    """
+    Format a simulation report as readable text.
+
+    Args:
+        report (dict): A report returned by SimulationRunner.run().
+
+    Returns:
+        str: The report as a multi-line string.
+    """
+    lines = [
+        f"Attacker: {report['attacker']}",
+        f"Games: {report['games']} in {report['seconds']:.2f}s ({report['games_per_sec']:.0f} games/sec)",
+        f"Shots to win: mean {report['mean_shots']:.2f}, min {report['min_shots']}, max {report['max_shots']}",
+        "Shot distribution:",
+    ]
+    for shots, count in report['distribution'].items():
+        lines.append(f"  {shots:4d}: {count}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run headless Battleship simulations.")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to play")
+    parser.add_argument("--attacker", default="hunt_target", choices=sorted(ATTACKERS), help="attacker strategy")
+    parser.add_argument("--size", type=int, default=10, help="board size")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=None, help="master seed")
+    parser.add_argument("--log", default=None, help="append the summary to this log file")
+    args = parser.parse_args()
+
+    runner = SimulationRunner(args.attacker, args.size, processes=args.processes, seed=args.seed,
+                              log_path=args.log)
+    print(format_report(runner.run(args.games)))
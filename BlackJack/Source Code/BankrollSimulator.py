@@ -0,0 +1,277 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class simulates whole betting sessions from a starting bankroll, the way a player at
+# BlackjackGame bets with make_bet before each hand. Every session plays until it is ruined, reaches its
+# target or runs out of hands, betting with a flat, Martingale, Kelly or card-counting system. Sessions are
+# played side by side as NumPy arrays with the hand engine of Simulator.BlackjackSimulator, split into
+# batches with their own seeded streams and spread over a process pool. Each batch sends back only the
+# final bankrolls, session lengths and ruin flags. The report gives the risk of ruin, the session length
+# distribution and quantiles of the final bankroll.
+
+import argparse
+import multiprocessing
+import random
+import time
+
+import numpy as np
+
+from Simulator import BlackjackSimulator, DECK_COMPOSITION, strategy_from_dict
+from StrategyComparison import basic_strategy_table
+
+SYSTEMS = ('flat', 'martingale', 'kelly', 'count')
+
+# Hi-Lo counting: 2 to 6 count +1 when dealt, tens and aces -1, indexed by value - 1
+HI_LO = np.array([-1, 1, 1, 1, 1, 1, 0, 0, 0, -1])
+
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+def next_bets(system, settings, bankroll, last_bet, last_net, shoe, decks):
+    """
+    Works out each session's next bet, in whole credits between 1 and the bankroll.
+
+    Args:
+        system (str): The betting system, one of SYSTEMS.
+        settings (dict): 'unit', 'max_bet', 'kelly_fraction' (bankroll share to bet),
+                         'spread' and 'ramp' for the count system.
+        bankroll (numpy.ndarray): The current bankroll of each session.
+        last_bet (numpy.ndarray): The previous bet of each session, 0 before the first hand.
+        last_net (numpy.ndarray): The previous change in bankroll of each session.
+        shoe (numpy.ndarray): The cards of each value left in each session's shoe, or None.
+        decks (int): The number of decks in a full shoe.
+
+    Returns:
+        numpy.ndarray: The bets.
+    """
+    unit = settings['unit']
+    if system == 'flat':
+        bets = np.full(bankroll.shape, unit, dtype=np.int64)
+    elif system == 'martingale':
+        # Double after a loss, back to one unit after a win or tie
+        bets = np.where((last_bet > 0) & (last_net < 0), last_bet * 2, unit)
+    elif system == 'kelly':
+        bets = np.floor(settings['kelly_fraction'] * bankroll).astype(np.int64)
+    else:
+        dealt = DECK_COMPOSITION * decks - shoe
+        running = dealt @ HI_LO
+        decks_left = np.maximum(shoe.sum(axis=1) / 52.0, 0.5)
+        true_count = running / decks_left
+        units = np.clip(1 + np.floor((true_count - 1) * settings['ramp']), 1, settings['spread'])
+        bets = (units * unit).astype(np.int64)
+    if settings['max_bet']:
+        bets = np.minimum(bets, settings['max_bet'])
+    return np.clip(bets, 1, np.maximum(bankroll, 1))
+
+
+def run_batch(task):
+    """
+    Plays a batch of sessions in a worker process.
+
+    Args:
+        task (tuple): (system, settings, strategy table, bankroll, hands, target, decks,
+                       penetration, master seed, batch index, number of sessions).
+
+    Returns:
+        tuple: Arrays of the final bankroll, the hands played and whether each session was ruined.
+    """
+    system, settings, table, bankroll, hands, target, decks, penetration, seed, index, sessions = task
+    rng = np.random.default_rng([seed, index])
+    simulator = BlackjackSimulator(table, decks=decks, rng=rng)
+    balance = np.full(sessions, bankroll, dtype=np.int64)
+    played = np.zeros(sessions, dtype=np.int64)
+    last_bet = np.zeros(sessions, dtype=np.int64)
+    last_net = np.zeros(sessions, dtype=np.int64)
+    active = np.ones(sessions, dtype=bool)
+    full = DECK_COMPOSITION * decks if decks else None
+    shoe = np.tile(full, (sessions, 1)) if decks else None
+    # Reshuffle at the cut card, or earlier if a hand could run the shoe dry
+    reshuffle_at = max(int(52 * decks * (1 - penetration)), 20) if decks else 0
+    for _ in range(hands):
+        lanes = np.flatnonzero(active)
+        if lanes.size == 0:
+            break
+        lane_shoe = None
+        if decks:
+            lane_shoe = shoe[lanes]
+            lane_shoe[lane_shoe.sum(axis=1) <= reshuffle_at] = full
+        bets = next_bets(system, settings, balance[lanes], last_bet[lanes], last_net[lanes], lane_shoe, decks)
+        results, _ = simulator.play_chunk(lanes.size, lane_shoe)
+        net = (results * bets).astype(np.int64)
+        balance[lanes] += net
+        played[lanes] += 1
+        last_bet[lanes] = bets
+        last_net[lanes] = net
+        if decks:
+            shoe[lanes] = lane_shoe
+        done = balance[lanes] < 1
+        if target:
+            done |= balance[lanes] >= target
+        active[lanes[done]] = False
+    return balance, played, balance < 1
+
+
+class BankrollSimulator:
+    def __init__(self, system='flat', bankroll=50, hands=100, target=None, unit=1, max_bet=None, kelly_fraction=None,
+                 spread=8, ramp=1.0, decks=6, penetration=0.75, strategy=None, processes=None, seed=None,
+                 batch_size=20000):
+        """
+        Initializes the simulator.
+
+        Args:
+            system (str): The betting system: 'flat', 'martingale', 'kelly' or 'count'.
+            bankroll (int): The credits each session starts with. Defaults to the game's 50.
+            hands (int): The most hands a session plays.
+            target (int): A bankroll at which the session stops as a winner, or None.
+            unit (int): The base bet.
+            max_bet (int): The table limit, or None for no limit.
+            kelly_fraction (float): The share of the bankroll the Kelly system bets. Defaults to
+                                    the full Kelly share, edge / variance per unit bet, estimated
+                                    with BlackjackSimulator.
+            spread (int): The largest bet of the count system, in units.
+            ramp (float): Extra units the count system bets per point of true count above 1.
+            decks (int): The number of decks in each session's shoe, or None for an infinite
+                         shoe. The count system needs a finite shoe.
+            penetration (float): The fraction of the shoe dealt before reshuffling.
+            strategy (numpy.ndarray): The playing strategy table for BlackjackSimulator. Defaults
+                                      to the solved basic strategy.
+            processes (int): The number of worker processes. Defaults to one per core; 1 plays
+                             in the current process.
+            seed (int): The master seed. Each batch gets its own stream from it, so results do
+                        not depend on the number of processes. A random seed is used if None.
+            batch_size (int): The number of sessions each worker plays per task.
+
+        Raises:
+            ValueError: If the system is unknown, or the count system has no finite shoe.
+        """
+        if system not in SYSTEMS:
+            raise ValueError(f"Unknown betting system '{system}', choose from {list(SYSTEMS)}")
+        if system == 'count' and not decks:
+            raise ValueError("The count system needs a finite number of decks")
+        self.system = system
+        self.bankroll = bankroll
+        self.hands = hands
+        self.target = target
+        self.decks = decks
+        self.penetration = penetration
+        self.strategy = strategy if strategy is not None else strategy_from_dict(basic_strategy_table())
+        self.processes = processes or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.batch_size = batch_size
+        if system == 'kelly' and kelly_fraction is None:
+            estimate = BlackjackSimulator(self.strategy, seed=self.seed).run(200000)
+            kelly_fraction = max(estimate['ev'], 0.0) / estimate['variance']
+        self.settings = {'unit': unit, 'max_bet': max_bet, 'kelly_fraction': kelly_fraction or 0.0,
+                         'spread': spread, 'ramp': ramp}
+
+    def tasks(self, sessions):
+        """
+        Splits a number of sessions into batch tasks.
+
+        Args:
+            sessions (int): The total number of sessions.
+
+        Returns:
+            list: A list of task tuples for run_batch.
+        """
+        tasks = []
+        for index, start in enumerate(range(0, sessions, self.batch_size)):
+            tasks.append((self.system, self.settings, self.strategy, self.bankroll, self.hands, self.target,
+                          self.decks, self.penetration, self.seed, index, min(self.batch_size, sessions - start)))
+        return tasks
+
+    def run(self, sessions, progress=None):
+        """
+        Plays a number of sessions and summarises them.
+
+        Args:
+            sessions (int): The number of sessions to play.
+            progress (callable): Called with the number of sessions finished after each batch.
+
+        Returns:
+            dict: 'system', 'sessions', 'hands', 'risk_of_ruin', 'target_rate', 'mean_final',
+                  'final_quantiles' and 'length_quantiles' (quantile -> value), 'mean_length',
+                  'seconds' and 'hands_per_sec'.
+        """
+        start_time = time.perf_counter()
+        finals, lengths, ruins = [], [], []
+        tasks = self.tasks(sessions)
+        if self.processes == 1:
+            batches = map(run_batch, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(self.processes)
+            batches = pool.imap_unordered(run_batch, tasks)
+        try:
+            for final, length, ruined in batches:
+                finals.append(final)
+                lengths.append(length)
+                ruins.append(ruined)
+                if progress is not None:
+                    progress(sum(len(batch) for batch in finals))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        seconds = time.perf_counter() - start_time
+        final = np.concatenate(finals)
+        length = np.concatenate(lengths)
+        ruined = np.concatenate(ruins)
+        hands = int(length.sum())
+        return {
+            'system': self.system,
+            'sessions': len(final),
+            'hands': hands,
+            'risk_of_ruin': float(ruined.mean()),
+            'target_rate': float((final >= self.target).mean()) if self.target else 0.0,
+            'mean_final': float(final.mean()),
+            'final_quantiles': dict(zip(QUANTILES, np.quantile(final, QUANTILES).tolist())),
+            'mean_length': float(length.mean()),
+            'length_quantiles': dict(zip(QUANTILES, np.quantile(length, QUANTILES).tolist())),
+            'seconds': seconds,
+            'hands_per_sec': hands / seconds if seconds else 0.0,
+        }
+
+
+def format_report(report):
+    """
+    Formats a bankroll report as readable text.
+
+    Args:
+        report (dict): A report returned by BankrollSimulator.run.
+
+    Returns:
+        str: The report as a multi-line string.
+    """
+    def quantiles(values):
+        return "  ".join(f"{int(q * 100)}%: {value:g}" for q, value in values.items())
+
+    return "\n".join([
+        f"System: {report['system']}",
+        f"Sessions: {report['sessions']} ({report['hands']} hands in {report['seconds']:.2f}s, "
+        f"{report['hands_per_sec']:,.0f} hands/sec)",
+        f"Risk of ruin: {report['risk_of_ruin']:.4f}   Reached target: {report['target_rate']:.4f}",
+        f"Final bankroll: mean {report['mean_final']:.2f}   {quantiles(report['final_quantiles'])}",
+        f"Session length: mean {report['mean_length']:.1f}   {quantiles(report['length_quantiles'])}",
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate Blackjack betting sessions from a starting bankroll.")
+    parser.add_argument("--system", default="flat", choices=SYSTEMS, help="betting system")
+    parser.add_argument("--sessions", type=int, default=100000, help="number of sessions")
+    parser.add_argument("--bankroll", type=int, default=50, help="starting credits")
+    parser.add_argument("--hands", type=int, default=100, help="most hands per session")
+    parser.add_argument("--target", type=int, default=None, help="stop a session once it reaches this bankroll")
+    parser.add_argument("--unit", type=int, default=1, help="base bet")
+    parser.add_argument("--max-bet", type=int, default=None, help="table limit")
+    parser.add_argument("--kelly-fraction", type=float, default=None, help="bankroll share bet by 'kelly'")
+    parser.add_argument("--spread", type=int, default=8, help="largest count bet in units")
+    parser.add_argument("--decks", type=int, default=6, help="decks per shoe (0 for an infinite shoe)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=None, help="master seed")
+    args = parser.parse_args()
+
+    simulator = BankrollSimulator(args.system, args.bankroll, args.hands, args.target, args.unit, args.max_bet,
+                                  args.kelly_fraction, args.spread, decks=args.decks or None,
+                                  processes=args.processes, seed=args.seed)
+    print(format_report(simulator.run(args.sessions)))
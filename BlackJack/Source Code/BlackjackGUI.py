@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import simpledialog, messagebox
 from BlackjackGame import BlackjackGame  # Ensure this import matches your file structure
+from Card import NAMES
+from StrategySolver import StrategySolver, shoe_composition
 
 
 # Author: Sohaib Hussain
@@ -9,6 +11,20 @@ from BlackjackGame import BlackjackGame  # Ensure this import matches your file
 # It includes methods to handle user interactions such as making bets, hitting, standing,
 # and restarting the game. It also updates the GUI to reflect the current state of the game.
 
+
+def card_str(card):
+    """
+    Looks up the display string of a card.
+
+    Args:
+        card (int): The card byte, or None for a card not yet drawn.
+
+    Returns:
+        str: The rank and suit symbol of the card, such as 'Q♠', or 'X' for None.
+    """
+    return NAMES[card] if card is not None else 'X'
+
+
 class BlackjackGUI:
     def __init__(self, root):
         """
@@ -20,6 +36,7 @@ class BlackjackGUI:
         self.root = root
         self.root.title("Blackjack")
         self.game = BlackjackGame()
+        self.solver = StrategySolver(decks=self.game.deck.decks)
         self.create_widgets()
         self.update_info()
 
@@ -106,7 +123,7 @@ class BlackjackGUI:
         Restarts the game if the player has credits left; otherwise, ends the game.
         """
         if self.game.player.credits > 0:
-            self.game = BlackjackGame()
+            self.game.restart_game()
             self.update_info()
         else:
             messagebox.showinfo("Game Over", "No credits left. Game Over.")
@@ -116,28 +133,6 @@ class BlackjackGUI:
         """
         Updates the GUI to display the current state of the game including hands and totals.
         """
-
-        def card_str(card):
-            """
-            Converts a card value to a string representation.
-
-            Args:
-                card (int): The card value (1 to 13).
-
-            Returns:
-                str: The string representation of the card.
-            """
-            if card == 1:
-                return 'A'
-            elif card == 11:
-                return 'J'
-            elif card == 12:
-                return 'Q'
-            elif card == 13:
-                return 'K'
-            else:
-                return str(card)
-
         player_hand = ', '.join(card_str(card) for card in self.game.player.hand)
         player_total = self.game.player.calculate_total()
 
@@ -154,8 +149,17 @@ class BlackjackGUI:
             # Hide the dealer's second card
             dealer_hand_display = f"{card_str(self.game.dealer.hand[0])}, X"
 
+        # Suggest the better action for the cards left in the shoe while the player is deciding
+        hint = ""
+        if not self.game.player_turn_complete and player_total <= 21:
+            advice = self.solver.evaluate(self.game.player.hand, self.game.dealer.hand[0],
+                                          shoe_composition(self.game.deck))
+            hint = (f"\n\nHint: {'Hit' if advice['best'] == 'hit' else 'Stand'} "
+                    f"(hit {advice['hit']:+.2f}, stand {advice['hold']:+.2f} per credit bet)")
+
         self.info_label.config(text=f"Player Credits: {self.game.player.credits}\n"
                                     f"Player Hand: {player_hand}\n"
                                     f"Player Total: {player_total}\n\n"
                                     f"Dealer Hand: {dealer_hand_display}\n"
-                                    f"Dealer Total: {dealer_total}")
+                                    f"Dealer Total: {dealer_total}"
+                                    f"{hint}")
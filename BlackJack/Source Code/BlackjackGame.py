@@ -4,22 +4,33 @@
 # player and dealer actions, betting, and game outcomes. It logs important events
 # such as game start, player actions, and game results.
 
-from Deck import Deck
+from Shoe import Shoe
 from Player import Player
 from Dealer import Dealer
 from GLogger import GameLogger
 
+# Change in credits per unit bet for each result of a round
+PAYOUTS = {'bust': -1, 'player': 2, 'dealer': -1, 'tie': 1}
+
+# Log message for each result once the dealer has played
+RESULT_MESSAGES = {'player': 'Player wins.', 'dealer': 'Dealer wins.', 'tie': 'It\'s a tie.'}
+
 
 class BlackjackGame:
-    def __init__(self):
+    def __init__(self, decks=1, penetration=0.75, seed=None):
         """
-        Initializes a new game of Blackjack with a player, dealer, and deck of cards.
+        Initializes a new game of Blackjack with a player, dealer, and shoe of cards.
         Sets the initial bet to 0 and starts the game. Logs the game start event.
+
+        Args:
+            decks (int): The number of decks in the shoe. Defaults to 1.
+            penetration (float): The fraction of the shoe dealt before it is reshuffled. Defaults to 0.75.
+            seed (int): The seed for the shoe, for reproducible games. Defaults to None.
         """
         self.logger = GameLogger()
         self.player = Player(credits=50)
         self.dealer = Dealer()
-        self.deck = Deck()
+        self.deck = Shoe(decks=decks, penetration=penetration, seed=seed)
         self.bet = 0
         self.player_turn_complete = False
         self.start_game()
@@ -35,6 +46,9 @@ class BlackjackGame:
         Returns:
             None
         """
+        if self.deck.needs_shuffle():
+            self.logger.log('Cut card reached. Shoe reshuffled.')
+        self.deck.start_round()
         self.player.hand = [self.deck.draw_card(), self.deck.draw_card()]
         self.dealer.hand = [self.deck.draw_card(), None]  # Dealer’s second card is hidden
         self.player_turn_complete = False
@@ -56,31 +70,20 @@ class BlackjackGame:
             self.logger.log(f'Player chose to hit. New hand: {self.player.hand}')
             if self.player.calculate_total() > 21:
                 self.logger.log('Player busts')
-                self.player.credits -= self.bet
+                self.player.credits += PAYOUTS['bust'] * self.bet
                 return 'bust'
         elif action == 'hold':
             self.player_turn_complete = True
             self.dealer.hand[1] = self.deck.draw_card()  # Reveal the hidden card
-            while self.dealer.calculate_total() < 17:
-                self.dealer.hand.append(self.deck.draw_card())
+            self.dealer.play(self.deck)
             dealer_total = self.dealer.calculate_total()
-            player_total = self.player.calculate_total()
+            result = settle(self.player.calculate_total(), dealer_total)
             if dealer_total > 21:
                 self.logger.log('Dealer busts. Player wins.')
-                self.player.credits += 2 * self.bet
-                return 'player'
-            elif dealer_total > player_total:
-                self.logger.log('Dealer wins.')
-                self.player.credits -= self.bet
-                return 'dealer'
-            elif dealer_total == player_total:
-                self.logger.log('It\'s a tie.')
-                self.player.credits += self.bet
-                return 'tie'
             else:
-                self.logger.log('Player wins.')
-                self.player.credits += 2 * self.bet
-                return 'player'
+                self.logger.log(RESULT_MESSAGES[result])
+            self.player.credits += PAYOUTS[result] * self.bet
+            return result
 
     def make_bet(self, bet_amount):
         """
@@ -101,7 +104,8 @@ class BlackjackGame:
 
     def restart_game(self):
         """
-        Restarts the game by reinitializing the BlackjackGame instance.
+        Restarts the game with fresh credits, hands and a reshuffled shoe. The shoe and
+        logger are reused rather than rebuilt.
 
         Args:
             None
@@ -110,4 +114,55 @@ class BlackjackGame:
             None
         """
         self.logger.log('Game restarted')
-        self.__init__()  # Reinitialize the game for a new start
+        self.player = Player(credits=50)
+        self.dealer = Dealer()
+        self.deck.shuffle()
+        self.bet = 0
+        self.start_game()
+        self.logger.log('Game started with player credits: 50')
+
+
+def settle(player_total, dealer_total):
+    """
+    Decides the result of a round after the dealer has played, for a player who did not bust.
+
+    Args:
+        player_total (int): The player's final total.
+        dealer_total (int): The dealer's final total.
+
+    Returns:
+        str: 'player', 'dealer' or 'tie'.
+    """
+    if dealer_total > 21:
+        return 'player'
+    elif dealer_total > player_total:
+        return 'dealer'
+    elif dealer_total == player_total:
+        return 'tie'
+    return 'player'
+
+
+def play_round(deck, strategy, bet=1):
+    """
+    Plays one round without logging, using the same rules as BlackjackGame.player_turn.
+
+    Args:
+        deck (Shoe): The shoe or deck to deal from.
+        strategy: An object whose action(hand, upcard) method returns 'hit' or 'hold'.
+        bet (int): The amount bet on the round.
+
+    Returns:
+        tuple: The result ('bust', 'player', 'dealer' or 'tie') and the change in credits.
+    """
+    player = Player(credits=0)
+    dealer = Dealer()
+    player.hand = [deck.draw_card(), deck.draw_card()]
+    dealer.hand = [deck.draw_card(), None]
+    while player.calculate_total() < 21 and strategy.action(player.hand, dealer.hand[0]) == 'hit':
+        player.hand.append(deck.draw_card())
+    if player.calculate_total() > 21:
+        return 'bust', PAYOUTS['bust'] * bet
+    dealer.hand[1] = deck.draw_card()
+    dealer.play(deck)
+    result = settle(player.calculate_total(), dealer.calculate_total())
+    return result, PAYOUTS[result] * bet
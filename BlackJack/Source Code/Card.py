@@ -1,19 +1,53 @@
 # Author: Sohaib Hussain
 # Date: August 6, 2024
-# Description: This class represents a playing card in a deck of cards used for Blackjack.
-# It includes card suits and values, and provides methods for initialization and representation.
+# Description: This module defines the card encoding used throughout the Blackjack game. A card is a single
+# byte holding the rank (1 for ace to 13 for king) in the low four bits and the suit (0 to 3) in the next
+# two, so decks, shoes and hands can store cards in bytearray, array or NumPy buffers. Lookup tables give
+# the rank, suit, blackjack value and display string of any card byte. The Card class is a read-only view
+# of a card byte; one shared Card exists per card, so viewing a card never allocates.
 
-import random
+SUITS = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+SUIT_SYMBOLS = ['♥', '♦', '♣', '♠']
+RANK_NAMES = ['', 'A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K']
+
+CODES = 64  # Size of the lookup tables: every value of the rank and suit bits
+
+
+def encode(rank, suit=0):
+    """
+    Encodes a card as a byte.
+
+    Args:
+        rank (int): The rank, from 1 (ace) to 13 (king).
+        suit (int): The suit index into SUITS. Defaults to 0, so a plain rank is a valid card.
+
+    Returns:
+        int: The card byte.
+    """
+    return rank | (suit << 4)
+
+
+# Lookup tables indexed by card byte. Bytes that are not cards map to rank 0 and value 0.
+RANKS = bytes(code & 0xF if 1 <= code & 0xF <= 13 else 0 for code in range(CODES))
+SUIT_INDEX = bytes(code >> 4 for code in range(CODES))
+VALUES = bytes(min(rank, 10) for rank in RANKS)  # Blackjack value, aces count 1
+LABELS = [RANK_NAMES[rank] for rank in RANKS]  # Rank only, as shown in the GUI
+NAMES = [f"{RANK_NAMES[rank]}{SUIT_SYMBOLS[code >> 4]}" if rank else '' for code, rank in enumerate(RANKS)]
+
+# Every card of one 52-card deck, in rank order within each suit
+DECK = bytes(encode(rank, suit) for suit in range(4) for rank in range(1, 14))
 
 
 class Card:
-    suits = ['Hearts', 'Diamonds', 'Clubs', 'Spades']
+    __slots__ = ('code',)
+
+    suits = SUITS
     values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
               'J': 11, 'Q': 12, 'K': 13, 'A': 1}
 
     def __init__(self, value, suit):
         """
-        Initializes a card with a given value and suit.
+        Initializes a card from its value and suit names.
 
         Args:
             value (str): The value of the card (e.g., '2', 'A').
@@ -22,8 +56,56 @@ class Card:
         Returns:
             None
         """
-        self.value = value
-        self.suit = suit
+        self.code = encode(self.values[value], SUITS.index(suit))
+
+    @staticmethod
+    def of(code):
+        """
+        Returns the shared view of a card byte.
+
+        Args:
+            code (int): The card byte.
+
+        Returns:
+            Card: The card, which must not be modified.
+        """
+        return CARDS[code]
+
+    @property
+    def value(self):
+        """
+        The rank name, such as 'A' or '10'.
+        """
+        return RANK_NAMES[RANKS[self.code]]
+
+    @property
+    def suit(self):
+        """
+        The suit name, such as 'Hearts'.
+        """
+        return SUITS[SUIT_INDEX[self.code]]
+
+    @property
+    def rank(self):
+        """
+        The rank, from 1 (ace) to 13 (king).
+        """
+        return RANKS[self.code]
+
+    @property
+    def blackjack_value(self):
+        """
+        The blackjack value, from 1 (ace) to 10.
+        """
+        return VALUES[self.code]
+
+    def __eq__(self, other):
+        if isinstance(other, Card):
+            return self.code == other.code
+        return self.code == other
+
+    def __hash__(self):
+        return self.code
 
     def __repr__(self):
         """
@@ -33,3 +115,21 @@ class Card:
             str: A string representation of the card in the format "ValueSuitInitial".
         """
         return f"{self.value}{self.suit[0]}"
+
+
+def make_view(code):
+    """
+    Creates the shared Card for a card byte without going through the name lookup.
+
+    Args:
+        code (int): The card byte.
+
+    Returns:
+        Card: The card view.
+    """
+    card = Card.__new__(Card)
+    card.code = code
+    return card
+
+
+CARDS = [make_view(code) if RANKS[code] else None for code in range(CODES)]
@@ -31,4 +31,4 @@ class Dealer(Player):
             None
         """
         while self.calculate_total() < 17:
-            self.draw_card(deck)
+            self.hand.append(deck.draw_card())
@@ -3,7 +3,8 @@
 # Description: This class represents a deck of cards used in a Blackjack game.
 # It handles deck creation, shuffling, and drawing cards.
 
-from Card import Card
+from array import array
+from Card import DECK
 import random
 
 class Deck:
@@ -22,15 +23,15 @@ class Deck:
 
     def create_deck(self):
         """
-        Creates a deck of 52 cards with values from 1 to 13 for each of the four suits.
+        Creates a deck of 52 cards, one of each rank from 1 to 13 in each of the four suits.
 
         Args:
             None
 
         Returns:
-            list: A list of card values representing the deck.
+            array: The card bytes of the deck (see Card.encode).
         """
-        return [value for value in range(1, 14)] * 4
+        return array('B', DECK)
 
     def shuffle(self):
         """
@@ -52,7 +53,7 @@ class Deck:
             None
 
         Returns:
-            int: The value of the drawn card.
+            int: The card byte of the drawn card.
 
         Raises:
             ValueError: If there are no cards left in the deck.
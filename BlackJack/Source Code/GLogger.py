@@ -19,6 +19,8 @@ class GameLogger:
         """
         self.logger = logging.getLogger("BlackjackGameLogger")
         self.logger.setLevel(logging.INFO)
+        if self.logger.handlers:
+            return  # Already configured by an earlier game; another handler would duplicate every line
         file_handler = logging.FileHandler(filename)
         file_handler.setLevel(logging.INFO)
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
@@ -0,0 +1,129 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class represents a hand of cards in a Blackjack game. It behaves like the list of card
+# bytes the game used before, including a None placeholder for the dealer's hidden card, but keeps the
+# hard total, the number of aces and the soft flag up to date as cards are added, so the total never has
+# to be recomputed from the cards. It also keeps a packed integer key of the cards held.
+
+from Card import CARDS, VALUES
+
+KEY_BITS = 5  # Bits per card value in the packed key; a hand can hold up to 31 cards of one value
+
+
+class Hand:
+    __slots__ = ('cards', 'hard', 'aces', 'key')
+
+    def __init__(self, cards=()):
+        """
+        Initializes a hand, optionally with some cards.
+
+        Args:
+            cards (iterable): The starting card bytes (see Card.encode). None marks a hidden
+                              card that does not count towards the total.
+
+        Returns:
+            None
+        """
+        self.cards = []
+        self.hard = 0  # Total with every ace counted as 1
+        self.aces = 0
+        self.key = 0  # Count of each value from ace to ten, KEY_BITS bits per value
+        for card in cards:
+            self.append(card)
+
+    def add_value(self, card, sign):
+        """
+        Adds a card to, or removes it from, the running totals.
+
+        Args:
+            card (int): The card byte, or None for a hidden card.
+            sign (int): 1 to add the card, -1 to remove it.
+
+        Returns:
+            None
+        """
+        if card is None:
+            return
+        value = VALUES[card]
+        self.hard += sign * value
+        self.key += sign * (1 << (KEY_BITS * (value - 1)))
+        if value == 1:
+            self.aces += sign
+
+    def append(self, card):
+        """
+        Adds a card to the hand.
+
+        Args:
+            card (int): The card byte, or None for a hidden card.
+
+        Returns:
+            None
+        """
+        self.cards.append(card)
+        self.add_value(card, 1)
+
+    @property
+    def soft(self):
+        """
+        Whether an ace is being counted as 11.
+
+        Returns:
+            bool: True if the total is soft.
+        """
+        return self.aces > 0 and self.hard + 10 <= 21
+
+    @property
+    def total(self):
+        """
+        The value of the hand, counting one ace as 11 when that does not go over 21.
+
+        Returns:
+            int: The total value of the hand.
+        """
+        if self.aces and self.hard + 10 <= 21:
+            return self.hard + 10
+        return self.hard
+
+    def __getitem__(self, index):
+        """Returns the card byte at a position, or None for a hidden card."""
+        return self.cards[index]
+
+    def __setitem__(self, index, card):
+        """
+        Replaces a card, such as revealing the dealer's hidden card.
+
+        Args:
+            index (int): The position of the card.
+            card (int): The new card byte, or None.
+
+        Returns:
+            None
+        """
+        self.add_value(self.cards[index], -1)
+        self.cards[index] = card
+        self.add_value(card, 1)
+
+    def __len__(self):
+        """Returns the number of cards, counting a hidden card."""
+        return len(self.cards)
+
+    def __iter__(self):
+        """Iterates over the card bytes in the order they were dealt."""
+        return iter(self.cards)
+
+    # A hand changes as cards are dealt, so it is left unhashable like a list; caches key on hand.key
+    def __eq__(self, other):
+        """Compares the cards with another hand or with a list of card bytes."""
+        if isinstance(other, Hand):
+            return self.cards == other.cards
+        return self.cards == other
+
+    def __repr__(self):
+        """
+        Provides a list-style representation of the cards for log lines, such as [AH, 10S, None].
+
+        Returns:
+            str: The representation of the cards.
+        """
+        return '[' + ', '.join(repr(CARDS[card]) if card is not None else 'None' for card in self.cards) + ']'
@@ -3,7 +3,7 @@
 # Description: This class represents a player in the Blackjack game.
 # It handles the player's credits, the player's hand, and calculates the total value of the hand.
 
-from Card import Card
+from Hand import Hand
 
 
 class Player:
@@ -20,6 +20,26 @@ class Player:
         self.credits = credits
         self.hand = []
 
+    @property
+    def hand(self):
+        """
+        The player's hand, which keeps its total up to date as cards are added.
+
+        Returns:
+            Hand: The player's hand.
+        """
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards):
+        """
+        Replaces the player's hand. A list of card values is wrapped in a Hand.
+
+        Args:
+            cards (Hand or list): The new hand.
+        """
+        self._hand = cards if isinstance(cards, Hand) else Hand(cards)
+
     def calculate_total(self):
         """
         Calculates the total value of the player's hand, taking into account the value of aces.
@@ -27,19 +47,4 @@ class Player:
         Returns:
             int: The total value of the player's hand.
         """
-        total = 0
-        aces = 0
-        for card in self.hand:
-            if card is None:
-                continue  # Skip None values
-            if card in [11, 12, 13]:
-                total += 10
-            elif card == 1:
-                aces += 1
-                total += 11
-            else:
-                total += card
-        while total > 21 and aces:
-            total -= 10
-            aces -= 1
-        return total
+        return self._hand.total
@@ -0,0 +1,143 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class represents a dealing shoe of one or more decks used in a Blackjack game.
+# The cards are stored once in a preallocated bytearray and dealt by moving a cursor, shuffling
+# lazily as each card is drawn, so reshuffling only resets the cursor and never allocates. A cut
+# card placed at the penetration depth tells the game when to reshuffle between rounds. Cards
+# dealt before the current round are discards; only those go back if the shoe runs out mid-round.
+
+import random
+from Card import DECK
+
+
+class Shoe:
+    def __init__(self, decks=6, penetration=0.75, seed=None):
+        """
+        Initializes the shoe with the cards of a number of decks.
+
+        Args:
+            decks (int): The number of 52-card decks in the shoe. Defaults to 6.
+            penetration (float): The fraction of the shoe dealt before the cut card is reached.
+                                 Defaults to 0.75.
+            seed (int): The seed for the shuffle, for reproducible games. Defaults to None.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If decks is not positive or penetration is not between 0 and 1.
+        """
+        if decks < 1:
+            raise ValueError("A shoe needs at least one deck")
+        if not 0 < penetration <= 1:
+            raise ValueError("Penetration must be between 0 and 1")
+        self.decks = decks
+        self.penetration = penetration
+        self.rng = random.Random(seed)
+        self.cards = bytearray(DECK) * decks
+        self.cut_card = max(1, int(len(self.cards) * penetration))
+        self.position = 0  # Cards before the cursor have been dealt
+        self.round_start = 0  # Cards before this index are discards from earlier rounds
+        self.shuffles = 0
+
+    def shuffle(self):
+        """
+        Returns every card to the shoe. The cards are shuffled as they are drawn, so this
+        only moves the cursor back to the start of the buffer.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.position = 0
+        self.round_start = 0
+        self.shuffles += 1
+
+    def needs_shuffle(self):
+        """
+        Checks whether the cut card has been reached.
+
+        Args:
+            None
+
+        Returns:
+            bool: True if the shoe should be reshuffled before the next round.
+        """
+        return self.position >= self.cut_card
+
+    def start_round(self):
+        """
+        Starts a new round: reshuffles if the cut card has been reached, and marks the cards
+        dealt so far as discards.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.needs_shuffle():
+            self.shuffle()
+        self.round_start = self.position
+
+    def reshuffle_discards(self):
+        """
+        Returns the discards to the shoe in the middle of a round. The cards of the current
+        round stay dealt: they are moved to the front of the buffer and the cursor is placed
+        after them.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            RuntimeError: If the current round has dealt every card, so there are no discards.
+        """
+        if self.round_start == 0:
+            raise RuntimeError("The shoe ran out of cards in a single round")
+        cards = self.cards
+        in_play = cards[self.round_start:self.position]
+        cards[:] = in_play + cards[:self.round_start]
+        self.position = len(in_play)
+        self.round_start = 0
+        self.shuffles += 1
+
+    def remaining(self):
+        """
+        Counts the cards left to deal.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of undealt cards.
+        """
+        return len(self.cards) - self.position
+
+    def draw_card(self):
+        """
+        Draws a card from the shoe. The card is picked at random from the undealt cards and
+        swapped to the cursor, a single step of a Fisher-Yates shuffle. If the shoe runs out
+        in the middle of a round, the discards are reshuffled and dealing carries on.
+
+        Args:
+            None
+
+        Returns:
+            int: The card byte of the drawn card (see Card.encode).
+        """
+        cards = self.cards
+        position = self.position
+        if position >= len(cards):
+            self.reshuffle_discards()
+            position = self.position
+        index = self.rng.randrange(position, len(cards))
+        card = cards[index]
+        cards[index] = cards[position]
+        cards[position] = card
+        self.position = position + 1
+        return card
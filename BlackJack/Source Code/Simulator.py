@@ -0,0 +1,271 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class plays large numbers of Blackjack hands at once with NumPy arrays instead of
+# Player and Dealer objects. It follows the rules of BlackjackGame.player_turn: the player hits or holds
+# according to a strategy table, the dealer's second card is drawn when the player holds, the dealer
+# draws until reaching 17, and the payouts match player_turn. It reports the expected value per unit bet,
+# its variance and the bust rates.
+
+import time
+import numpy as np
+
+from Card import DECK, VALUES
+
+# Net result per unit bet of each outcome in BlackjackGame.player_turn: a win or dealer bust adds twice the
+# bet to the credits, a tie adds the bet back, and a bust or dealer win takes the bet.
+PAYOUTS = {'player': 2.0, 'tie': 1.0, 'dealer': -1.0, 'bust': -1.0}
+
+# Blackjack value (1 for ace to 10 for ten and face cards) of each card of one 52-card deck
+DECK_VALUES = np.frombuffer(VALUES, dtype=np.uint8)[np.frombuffer(DECK, dtype=np.uint8)].astype(np.int64)
+
+# Cards of each blackjack value in one deck
+DECK_COMPOSITION = np.bincount(DECK_VALUES, minlength=11)[1:]
+
+
+def threshold_strategy(stand_on=17):
+    """
+    Build a strategy table that hits below a total and holds from it, whatever the dealer shows.
+
+    Args:
+        stand_on (int): The lowest total to hold on.
+
+    Returns:
+        numpy.ndarray: A (32, 2, 11) boolean table, True to hit, indexed by
+                       [player total, 1 if the total is soft, dealer up card value (1 = ace)].
+    """
+    table = np.zeros((32, 2, 11), dtype=bool)
+    table[:stand_on] = True
+    return table
+
+
+def strategy_from_dict(decisions):
+    """
+    Build a strategy table from a mapping of decisions.
+
+    Args:
+        decisions (dict): Maps (player total, soft, dealer up card value) to 'hit' or 'hold'.
+                          Missing entries hold.
+
+    Returns:
+        numpy.ndarray: A (32, 2, 11) boolean table, True to hit.
+    """
+    table = np.zeros((32, 2, 11), dtype=bool)
+    for (total, soft, upcard), action in decisions.items():
+        table[total, int(soft), upcard] = action == 'hit'
+    return table
+
+
+class BlackjackSimulator:
+    def __init__(self, strategy=None, decks=None, payouts=None, seed=None, rng=None):
+        """
+        Initializes the simulator.
+
+        Args:
+            strategy (numpy.ndarray): A (32, 2, 11) boolean table, True to hit, indexed by
+                                      [player total, soft, dealer up card value]. Defaults to
+                                      hitting below 17.
+            decks (int): The number of decks each hand is dealt from, freshly shuffled for every
+                         hand. None deals from an infinite shoe.
+            payouts (dict): The net result per unit bet of 'player', 'tie', 'dealer' and 'bust'.
+                            Defaults to the payouts of BlackjackGame.player_turn.
+            seed (int): The seed for the random number generator.
+            rng (numpy.random.Generator): The random number generator to use instead of seeding one.
+
+        Returns:
+            None
+        """
+        self.strategy = np.asarray(strategy if strategy is not None else threshold_strategy(), dtype=bool)
+        self.decks = decks
+        self.payouts = dict(PAYOUTS, **(payouts or {}))
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+    def run(self, hands, chunk_size=500000):
+        """
+        Plays a number of hands and summarises the results.
+
+        Args:
+            hands (int): The number of hands to play.
+            chunk_size (int): The number of hands played at once, which bounds memory use.
+
+        Returns:
+            dict: 'hands', 'ev' (mean net result per unit bet), 'variance', 'std_error',
+                  'player_bust_rate', 'dealer_bust_rate', 'win_rate', 'tie_rate', 'loss_rate',
+                  'seconds' and 'hands_per_sec'.
+        """
+        start_time = time.perf_counter()
+        total = 0.0
+        total_squares = 0.0
+        counts = {'bust': 0, 'dealer_bust': 0, 'player': 0, 'tie': 0, 'dealer': 0}
+        played = 0
+        while played < hands:
+            size = min(chunk_size, hands - played)
+            results, outcome = self.play_chunk(size)
+            total += results.sum()
+            total_squares += np.square(results).sum()
+            for name in counts:
+                counts[name] += int(outcome[name].sum())
+            played += size
+        seconds = time.perf_counter() - start_time
+        mean = total / played if played else 0.0
+        variance = total_squares / played - mean * mean if played else 0.0
+        return {
+            'hands': played,
+            'ev': mean,
+            'variance': variance,
+            'std_error': (variance / played) ** 0.5 if played else 0.0,
+            'player_bust_rate': counts['bust'] / played if played else 0.0,
+            'dealer_bust_rate': counts['dealer_bust'] / played if played else 0.0,
+            'win_rate': counts['player'] / played if played else 0.0,
+            'tie_rate': counts['tie'] / played if played else 0.0,
+            'loss_rate': (counts['dealer'] + counts['bust']) / played if played else 0.0,
+            'seconds': seconds,
+            'hands_per_sec': played / seconds if seconds else 0.0,
+        }
+
+    def play_chunk(self, size, shoe=None):
+        """
+        Plays a batch of hands side by side.
+
+        Args:
+            size (int): The number of hands.
+            shoe (numpy.ndarray): A (size, 10) array of the cards of each value left in each
+                                  hand's shoe, which is updated in place as cards are dealt.
+                                  Defaults to a full shoe per hand, or an infinite shoe if the
+                                  simulator has no deck count.
+
+        Returns:
+            tuple: The net result per unit bet of each hand, and a dict of boolean arrays
+                   marking the hands that ended in 'bust', 'dealer_bust', 'player', 'tie' and
+                   'dealer' (a dealer bust also counts as 'player').
+        """
+        if shoe is None and self.decks is not None:
+            shoe = np.tile(DECK_COMPOSITION * self.decks, (size, 1))
+        everyone = np.ones(size, dtype=bool)
+
+        # Initial deal: two cards to the player, the up card to the dealer
+        first = self.draw(shoe, everyone)
+        second = self.draw(shoe, everyone)
+        player_hard = first + second
+        player_aces = (first == 1) | (second == 1)
+        upcard = self.draw(shoe, everyone)
+
+        # Player's turn: hit while the strategy says so and the hand has not bust
+        active = everyone.copy()
+        bust = np.zeros(size, dtype=bool)
+        while active.any():
+            totals, soft = hand_totals(player_hard, player_aces)
+            hit = active & self.strategy[totals, soft.astype(np.intp), upcard]
+            if not hit.any():
+                break
+            card = self.draw(shoe, hit)
+            player_hard = np.where(hit, player_hard + card, player_hard)
+            player_aces |= hit & (card == 1)
+            bust |= hit & (player_hard > 21)
+            active = hit & ~bust
+
+        # Dealer's turn for every hand still standing: reveal the second card, draw to 17
+        standing = ~bust
+        hole = self.draw(shoe, standing)
+        dealer_hard = upcard + hole
+        dealer_aces = (upcard == 1) | (hole == 1)
+        while True:
+            dealer_totals, _ = hand_totals(dealer_hard, dealer_aces)
+            drawing = standing & (dealer_totals < 17)
+            if not drawing.any():
+                break
+            card = self.draw(shoe, drawing)
+            dealer_hard = np.where(drawing, dealer_hard + card, dealer_hard)
+            dealer_aces |= drawing & (card == 1)
+
+        player_totals, _ = hand_totals(player_hard, player_aces)
+        dealer_totals, _ = hand_totals(dealer_hard, dealer_aces)
+        dealer_bust = standing & (dealer_totals > 21)
+        dealer_wins = standing & ~dealer_bust & (dealer_totals > player_totals)
+        tie = standing & ~dealer_bust & (dealer_totals == player_totals)
+        player_wins = standing & ~dealer_wins & ~tie
+
+        results = np.empty(size)
+        results[bust] = self.payouts['bust']
+        results[dealer_wins] = self.payouts['dealer']
+        results[tie] = self.payouts['tie']
+        results[player_wins] = self.payouts['player']
+        outcome = {'bust': bust, 'dealer_bust': dealer_bust, 'player': player_wins, 'tie': tie,
+                   'dealer': dealer_wins}
+        return results, outcome
+
+    def draw(self, shoe, mask):
+        """
+        Draws one card for every hand, removing it from that hand's shoe where mask is set.
+
+        Args:
+            shoe (numpy.ndarray): The remaining cards of each value per hand, or None for an
+                                  infinite shoe.
+            mask (numpy.ndarray): The hands that actually take a card.
+
+        Returns:
+            numpy.ndarray: The value of the card drawn for each hand (1 = ace, 10 = ten or face),
+                           0 where mask is not set.
+        """
+        size = mask.shape[0]
+        if shoe is None:
+            # Every card of a deck is equally likely
+            cards = DECK_VALUES[self.rng.integers(0, len(DECK_VALUES), size=size)]
+        else:
+            remaining = shoe.cumsum(axis=1)
+            picks = self.rng.random(size) * remaining[:, -1]
+            cards = (remaining <= picks[:, None]).sum(axis=1) + 1
+            rows = np.flatnonzero(mask)
+            shoe[rows, cards[rows] - 1] -= 1
+        return np.where(mask, cards, 0)
+
+
+def hand_totals(hard, aces):
+    """
+    Computes hand totals the way Player.calculate_total does, counting one ace as 11 when that
+    does not bust the hand.
+
+    Args:
+        hard (numpy.ndarray): The total of each hand with every ace counted as 1.
+        aces (numpy.ndarray): True for hands holding at least one ace.
+
+    Returns:
+        tuple: The totals, capped at 31 for indexing, and a boolean array of soft totals.
+    """
+    soft = aces & (hard + 10 <= 21)
+    totals = np.where(soft, hard + 10, hard)
+    return np.minimum(totals, 31), soft
+
+
+def format_report(report):
+    """
+    Format the results of BlackjackSimulator.run for printing.
+
+    Args:
+        report (dict): The results returned by BlackjackSimulator.run.
+
+    Returns:
+        str: A multi-line summary.
+    """
+    return "\n".join([
+        f"Hands:            {report['hands']}",
+        f"EV per unit bet:  {report['ev']:+.5f} (+/- {1.96 * report['std_error']:.5f})",
+        f"Variance:         {report['variance']:.5f}",
+        f"Win / tie / loss: {report['win_rate']:.4f} / {report['tie_rate']:.4f} / {report['loss_rate']:.4f}",
+        f"Player bust rate: {report['player_bust_rate']:.4f}",
+        f"Dealer bust rate: {report['dealer_bust_rate']:.4f}",
+        f"Speed:            {report['hands_per_sec']:,.0f} hands/s ({report['seconds']:.2f} s)",
+    ])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Simulate Blackjack hands with a fixed hit/hold strategy.")
+    parser.add_argument('--hands', type=int, default=1000000, help="Number of hands to play")
+    parser.add_argument('--stand-on', type=int, default=17, help="Lowest total the player holds on")
+    parser.add_argument('--decks', type=int, default=None, help="Decks per hand (default: infinite shoe)")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    simulator = BlackjackSimulator(threshold_strategy(args.stand_on), decks=args.decks, seed=args.seed)
+    print(format_report(simulator.run(args.hands)))
@@ -0,0 +1,432 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class compares two Blackjack strategies with common random numbers. Each pair plays
+# strategy A and strategy B over the same seeded shoes, so both see the same card order and most of the
+# luck cancels out of the difference. Each reshuffle starts a shoe seeded from the pair and the shuffle
+# number, so the two stay paired for the whole pair. Pairs are played in batches on a process pool, the running means
+# and confidence interval of the difference are reported after every batch, and the comparison stops as
+# soon as the interval excludes zero or the pair or time budget runs out.
+
+import argparse
+import math
+import multiprocessing
+import random
+import time
+from functools import lru_cache
+from statistics import NormalDist
+
+from BlackjackGame import play_round
+from Card import VALUES
+from Shoe import Shoe
+from StrategySolver import StrategySolver
+
+
+class ThresholdStrategy:
+    def __init__(self, stand_on=17):
+        """
+        Initializes a strategy that hits below a total, whatever the dealer shows.
+
+        Args:
+            stand_on (int): The lowest total to hold on. Defaults to 17, like the dealer.
+
+        Returns:
+            None
+        """
+        self.stand_on = stand_on
+
+    def action(self, hand, upcard):
+        """
+        Decides whether to hit.
+
+        Args:
+            hand (Hand): The player's hand.
+            upcard (int): The card byte of the dealer's visible card.
+
+        Returns:
+            str: 'hit' or 'hold'.
+        """
+        return 'hit' if hand.total < self.stand_on else 'hold'
+
+
+class TableStrategy:
+    def __init__(self, table):
+        """
+        Initializes a strategy that follows a table of decisions.
+
+        Args:
+            table (dict): Maps (player total, soft, dealer up card value) to 'hit' or 'hold', as
+                          returned by StrategySolver.strategy_table. Missing entries hold.
+
+        Returns:
+            None
+        """
+        self.table = table
+
+    def action(self, hand, upcard):
+        """
+        Decides whether to hit.
+
+        Args:
+            hand (Hand): The player's hand.
+            upcard (int): The card byte of the dealer's visible card.
+
+        Returns:
+            str: 'hit' or 'hold'.
+        """
+        return self.table.get((hand.total, hand.soft, VALUES[upcard]), 'hold')
+
+
+@lru_cache(maxsize=None)
+def basic_strategy_table():
+    """
+    Solves the infinite-shoe basic-strategy table once per process.
+
+    Returns:
+        dict: The table from StrategySolver.strategy_table.
+    """
+    return StrategySolver().strategy_table()
+
+
+def make_strategy(name):
+    """
+    Builds a strategy from its name. Strategies are passed to worker processes by name.
+
+    Args:
+        name (str): 'basic' for the solved basic strategy, or 'standN' to hit below N.
+
+    Returns:
+        object: A strategy with an action(hand, upcard) method.
+
+    Raises:
+        ValueError: If the name is not recognised.
+    """
+    if name == 'basic':
+        return TableStrategy(basic_strategy_table())
+    if name.startswith('stand') and name[5:].isdigit():
+        return ThresholdStrategy(int(name[5:]))
+    raise ValueError(f"Unknown strategy '{name}', use 'basic' or 'standN'")
+
+
+def play_pair(strategy, decks, penetration, rounds, seed, shoes=None):
+    """
+    Plays one strategy's half of a pair. Every shoe of the pair is seeded from the pair seed
+    and the number of shuffles so far, so both strategies deal the same card order after each
+    reshuffle, even though they draw a different number of cards from the shoe before it.
+
+    Args:
+        strategy (object): A strategy with an action(hand, upcard) method.
+        decks (int): The number of decks in the shoe.
+        penetration (float): The fraction of the shoe dealt before the cut card is reached.
+        rounds (int): The number of rounds to play.
+        seed (str): The seed of the pair.
+        shoes (list): If given, the cards dealt from each shoe are appended to it, in order.
+
+    Returns:
+        int: The total change in credits.
+
+    Example:
+    >>> low, high = [], []
+    >>> _ = play_pair(ThresholdStrategy(12), 1, 0.75, 40, 'pair', low)
+    >>> _ = play_pair(ThresholdStrategy(19), 1, 0.75, 40, 'pair', high)
+    >>> all(a[:min(len(a), len(b))] == b[:min(len(a), len(b))] for a, b in zip(low, high))
+    True
+    """
+    shuffles = 0
+    shoe = Shoe(decks=decks, penetration=penetration, seed=f"{seed}:{shuffles}")
+    total = 0
+    for _ in range(rounds):
+        if shoe.needs_shuffle():
+            if shoes is not None:
+                shoes.append(bytes(shoe.cards[:shoe.position]))
+            shuffles += 1
+            shoe = Shoe(decks=decks, penetration=penetration, seed=f"{seed}:{shuffles}")
+        shoe.start_round()
+        total += play_round(shoe, strategy)[1]
+    if shoes is not None:
+        shoes.append(bytes(shoe.cards[:shoe.position]))
+    return total
+
+
+def run_batch(task):
+    """
+    Plays a batch of pairs in a worker process.
+
+    Args:
+        task (tuple): (strategy A name, strategy B name, decks, penetration, rounds per pair,
+                       master seed, index of the first pair, number of pairs).
+
+    Returns:
+        list: The total change in credits of A and of B for each pair.
+    """
+    name_a, name_b, decks, penetration, rounds, seed, first, count = task
+    strategies = (make_strategy(name_a), make_strategy(name_b))
+    results = []
+    for index in range(first, first + count):
+        results.append(tuple(play_pair(strategy, decks, penetration, rounds, f"{seed}:{index}")
+                             for strategy in strategies))
+    return results
+
+
+class StrategyComparison:
+    def __init__(self, strategy_a='basic', strategy_b='stand17', decks=6, penetration=0.75, rounds_per_pair=100,
+                 confidence=0.95, processes=None, seed=None, batch_size=50):
+        """
+        Initializes the comparison.
+
+        Args:
+            strategy_a (str): The name of the first strategy, see make_strategy.
+            strategy_b (str): The name of the second strategy.
+            decks (int): The number of decks in each shoe.
+            penetration (float): The fraction of the shoe dealt before reshuffling.
+            rounds_per_pair (int): The rounds each strategy plays on a pair's shoe.
+            confidence (float): The confidence level of the reported interval and of the
+                                stopping test.
+            processes (int): The number of worker processes. Defaults to one per core; 1 plays
+                             in the current process.
+            seed (int): The master seed. Pair seeds are derived from it, so results do not
+                        depend on the number of processes. A random seed is used if None.
+            batch_size (int): The number of pairs each worker plays per task.
+
+        Raises:
+            ValueError: If a strategy name is not recognised.
+        """
+        make_strategy(strategy_a)
+        make_strategy(strategy_b)
+        self.strategy_a = strategy_a
+        self.strategy_b = strategy_b
+        self.decks = decks
+        self.penetration = penetration
+        self.rounds_per_pair = rounds_per_pair
+        self.confidence = confidence
+        self.z = NormalDist().inv_cdf((1 + confidence) / 2)
+        self.processes = processes or multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.batch_size = batch_size
+
+    def tasks(self, pairs):
+        """
+        Splits a number of pairs into batch tasks.
+
+        Args:
+            pairs (int): The largest number of pairs to play.
+
+        Returns:
+            list: A list of task tuples for run_batch.
+        """
+        tasks = []
+        for start in range(0, pairs, self.batch_size):
+            tasks.append((self.strategy_a, self.strategy_b, self.decks, self.penetration, self.rounds_per_pair,
+                          self.seed, start, min(self.batch_size, pairs - start)))
+        return tasks
+
+    def stream(self, max_pairs=100000, max_seconds=None, min_pairs=30):
+        """
+        Plays pairs until the difference is significant or the budget runs out, yielding the
+        running report after every batch. Batches are consumed in order, so the stopping point
+        does not depend on the number of processes.
+
+        Args:
+            max_pairs (int): The largest number of pairs to play.
+            max_seconds (float): The longest time to run, or None for no limit.
+            min_pairs (int): The number of pairs played before the stopping test is applied.
+
+        Yields:
+            dict: The running report, see report().
+        """
+        start_time = time.perf_counter()
+        stats = RunningStats()
+        tasks = self.tasks(max_pairs)
+        if self.processes == 1:
+            batches = map(run_batch, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(self.processes)
+            batches = pool.imap(run_batch, tasks)
+        try:
+            for batch in batches:
+                for total_a, total_b in batch:
+                    stats.add(total_a / self.rounds_per_pair, total_b / self.rounds_per_pair)
+                seconds = time.perf_counter() - start_time
+                report = self.report(stats, seconds)
+                if stats.count >= min_pairs and report['significant']:
+                    report['stopped'] = 'significant'
+                elif stats.count >= max_pairs:
+                    report['stopped'] = 'pair budget'
+                elif max_seconds is not None and seconds >= max_seconds:
+                    report['stopped'] = 'time budget'
+                yield report
+                if report['stopped']:
+                    return
+        finally:
+            if pool is not None:
+                pool.terminate()
+
+    def run(self, max_pairs=100000, max_seconds=None, min_pairs=30, progress=None):
+        """
+        Runs the comparison to the end.
+
+        Args:
+            max_pairs (int): The largest number of pairs to play.
+            max_seconds (float): The longest time to run, or None for no limit.
+            min_pairs (int): The number of pairs played before the stopping test is applied.
+            progress (callable): Called with each running report, for example to print it.
+
+        Returns:
+            dict: The final report.
+        """
+        report = None
+        for report in self.stream(max_pairs, max_seconds, min_pairs):
+            if progress is not None:
+                progress(report)
+        return report
+
+    def report(self, stats, seconds):
+        """
+        Summarises the pairs played so far.
+
+        Args:
+            stats (RunningStats): The running statistics.
+            seconds (float): The time taken so far.
+
+        Returns:
+            dict: 'strategy_a', 'strategy_b', 'pairs', 'rounds', 'mean_a', 'mean_b',
+                  'difference', 'interval' (low, high), 'significant', 'correlation',
+                  'variance_reduction' (how many times fewer pairs than independent runs),
+                  'seconds', 'rounds_per_sec' and 'stopped' (None while running).
+        """
+        error = self.z * math.sqrt(stats.variance_difference() / stats.count) if stats.count > 1 else math.inf
+        difference = stats.mean_a - stats.mean_b
+        variance_difference = stats.variance_difference()
+        independent = stats.variance_a() + stats.variance_b()
+        rounds = 2 * stats.count * self.rounds_per_pair
+        return {
+            'strategy_a': self.strategy_a,
+            'strategy_b': self.strategy_b,
+            'pairs': stats.count,
+            'rounds': rounds,
+            'mean_a': stats.mean_a,
+            'mean_b': stats.mean_b,
+            'difference': difference,
+            'interval': (difference - error, difference + error),
+            'significant': abs(difference) > error,
+            'correlation': stats.correlation(),
+            'variance_reduction': independent / variance_difference if variance_difference > 0 else math.inf,
+            'seconds': seconds,
+            'rounds_per_sec': rounds / seconds if seconds else 0.0,
+            'stopped': None,
+        }
+
+
+class RunningStats:
+    __slots__ = ('count', 'mean_a', 'mean_b', 'square_a', 'square_b', 'cross')
+
+    def __init__(self):
+        """
+        Initializes empty running statistics of paired values, updated with Welford's method.
+
+        Returns:
+            None
+        """
+        self.count = 0
+        self.mean_a = 0.0
+        self.mean_b = 0.0
+        self.square_a = 0.0  # Sums of squared deviations and cross deviations from the means
+        self.square_b = 0.0
+        self.cross = 0.0
+
+    def add(self, a, b):
+        """
+        Adds one pair of values.
+
+        Args:
+            a (float): The value for strategy A.
+            b (float): The value for strategy B.
+
+        Returns:
+            None
+        """
+        self.count += 1
+        delta_a = a - self.mean_a
+        delta_b = b - self.mean_b
+        self.mean_a += delta_a / self.count
+        self.mean_b += delta_b / self.count
+        self.square_a += delta_a * (a - self.mean_a)
+        self.square_b += delta_b * (b - self.mean_b)
+        self.cross += delta_a * (b - self.mean_b)
+
+    def variance_a(self):
+        """
+        Returns the sample variance of the values for strategy A.
+
+        Returns:
+            float: The variance, 0 with fewer than two pairs.
+        """
+        return self.square_a / (self.count - 1) if self.count > 1 else 0.0
+
+    def variance_b(self):
+        """
+        Returns the sample variance of the values for strategy B.
+
+        Returns:
+            float: The variance, 0 with fewer than two pairs.
+        """
+        return self.square_b / (self.count - 1) if self.count > 1 else 0.0
+
+    def variance_difference(self):
+        """
+        Returns the sample variance of A - B.
+
+        Returns:
+            float: The variance, 0 with fewer than two pairs.
+        """
+        if self.count < 2:
+            return 0.0
+        return max(0.0, (self.square_a + self.square_b - 2 * self.cross) / (self.count - 1))
+
+    def correlation(self):
+        """
+        Returns the correlation between the paired values.
+
+        Returns:
+            float: The correlation, 0 if either side has no variance.
+        """
+        if self.square_a <= 0 or self.square_b <= 0:
+            return 0.0
+        return self.cross / math.sqrt(self.square_a * self.square_b)
+
+
+def format_report(report):
+    """
+    Formats a comparison report as one line.
+
+    Args:
+        report (dict): A report from StrategyComparison.stream or run.
+
+    Returns:
+        str: The report as readable text.
+    """
+    low, high = report['interval']
+    line = (f"{report['pairs']:6d} pairs  A {report['mean_a']:+.4f}  B {report['mean_b']:+.4f}  "
+            f"A-B {report['difference']:+.4f} [{low:+.4f}, {high:+.4f}]  corr {report['correlation']:.2f}  "
+            f"{report['rounds_per_sec']:,.0f} rounds/s")
+    if report['stopped']:
+        line += f"  stopped: {report['stopped']}"
+    return line
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two Blackjack strategies on identical shoes.")
+    parser.add_argument("strategy_a", nargs='?', default='basic', help="first strategy: 'basic' or 'standN'")
+    parser.add_argument("strategy_b", nargs='?', default='stand17', help="second strategy: 'basic' or 'standN'")
+    parser.add_argument("--decks", type=int, default=6, help="decks per shoe")
+    parser.add_argument("--rounds", type=int, default=100, help="rounds per pair")
+    parser.add_argument("--max-pairs", type=int, default=100000, help="pair budget")
+    parser.add_argument("--max-seconds", type=float, default=None, help="time budget")
+    parser.add_argument("--confidence", type=float, default=0.95, help="confidence level")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--seed", type=int, default=None, help="master seed")
+    args = parser.parse_args()
+
+    comparison = StrategyComparison(args.strategy_a, args.strategy_b, decks=args.decks, rounds_per_pair=args.rounds,
+                                    confidence=args.confidence, processes=args.processes, seed=args.seed)
+    comparison.run(args.max_pairs, args.max_seconds, progress=lambda report: print(format_report(report)))
@@ -0,0 +1,541 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class computes the exact expected value of hitting and holding in Blackjack under the
+# rules of BlackjackGame.player_turn: the dealer's second card is drawn when the player holds, the dealer
+# draws until reaching 17, and the payouts are the same. Results depend on the cards left in the shoe, and
+# the dealer always draws from the shoe less every card the player hit. The dealer's final-total
+# distributions are memoized by shoe composition in a bounded LRU cache, and every hand reachable by hitting
+# is solved at once, so the hint after each card the player hits is a lookup. It can also build a full
+# basic-strategy table for the simulators.
+
+from functools import lru_cache
+import numpy as np
+
+from Card import VALUES
+
+# Net result per unit bet of each outcome in BlackjackGame.player_turn
+PAYOUTS = {'player': 2.0, 'tie': 1.0, 'dealer': -1.0, 'bust': -1.0}
+
+# Probability of each card value (1 = ace, 10 = ten or face card) in an infinite shoe
+INFINITE_PROBABILITIES = tuple([(value, 1 / 13) for value in range(1, 10)] + [(10, 4 / 13)])
+
+# Dealer final totals, in the order of the distributions returned by dealer_outcome; 22 stands for a bust
+DEALER_TOTALS = (17, 18, 19, 20, 21, 22)
+
+
+class StrategySolver:
+    def __init__(self, decks=None, payouts=None, cache_size=200000):
+        """
+        Initializes the solver.
+
+        Args:
+            decks (int): The number of decks used for the basic-strategy table and for hands
+                         evaluated without a composition. None assumes an infinite shoe.
+            payouts (dict): The net result per unit bet of 'player', 'tie', 'dealer' and 'bust'.
+                            Defaults to the payouts of BlackjackGame.player_turn.
+            cache_size (int): The largest number of dealer distributions and player positions
+                              each kept in the LRU caches.
+
+        Returns:
+            None
+        """
+        self.decks = decks
+        self.payouts = dict(PAYOUTS, **(payouts or {}))
+        # Net result of holding on each player total against each dealer final total
+        self.payoff_matrix = np.array([[self.payouts['player'] if dealer_total > 21 or dealer_total < total else
+                                        self.payouts['tie'] if dealer_total == total else self.payouts['dealer']
+                                        for dealer_total in DEALER_TOTALS] for total in range(22)])
+        self.dealer_outcome = lru_cache(maxsize=cache_size)(self.compute_dealer_outcome)
+        self.stand_values = lru_cache(maxsize=cache_size)(self.compute_stand_values)
+        self.hit_value = lru_cache(maxsize=cache_size)(self.compute_hit_value)
+        self.last_solved = None
+
+    def full_composition(self):
+        """
+        Returns the composition of a full shoe.
+
+        Returns:
+            tuple: The number of cards of each value from ace to ten, or None for an infinite shoe.
+        """
+        if self.decks is None:
+            return None
+        return tuple([4 * self.decks] * 9 + [16 * self.decks])
+
+    def dealer_distribution(self, upcard, composition=None):
+        """
+        Computes the probabilities of the dealer's final totals.
+
+        Args:
+            upcard (int): The card byte of the dealer's visible card.
+            composition (tuple): The cards of each value from ace to ten left in the shoe, or
+                                 None for an infinite shoe.
+
+        Returns:
+            dict: The probability of each final total from 17 to 21 and of 'bust'.
+        """
+        distribution = self.dealer_outcome(VALUES[upcard], composition)
+        return {('bust' if total == 22 else total): chance for total, chance in zip(DEALER_TOTALS, distribution)}
+
+    def compute_dealer_outcome(self, upcard_value, composition):
+        """
+        Computes the dealer's final-total distribution, drawing the second card and then drawing
+        to 17 without replacement. Use dealer_outcome, which caches the results.
+
+        Every draw sequence the dealer can make from the up card is listed once by dealer_tree,
+        so the distribution for a shoe is the product of each sequence's draw probabilities,
+        summed by final total, computed one draw at a time across all sequences.
+
+        Args:
+            upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+            composition (tuple): The cards of each value left in the shoe, or None for an infinite shoe.
+
+        Returns:
+            tuple: The probabilities of the totals in DEALER_TOTALS.
+        """
+        if composition is None or sum(composition) == 0:
+            chances = np.array([0.0] + [chance for _, chance in INFINITE_PROBABILITIES])
+            counts = None
+        else:
+            counts = np.array((0,) + tuple(composition), dtype=float)
+            cards = sum(composition)
+        outcome = np.zeros(6)
+        weights = np.ones(1)
+        for step, (parents, values, seen, finals, drawing) in enumerate(dealer_tree(upcard_value)):
+            if counts is None:
+                factors = chances[values]
+            else:
+                # The next card of a value is one of count - seen among the cards - step left
+                factors = np.maximum(counts[values] - seen, 0.0) / max(cards - step, 1)
+            weights = weights[parents] * factors
+            ended = finals >= 0
+            outcome += np.bincount(finals[ended], weights=weights[ended], minlength=6)
+            weights = weights[drawing]
+        return tuple(outcome.tolist())
+
+    def stand_value(self, total, upcard_value, composition):
+        """
+        Computes the expected value of holding.
+
+        Args:
+            total (int): The player's total.
+            upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+            composition (tuple): The cards left in the shoe, or None for an infinite shoe.
+
+        Returns:
+            float: The expected net result per unit bet.
+        """
+        return self.stand_values(upcard_value, composition)[min(total, 21)]
+
+    def compute_stand_values(self, upcard_value, composition):
+        """
+        Computes the expected value of holding on every total from 0 to 21. Use stand_values,
+        which caches the results.
+
+        Args:
+            upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+            composition (tuple): The cards left in the shoe, or None for an infinite shoe.
+
+        Returns:
+            tuple: The expected net result per unit bet, indexed by the player's total.
+        """
+        distribution = np.array(self.dealer_outcome(upcard_value, composition))
+        return tuple((self.payoff_matrix @ distribution).tolist())
+
+    def compute_hit_value(self, hard, aces, upcard_value, composition):
+        """
+        Computes the expected value of hitting once and then playing on perfectly. Use hit_value,
+        which caches the results.
+
+        Every hand the player can reach by hitting is solved at once, one level per card hit,
+        from the deepest level up. Holding on a hand is scored against the dealer's distribution
+        for the shoe less the cards the player hit to reach it, so the result is exact. Those
+        distributions come from outcomes_after_hits, and the hands and dealer draws they are
+        built from depend only on the starting hand and up card, so they are listed once.
+
+        Args:
+            hard (int): The player's total with every ace counted as 1.
+            aces (bool): True if the player holds an ace.
+            upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+            composition (tuple): The cards left for the player to draw, or None for an infinite shoe.
+
+        Returns:
+            float: The expected net result per unit bet.
+        """
+        if composition is not None and sum(composition) == 0:
+            composition = None
+        if composition is not None:
+            value = self.solved_hit_value(hard, aces, upcard_value, composition)
+            if value is not None:
+                return value
+        hands, levels, totals, children, hits, bounds = player_tree(hard, aces)
+        if composition is None:
+            factors = np.broadcast_to([chance for _, chance in INFINITE_PROBABILITIES], (len(hands), 10))
+            outcomes = np.broadcast_to(self.dealer_outcome(upcard_value, None), (len(hands), 6))
+        else:
+            counts = np.array(composition, dtype=float)
+            # The chance of hitting each value from each hand, from the cards the hand leaves
+            factors = np.maximum(counts - hands, 0.0) / np.maximum(counts.sum() - levels, 1.0)[:, None]
+            outcomes = outcomes_after_hits(hard, aces, upcard_value, counts)
+        holds = np.einsum('ij,ij->i', outcomes, self.payoff_matrix[totals])
+        hit_values = np.empty(len(hands))
+        # values holds the value of playing on from each hand, then the bust payout for a child of -1
+        values = np.empty(len(hands) + 1)
+        values[-1] = self.payouts['bust']
+        for start, end in zip(bounds[-2::-1], bounds[:0:-1]):
+            hit_values[start:end] = np.einsum('ij,ij->i', factors[start:end], values[children[start:end]])
+            values[start:end] = np.maximum(holds[start:end], hit_values[start:end] + hits[start:end])
+        if composition is not None:
+            self.last_solved = (hard, aces, upcard_value, counts, hit_values)
+        return float(hit_values[0])
+
+    def solved_hit_value(self, hard, aces, upcard_value, composition):
+        """
+        Looks up the value of hitting in the hands solved by the last call to compute_hit_value.
+        After the player hits, the new hand and the shoe less the card hit were solved with the
+        hand before it, so the hint for every card after the first is a lookup.
+
+        Args:
+            hard (int): The player's total with every ace counted as 1.
+            aces (bool): True if the player holds an ace.
+            upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+            composition (tuple): The cards left for the player to draw.
+
+        Returns:
+            float: The expected net result per unit bet, or None if the hand was not solved.
+        """
+        if self.last_solved is None:
+            return None
+        start_hard, start_aces, start_upcard, start_counts, hit_values = self.last_solved
+        drawn = start_counts - composition
+        if upcard_value != start_upcard or drawn.min() < 0 or \
+                hard != start_hard + drawn @ np.arange(1, 11) or aces != (start_aces or drawn[0] > 0):
+            return None
+        position = hand_index(start_hard, start_aces).get(tuple(drawn.astype(int).tolist()))
+        if position is None or player_tree(start_hard, start_aces)[4][position]:
+            return None  # Not reached, or a hand on 21 whose hit was not played out
+        return float(hit_values[position])
+
+    def evaluate(self, hand, upcard, composition=None):
+        """
+        Computes the expected value of hitting and holding for a hand in play.
+
+        Args:
+            hand (list): The player's card bytes. None entries are skipped.
+            upcard (int): The card byte of the dealer's visible card.
+            composition (tuple): The cards left in the shoe. Defaults to the solver's full shoe
+                                 less the visible cards.
+
+        Returns:
+            dict: 'hit' and 'hold' expected values and 'best', the better action.
+        """
+        values = [VALUES[card] for card in hand if card is not None]
+        upcard_value = VALUES[upcard]
+        if composition is None and self.decks is not None:
+            composition = remove_cards(self.full_composition(), values + [upcard_value])
+        hard = sum(values)
+        aces = 1 in values
+        total = hard + 10 if aces and hard + 10 <= 21 else hard
+        if hard > 21:
+            return {'hit': self.payouts['bust'], 'hold': self.payouts['bust'], 'best': 'hold'}
+        hold = self.stand_value(total, upcard_value, composition)
+        hit = self.hit_value(hard, aces, upcard_value, composition)
+        return {'hit': hit, 'hold': hold, 'best': 'hit' if hit > hold else 'hold'}
+
+    def strategy_table(self):
+        """
+        Builds a basic-strategy table for every player total, soft flag and dealer up card. Each
+        entry is solved for the full shoe less the up card.
+
+        Returns:
+            dict: Maps (player total, soft, dealer up card value) to 'hit' or 'hold', in the
+                  format accepted by Simulator.strategy_from_dict.
+        """
+        table = {}
+        full = self.full_composition()
+        for upcard_value in range(1, 11):
+            composition = remove_cards(full, [upcard_value]) if full is not None else None
+            for soft in (False, True):
+                for total in range(12 if soft else 4, 22):
+                    hard = total - 10 if soft else total
+                    hold = self.stand_value(total, upcard_value, composition)
+                    hit = self.hit_value(hard, soft, upcard_value, composition)
+                    table[(total, soft, upcard_value)] = 'hit' if hit > hold else 'hold'
+        return table
+
+
+@lru_cache(maxsize=None)
+def dealer_tree(upcard_value):
+    """
+    Lists every sequence of cards the dealer can draw after an up card, as a tree stored one
+    level per draw so that shared prefixes are only evaluated once.
+
+    Args:
+        upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+
+    Returns:
+        list: One (parents, values, seen, finals, drawing) tuple of arrays per draw. parents
+              indexes the drawing nodes of the previous level, values is the card drawn, seen is
+              how many cards of the same value were drawn before it, finals is the index of the
+              final total in DEALER_TOTALS or -1 if the dealer keeps drawing, and drawing lists
+              the nodes that carry on to the next level.
+    """
+    levels = []
+    frontier = [(upcard_value, upcard_value == 1, ())]  # Hard total, ace held, values drawn so far
+    while frontier:
+        parents, values, seen, finals = [], [], [], []
+        next_frontier = []
+        for index, (hard, aces, drawn) in enumerate(frontier):
+            for card in range(1, 11):
+                new_hard = hard + card
+                new_aces = aces or card == 1
+                total = new_hard + 10 if new_aces and new_hard + 10 <= 21 else new_hard
+                parents.append(index)
+                values.append(card)
+                seen.append(drawn.count(card))
+                if total >= 17:
+                    finals.append(min(total, 22) - 17)
+                else:
+                    finals.append(-1)
+                    next_frontier.append((new_hard, new_aces, drawn + (card,)))
+        finals = np.array(finals, dtype=np.intp)
+        levels.append((np.array(parents, dtype=np.intp), np.array(values, dtype=np.intp),
+                       np.array(seen, dtype=float), finals, np.flatnonzero(finals < 0)))
+        frontier = next_frontier
+    return levels
+
+
+@lru_cache(maxsize=None)
+def dealer_hands(upcard_value):
+    """
+    Lists every set of cards the dealer can draw after an up card, ignoring their order. Drawing
+    without replacement, every order of the same cards is equally likely, so the dealer's
+    distribution is a sum over these sets of the chance of one order times the number of orders
+    the dealer can draw them in.
+
+    Args:
+        upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+
+    Returns:
+        tuple: (counts, finals, orders) arrays with one row per set. counts is the cards of each
+               value from ace to ten, finals the index of the final total in DEALER_TOTALS and
+               orders the number of draw sequences that give the set.
+    """
+    orders = {}
+    finals = {}
+    frontier = [(upcard_value, upcard_value == 1, (0,) * 10)]
+    while frontier:
+        next_frontier = []
+        for hard, aces, drawn in frontier:
+            for card in range(1, 11):
+                new_hard = hard + card
+                new_aces = aces or card == 1
+                total = new_hard + 10 if new_aces and new_hard + 10 <= 21 else new_hard
+                new_drawn = drawn[:card - 1] + (drawn[card - 1] + 1,) + drawn[card:]
+                if total >= 17:
+                    orders[new_drawn] = orders.get(new_drawn, 0) + 1
+                    finals[new_drawn] = min(total, 22) - 17
+                else:
+                    next_frontier.append((new_hard, new_aces, new_drawn))
+        frontier = next_frontier
+    sets = list(orders)
+    return (np.array(sets, dtype=np.intp), np.array([finals[drawn] for drawn in sets], dtype=np.intp),
+            np.array([orders[drawn] for drawn in sets], dtype=float))
+
+
+@lru_cache(maxsize=None)
+def player_tree(hard, aces):
+    """
+    Lists every hand the player can reach by hitting, level by level, one level per card hit.
+    Hands holding the same cards hit in another order are listed once, since they leave the
+    same shoe.
+
+    Args:
+        hard (int): The player's total with every ace counted as 1.
+        aces (bool): True if the player holds an ace.
+
+    Returns:
+        tuple: (hands, levels, totals, children, hits, bounds) arrays with one row per hand. hands
+               is the cards of each value hit so far, levels the number of cards hit, totals the
+               player's total, children the index of the hand after hitting each value from ace to
+               ten, or -1 if it busts, and hits 0 if the hand may hit or -inf if it stands on 21.
+               The first hand is the starting hand, which always may hit. bounds lists where each
+               level starts, and ends with the number of hands.
+    """
+    hands, totals, children, hits, bounds = [], [], [], [], [0]
+    index = {(0,) * 10: 0}
+    frontier = [(0,) * 10]
+    while frontier:
+        for drawn in frontier:
+            new_hard = hard + sum(count * (value + 1) for value, count in enumerate(drawn))
+            new_aces = aces or drawn[0] > 0
+            total = new_hard + 10 if new_aces and new_hard + 10 <= 21 else new_hard
+            hands.append(drawn)
+            totals.append(total)
+            hits.append(0.0 if total < 21 or len(hands) == 1 else -np.inf)
+            row = []
+            for card in range(1, 11):
+                if hits[-1] or new_hard + card > 21:
+                    row.append(-1)
+                    continue
+                new_drawn = drawn[:card - 1] + (drawn[card - 1] + 1,) + drawn[card:]
+                row.append(index.setdefault(new_drawn, len(index)))
+            children.append(row)
+        frontier = list(index)[len(hands):]
+        bounds.append(len(hands))
+    levels = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+    return (np.array(hands, dtype=float), levels, np.array(totals, dtype=np.intp), np.array(children, dtype=np.intp),
+            np.array(hits), bounds)
+
+
+@lru_cache(maxsize=None)
+def hand_index(hard, aces):
+    """
+    Indexes the hands of player_tree by the cards hit.
+
+    Args:
+        hard (int): The player's total with every ace counted as 1.
+        aces (bool): True if the player holds an ace.
+
+    Returns:
+        dict: Maps the cards of each value hit, as a tuple, to the index of the hand.
+    """
+    return {tuple(drawn): index for index, drawn in enumerate(player_tree(hard, aces)[0].astype(int).tolist())}
+
+
+@lru_cache(maxsize=None)
+def outcome_plan(hard, aces, upcard_value):
+    """
+    Plans the sum behind outcomes_after_hits. For every hand in player_tree and every dealer set
+    in dealer_hands, the chance of the set depends on the shoe through one factor per card value,
+    a falling factorial of the cards of that value left after the hand. The plan sums those
+    products one value at a time from the tens down, so the hands sharing the counts of the
+    values summed so far share the work, as do the sets sharing the counts of the values still
+    to sum. The player rarely hits high cards, so few hands differ in the values summed first.
+
+    Args:
+        hard (int): The player's total with every ace counted as 1.
+        aces (bool): True if the player holds an ace.
+        upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+
+    Returns:
+        tuple: (weights, steps, rows, sizes, finals). weights is the number of orders of each
+               set, in the order the sum starts from. steps has one (positions, groups, width,
+               parents, hits) tuple per value: the slot of each column of the table in a grid of
+               groups rows and width columns, one per count of the value in the set, that the
+               value is summed over; then the row of the table and the count of the value hit
+               for each row of the next table. rows maps every hand to its row of the last table,
+               whose columns are sets with the sizes in sizes and the final totals one-hot
+               encoded in finals.
+    """
+    counts, finals, orders = dealer_hands(upcard_value)
+    hands = player_tree(hard, aces)[0].astype(np.intp)
+    sizes = counts.sum(axis=1)
+    # Sorting by final total, size and then the values summed last keeps every column group contiguous
+    order = np.lexsort([counts[:, value] for value in range(9, -1, -1)] + [sizes, finals])
+    keys = np.column_stack([finals, sizes, counts])[order]
+    steps = []
+    columns = np.arange(len(keys))
+    parents = np.zeros(len(hands), dtype=np.intp)
+    for step, value in enumerate(range(9, -1, -1)):
+        # Columns that differ only in the count of this value fall into the same group
+        group = np.cumsum(np.r_[False, np.any(keys[columns[1:], :11 - step] != keys[columns[:-1], :11 - step],
+                                              axis=1)])
+        width = keys[:, 2 + value].max() + 1
+        prefixes, first, rows = np.unique(hands[:, value:], axis=0, return_index=True, return_inverse=True)
+        steps.append((group * width + keys[columns, 2 + value], group[-1] + 1, width, parents[first], prefixes[:, 0]))
+        parents = rows.reshape(-1)
+        columns = columns[np.r_[True, group[1:] != group[:-1]]]
+    return (orders[order][None, :], steps, parents, keys[columns, 1], np.eye(6)[keys[columns, 0]])
+
+
+def outcomes_after_hits(hard, aces, upcard_value, counts):
+    """
+    Computes the dealer's final-total distribution for every hand the player can reach by hitting,
+    each drawn from the shoe less the cards the player hit.
+
+    Args:
+        hard (int): The player's total with every ace counted as 1.
+        aces (bool): True if the player holds an ace.
+        upcard_value (int): The value of the dealer's visible card, from 1 to 10.
+        counts (ndarray): The cards of each value left in the shoe before the player hits.
+
+    Returns:
+        ndarray: The probabilities of the totals in DEALER_TOTALS for each hand of player_tree.
+    """
+    table, steps, rows, sizes, finals = outcome_plan(hard, aces, upcard_value)
+    levels = player_tree(hard, aces)[1]
+    # Falling factorials of the cards left of each value, by cards the player hit and cards the dealer draws
+    left = np.maximum(counts[:, None] - np.arange(max(step[4][-1] for step in steps) + 1), 0.0)
+    factorials = np.ones(left.shape + (sizes.max() + 1,))
+    factorials[:, :, 1:] = np.cumprod(left[:, :, None] - np.arange(sizes.max()), axis=2)
+    for value, (positions, groups, width, parents, hits) in zip(range(9, -1, -1), steps):
+        grid = np.zeros((len(table), groups * width))
+        grid[:, positions] = table
+        grid = grid.reshape(-1, width) @ factorials[value, :hits[-1] + 1, :width].T
+        table = grid.reshape(len(table), groups, -1)[parents, :, hits]
+    # Divide by the falling factorial of all the cards left, which depends only on the hits and set size
+    left = counts.sum() - np.arange(levels[-1] + 1)[:, None] - np.arange(sizes.max())
+    totals = np.cumprod(left, axis=1)[:, sizes - 1]
+    totals[totals <= 0] = 1.0
+    return (table[rows] / totals[levels]) @ finals
+
+
+def remove_cards(composition, values):
+    """
+    Removes cards from a composition.
+
+    Args:
+        composition (tuple): The cards of each value from ace to ten.
+        values (list): The values, from 1 to 10, of the cards to remove.
+
+    Returns:
+        tuple: The new composition.
+    """
+    counts = list(composition)
+    for value in values:
+        if counts[value - 1]:
+            counts[value - 1] -= 1
+    return tuple(counts)
+
+
+def shoe_composition(shoe):
+    """
+    Counts the undealt cards of a Shoe by value.
+
+    Args:
+        shoe (Shoe): The shoe.
+
+    Returns:
+        tuple: The number of undealt cards of each value from ace to ten.
+    """
+    counts = [0] * 10
+    for card in shoe.cards[shoe.position:]:
+        counts[VALUES[card] - 1] += 1
+    return tuple(counts)
+
+
+def format_table(table):
+    """
+    Formats a strategy table as a grid of H (hit) and S (hold) per dealer up card.
+
+    Args:
+        table (dict): A table returned by StrategySolver.strategy_table.
+
+    Returns:
+        str: The hard totals followed by the soft totals.
+    """
+    lines = ["       " + " ".join(f"{card:>2}" for card in range(2, 11)) + "  A"]
+    for soft in (False, True):
+        for total in range(12 if soft else 4, 22):
+            cells = [" H" if table[(total, soft, card)] == 'hit' else " S" for card in list(range(2, 11)) + [1]]
+            lines.append(f"{'Soft' if soft else 'Hard'} {total:>2}" + " ".join(cells))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Print the basic-strategy table for the game's rules.")
+    parser.add_argument('--decks', type=int, default=None, help="Decks in the shoe (default: infinite shoe)")
+    args = parser.parse_args()
+    print(format_table(StrategySolver(decks=args.decks).strategy_table()))
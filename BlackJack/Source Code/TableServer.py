@@ -0,0 +1,712 @@
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class hosts many Blackjack tables over TCP with asyncio. Each table has several seats
+# that share one shoe, and a round scheduler collects bets, deals, gives each seat its turn in order and
+# then plays the dealer, using the rules and payouts of BlackjackGame.player_turn. Betting and actions
+# have timeouts scheduled on the event loop, and a player who does not act in time holds. The module also
+# contains a load generator that fills tables from localhost and reports action latency percentiles.
+#
+# Protocol, one line of ASCII per message:
+#   client -> server: BET <amount> | HIT | HOLD | QUIT
+#   server -> client: SEATED <table> <seat> <credits> | BET (bets are open)
+#                     BETOK <amount> | DEAL <card> <card> <dealer up card> <total>
+#                     TURN | CARD <card> <total> | STAND <total> | BUST <credits>
+#                     DEALER <card> <card> ... | RESULT <player|dealer|tie> <credits>
+#                     TIMEOUT | BROKE | ERROR <message>
+# Cards are sent as card bytes: rank (1 for ace to 13 for king) + 16 * suit, see Card.encode. A peer that
+# sends more than MAX_LINE bytes without a newline is disconnected.
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import time
+
+from BlackjackGame import PAYOUTS, settle
+from Dealer import Dealer
+from Hand import Hand
+from Shoe import Shoe
+
+MAX_LINE = 4096  # Longest unterminated line kept in a connection's buffer
+
+
+class Seat:
+    __slots__ = ('connection', 'table', 'index', 'credits', 'bet', 'hand', 'playing')
+
+    def __init__(self, connection, table, index, credits):
+        """
+        Initializes a seat taken by a connected player.
+
+        Args:
+            connection (SeatConnection): The player's connection.
+            table (Table): The table of the seat.
+            index (int): The position of the seat at the table.
+            credits (int): The player's starting credits.
+
+        Returns:
+            None
+        """
+        self.connection = connection
+        self.table = table
+        self.index = index
+        self.credits = credits
+        self.bet = 0
+        self.hand = None
+        self.playing = False  # True while the seat has an unfinished hand this round
+
+
+class Table:
+    __slots__ = ('number', 'seats', 'shoe', 'dealer', 'phase', 'turn', 'timer', 'rounds')
+
+    def __init__(self, number, seats, shoe):
+        """
+        Initializes an empty table.
+
+        Args:
+            number (int): The table number.
+            seats (int): The number of seats.
+            shoe (Shoe): The shoe shared by every seat.
+
+        Returns:
+            None
+        """
+        self.number = number
+        self.seats = [None] * seats
+        self.shoe = shoe
+        self.dealer = Dealer()
+        self.phase = 'idle'  # 'idle', 'betting' or 'playing'
+        self.turn = -1  # Index of the seat whose turn it is
+        self.timer = None  # Pending bet or action timeout handle
+        self.rounds = 0
+
+    def occupied(self):
+        """
+        Lists the taken seats.
+
+        Returns:
+            list: The Seat objects at the table.
+        """
+        return [seat for seat in self.seats if seat is not None]
+
+
+class SeatConnection(asyncio.Protocol):
+    __slots__ = ('server', 'transport', 'seat', 'buffer')
+
+    def __init__(self, server):
+        """
+        Initializes the connection of one player.
+
+        Args:
+            server (TableServer): The server that accepted the connection.
+
+        Returns:
+            None
+        """
+        self.server = server
+        self.transport = None
+        self.seat = None
+        self.buffer = b''
+
+    def connection_made(self, transport):
+        """
+        Seats the player at a table.
+
+        Args:
+            transport (asyncio.Transport): The connection transport.
+
+        Returns:
+            None
+        """
+        self.transport = transport
+        self.server.join(self)
+
+    def data_received(self, data):
+        """
+        Splits incoming data into lines and handles each command. The connection is closed if
+        a line grows past MAX_LINE bytes.
+
+        Args:
+            data (bytes): The bytes received.
+
+        Returns:
+            None
+        """
+        self.buffer += data
+        while b'\n' in self.buffer:
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            self.server.handle(self, line.split())
+        if len(self.buffer) > MAX_LINE:
+            self.buffer = b''
+            self.send(b'ERROR line too long')
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        """
+        Frees the player's seat.
+
+        Args:
+            exc (Exception): The error that closed the connection, or None.
+
+        Returns:
+            None
+        """
+        self.server.leave(self)
+
+    def send(self, message):
+        """
+        Sends one line to the player.
+
+        Args:
+            message (bytes): The line, without the newline.
+
+        Returns:
+            None
+        """
+        if not self.transport.is_closing():
+            self.transport.write(message + b'\n')
+
+
+class TableServer:
+    def __init__(self, host='127.0.0.1', port=8766, seats_per_table=5, decks=6, penetration=0.75, credits=50,
+                 bet_timeout=10.0, action_timeout=10.0, seed=None):
+        """
+        Initializes the server.
+
+        Args:
+            host (str): The address to listen on.
+            port (int): The port to listen on.
+            seats_per_table (int): The number of seats at each table.
+            decks (int): The number of decks in each table's shoe.
+            penetration (float): The fraction of a shoe dealt before it is reshuffled.
+            credits (int): The credits each player starts with.
+            bet_timeout (float): Seconds players have to bet before the cards are dealt without them.
+            action_timeout (float): Seconds a player has to hit or hold before holding automatically.
+            seed (int): The seed for the tables' shoes.
+
+        Returns:
+            None
+        """
+        self.host = host
+        self.port = port
+        self.seats_per_table = seats_per_table
+        self.decks = decks
+        self.penetration = penetration
+        self.credits = credits
+        self.bet_timeout = bet_timeout
+        self.action_timeout = action_timeout
+        self.rng = random.Random(seed)
+        self.tables = []
+        self.rounds = 0  # Rounds completed since the server started
+        self.actions = 0  # Bets, hits and holds handled since the server started
+        self.server = None
+
+    async def start(self):
+        """
+        Starts listening for players.
+        """
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(lambda: SeatConnection(self), self.host, self.port)
+
+    async def serve_forever(self):
+        """
+        Starts the server and runs until cancelled.
+        """
+        await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def join(self, connection):
+        """
+        Seats a new player at the first table with a free seat, opening a table if needed.
+
+        Args:
+            connection (SeatConnection): The player who connected.
+
+        Returns:
+            None
+        """
+        for table in self.tables:
+            if None in table.seats:
+                break
+        else:
+            shoe = Shoe(decks=self.decks, penetration=self.penetration, seed=self.rng.randrange(2 ** 32))
+            table = Table(len(self.tables), self.seats_per_table, shoe)
+            self.tables.append(table)
+        index = table.seats.index(None)
+        seat = Seat(connection, table, index, self.credits)
+        table.seats[index] = seat
+        connection.seat = seat
+        connection.send(b'SEATED %d %d %d' % (table.number, index, seat.credits))
+        if table.phase == 'idle':
+            self.start_round(table)
+        elif table.phase == 'betting':
+            connection.send(b'BET')
+
+    def leave(self, connection):
+        """
+        Frees the seat of a player who disconnected. A hand in progress is forfeited.
+
+        Args:
+            connection (SeatConnection): The player who left.
+
+        Returns:
+            None
+        """
+        seat = connection.seat
+        if seat is None:
+            return
+        connection.seat = None
+        table = seat.table
+        table.seats[seat.index] = None
+        seat.playing = False
+        if not table.occupied():
+            self.cancel_timer(table)
+            table.phase = 'idle'
+        elif table.phase == 'betting' and all(other.bet for other in table.occupied()):
+            self.deal(table)
+        elif table.phase == 'playing' and table.turn == seat.index:
+            self.next_turn(table)
+
+    def handle(self, connection, words):
+        """
+        Handles one command from a player.
+
+        Args:
+            connection (SeatConnection): The player who sent the command.
+            words (list): The command split into words.
+
+        Returns:
+            None
+        """
+        seat = connection.seat
+        if not words or seat is None:
+            return
+        command = words[0]
+        table = seat.table
+        if command == b'QUIT':
+            connection.transport.close()
+        elif command == b'BET':
+            if table.phase != 'betting' or seat.bet:
+                connection.send(b'ERROR bets are closed')
+                return
+            try:
+                amount = int(words[1])
+            except (IndexError, ValueError):
+                connection.send(b'ERROR invalid bet')
+                return
+            if not 0 < amount <= seat.credits:
+                connection.send(b'ERROR invalid bet')
+                return
+            self.actions += 1
+            seat.bet = amount
+            connection.send(b'BETOK %d' % amount)
+            if all(other.bet for other in table.occupied()):
+                self.deal(table)
+        elif command in (b'HIT', b'HOLD'):
+            if table.phase != 'playing' or table.turn != seat.index:
+                connection.send(b'ERROR not your turn')
+                return
+            self.actions += 1
+            if command == b'HIT':
+                self.hit(table, seat)
+            else:
+                connection.send(b'STAND %d' % seat.hand.total)
+                self.next_turn(table)
+        else:
+            connection.send(b'ERROR unknown command')
+
+    def cancel_timer(self, table):
+        """
+        Cancels the pending timeout of a table.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        if table.timer is not None:
+            table.timer.cancel()
+            table.timer = None
+
+    def schedule(self, table, delay, callback):
+        """
+        (Re)starts the timeout of a table.
+
+        Args:
+            table (Table): The table.
+            delay (float): Seconds until the timeout.
+            callback (callable): Called with the table when the timeout expires.
+
+        Returns:
+            None
+        """
+        self.cancel_timer(table)
+        table.timer = asyncio.get_running_loop().call_later(delay, callback, table)
+
+    def start_round(self, table):
+        """
+        Opens the bets for a new round.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        if not table.occupied():
+            table.phase = 'idle'
+            return
+        table.phase = 'betting'
+        for seat in table.occupied():
+            seat.bet = 0
+            seat.hand = None
+            seat.connection.send(b'BET')
+        self.schedule(table, self.bet_timeout, self.close_betting)
+
+    def close_betting(self, table):
+        """
+        Deals the round when the bet timeout expires, without the players who did not bet.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        table.timer = None
+        if any(seat.bet for seat in table.occupied()):
+            self.deal(table)
+        else:
+            self.start_round(table)
+
+    def deal(self, table):
+        """
+        Deals two cards to every seat that bet and the dealer's up card, then starts the turns.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        self.cancel_timer(table)
+        shoe = table.shoe
+        shoe.start_round()
+        table.phase = 'playing'
+        seats = [seat for seat in table.occupied() if seat.bet]
+        for seat in seats:
+            seat.hand = Hand([shoe.draw_card(), shoe.draw_card()])
+            seat.playing = True
+        table.dealer.hand = [shoe.draw_card(), None]  # Dealer's second card is drawn after the turns
+        upcard = table.dealer.hand[0]
+        for seat in seats:
+            seat.connection.send(b'DEAL %d %d %d %d' % (seat.hand[0], seat.hand[1], upcard, seat.hand.total))
+        table.turn = -1
+        self.next_turn(table)
+
+    def next_turn(self, table):
+        """
+        Gives the turn to the next seat with an unfinished hand, or plays the dealer.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        if table.turn >= 0 and table.seats[table.turn] is not None:
+            table.seats[table.turn].playing = False
+        for index in range(table.turn + 1, len(table.seats)):
+            seat = table.seats[index]
+            if seat is not None and seat.playing:
+                table.turn = index
+                seat.connection.send(b'TURN')
+                self.schedule(table, self.action_timeout, self.action_timeout_expired)
+                return
+        self.finish_round(table)
+
+    def action_timeout_expired(self, table):
+        """
+        Holds for the player whose turn it is after they ran out of time.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        table.timer = None
+        seat = table.seats[table.turn]
+        if seat is not None:
+            seat.connection.send(b'TIMEOUT')
+            seat.connection.send(b'STAND %d' % seat.hand.total)
+        self.next_turn(table)
+
+    def hit(self, table, seat):
+        """
+        Deals a card to the seat whose turn it is, settling the bet if the hand busts.
+
+        Args:
+            table (Table): The table.
+            seat (Seat): The seat that hit.
+
+        Returns:
+            None
+        """
+        card = table.shoe.draw_card()
+        seat.hand.append(card)
+        seat.connection.send(b'CARD %d %d' % (card, seat.hand.total))
+        if seat.hand.total > 21:
+            seat.credits += PAYOUTS['bust'] * seat.bet
+            seat.connection.send(b'BUST %d' % seat.credits)
+            seat.hand = None  # Settled; the dealer's result does not apply
+            self.next_turn(table)
+        else:
+            self.schedule(table, self.action_timeout, self.action_timeout_expired)
+
+    def finish_round(self, table):
+        """
+        Plays the dealer's hand, settles every remaining bet and opens the next round.
+
+        Args:
+            table (Table): The table.
+
+        Returns:
+            None
+        """
+        self.cancel_timer(table)
+        dealer = table.dealer
+        standing = [seat for seat in table.occupied() if seat.bet and seat.hand is not None]
+        if standing:
+            dealer.hand[1] = table.shoe.draw_card()
+            dealer.play(table.shoe)
+            dealer_cards = b'DEALER ' + b' '.join(b'%d' % card for card in dealer.hand)
+            dealer_total = dealer.calculate_total()
+            for seat in standing:
+                result = settle(seat.hand.total, dealer_total)
+                seat.credits += PAYOUTS[result] * seat.bet
+                seat.connection.send(dealer_cards)
+                seat.connection.send(b'RESULT %s %d' % (result.encode(), seat.credits))
+        for seat in table.occupied():
+            if seat.credits <= 0:
+                seat.connection.send(b'BROKE')
+                seat.connection.transport.close()
+        table.rounds += 1
+        self.rounds += 1
+        table.turn = -1
+        self.start_round(table)
+
+
+class LoadClient(asyncio.Protocol):
+    def __init__(self, done, deadline):
+        """
+        Initializes a client that bets 1 every round and hits below 17 until the deadline.
+
+        Args:
+            done (asyncio.Future): Resolved with (rounds played, action latencies) when the
+                                   client leaves.
+            deadline (float): The time.perf_counter() value after which the client quits.
+
+        Returns:
+            None
+        """
+        self.done = done
+        self.deadline = deadline
+        self.transport = None
+        self.buffer = b''
+        self.total = 0
+        self.rounds = 0
+        self.sent_at = 0.0
+        self.latencies = []
+
+    def connection_made(self, transport):
+        """
+        Keeps the transport for sending actions.
+
+        Args:
+            transport (asyncio.Transport): The connection transport.
+
+        Returns:
+            None
+        """
+        self.transport = transport
+
+    def data_received(self, data):
+        """
+        Splits incoming data into lines and handles each message. The connection is closed if
+        a line grows past MAX_LINE bytes.
+
+        Args:
+            data (bytes): The bytes received.
+
+        Returns:
+            None
+        """
+        self.buffer += data
+        while b'\n' in self.buffer:
+            line, self.buffer = self.buffer.split(b'\n', 1)
+            self.handle(line.split())
+        if len(self.buffer) > MAX_LINE:
+            self.buffer = b''
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        """
+        Reports the client as finished.
+
+        Args:
+            exc (Exception): The error that closed the connection, or None.
+
+        Returns:
+            None
+        """
+        if not self.done.done():
+            self.done.set_result((self.rounds, self.latencies))
+
+    def send(self, message):
+        """
+        Sends an action and notes the time, to measure the latency of its acknowledgement.
+
+        Args:
+            message (bytes): The line, without the newline.
+
+        Returns:
+            None
+        """
+        self.sent_at = time.perf_counter()
+        self.transport.write(message + b'\n')
+
+    def handle(self, words):
+        """
+        Reacts to one server message.
+
+        Args:
+            words (list): The message split into words.
+
+        Returns:
+            None
+        """
+        kind = words[0]
+        if kind in (b'BETOK', b'CARD', b'STAND', b'BUST'):
+            self.latencies.append(time.perf_counter() - self.sent_at)
+        if kind == b'BET':
+            if time.perf_counter() >= self.deadline:
+                self.transport.write(b'QUIT\n')
+            else:
+                self.send(b'BET 1')
+        elif kind == b'DEAL':
+            self.total = int(words[4])
+        elif kind == b'TURN':
+            self.act()
+        elif kind == b'CARD':
+            self.total = int(words[2])
+            if self.total <= 21:
+                self.act()
+        elif kind in (b'RESULT', b'BUST'):
+            self.rounds += 1
+        elif kind == b'BROKE':
+            self.transport.close()
+
+    def act(self):
+        """
+        Hits below 17 and holds otherwise.
+
+        Returns:
+            None
+        """
+        self.send(b'HIT' if self.total < 17 else b'HOLD')
+
+
+async def load_test(host, port, tables=10, seats=5, seconds=10.0):
+    """
+    Fills a number of tables with load clients and measures the server's throughput.
+
+    Args:
+        host (str): The server address.
+        port (int): The server port.
+        tables (int): The number of tables to fill.
+        seats (int): The number of seats per table on the server.
+        seconds (float): How long to generate load for.
+
+    Returns:
+        dict: 'tables', 'players', 'rounds', 'actions', 'seconds', 'actions_per_sec' and
+              action latency percentiles in milliseconds ('p50_ms', 'p99_ms').
+    """
+    loop = asyncio.get_running_loop()
+    deadline = time.perf_counter() + seconds
+    futures = []
+    start_time = time.perf_counter()
+    for _ in range(tables * seats):
+        future = loop.create_future()
+        await loop.create_connection(lambda future=future: LoadClient(future, deadline), host, port)
+        futures.append(future)
+    results = await asyncio.gather(*futures)
+    elapsed = time.perf_counter() - start_time
+    latencies = sorted(latency for _, client_latencies in results for latency in client_latencies)
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        'tables': tables,
+        'players': tables * seats,
+        'rounds': sum(rounds for rounds, _ in results),
+        'actions': len(latencies),
+        'seconds': elapsed,
+        'actions_per_sec': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': percentile(0.50),
+        'p99_ms': percentile(0.99),
+    }
+
+
+def run_server(host, port, seats, action_timeout):
+    """
+    Runs a server until the process is terminated. Used as a separate process by the load test.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        seats (int): The number of seats per table.
+        action_timeout (float): Seconds a player has to act.
+
+    Returns:
+        None
+    """
+    asyncio.run(TableServer(host, port, seats_per_table=seats, bet_timeout=action_timeout,
+                            action_timeout=action_timeout).serve_forever())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Blackjack table server and load generator.")
+    parser.add_argument("mode", choices=["serve", "loadtest"], help="run the server or generate load")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--seats", type=int, default=5, help="seats per table")
+    parser.add_argument("--action-timeout", type=float, default=10.0, help="seconds allowed to bet or act")
+    parser.add_argument("--tables", default="10",
+                        help="tables to fill during the load test; a comma-separated list runs one test per count")
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration of each load test")
+    parser.add_argument("--spawn-server", action="store_true",
+                        help="start a server in a separate process for each load test")
+    args = parser.parse_args()
+
+    if args.mode == "serve":
+        asyncio.run(TableServer(args.host, args.port, seats_per_table=args.seats, bet_timeout=args.action_timeout,
+                                action_timeout=args.action_timeout).serve_forever())
+    else:
+        for tables in [int(count) for count in args.tables.split(',')]:
+            server_process = None
+            if args.spawn_server:
+                server_process = multiprocessing.Process(
+                    target=run_server, args=(args.host, args.port, args.seats, args.action_timeout), daemon=True)
+                server_process.start()
+                time.sleep(0.5)
+            report = asyncio.run(load_test(args.host, args.port, tables, args.seats, args.seconds))
+            print(f"Tables: {report['tables']}, players: {report['players']}, rounds: {report['rounds']}, "
+                  f"actions: {report['actions']} in {report['seconds']:.2f}s "
+                  f"({report['actions_per_sec']:.0f} actions/sec), "
+                  f"latency p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms")
+            if server_process is not None:
+                server_process.terminate()
+                server_process.join()
@@ -0,0 +1,529 @@
+import argparse
+import gzip
+import heapq
+import multiprocessing
+import os
+import re
+import tempfile
+import time
+import unicodedata
+import zlib
+from collections import Counter
+
+from WordDictionary import LEVELS, MAX_LENGTH, build_dictionary, frequency_byte, write_buckets
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class builds a WordDictionary file from large text corpora. Each file is split into
+# byte ranges that worker processes read in fixed-size chunks through a generator tokenizer, so no file is
+# ever held in memory. Tokens are normalized to upper case and kept only if they are plain words of an
+# allowed length. Each worker counts its words and, whenever its counter grows past a limit, spills the
+# counts to sorted shard files. The shards are merged one at a time with a streaming merge that never opens
+# more than MERGE_FAN_IN files, rare words are dropped and the rest are split into sorted runs by length, so
+# the compact dictionary the game loads is written without holding the vocabulary in memory.
+
+TOKEN = re.compile(rb"[A-Za-z\x80-\xff]+(?:['-][A-Za-z\x80-\xff]+)*")  # Letter runs joined by an apostrophe or hyphen
+PLAIN = re.compile(rb"[A-Za-z]+")
+WORD = re.compile(r"[A-Za-z\x00]+(?:['-][A-Za-z\x00]+)*")  # The same over text, with \x00 for any other letter
+JOINERS = (b"'", b"-")
+READ_SIZE = 1 << 20  # Bytes read from a file at a time
+MERGE_FAN_IN = 64  # Most spill files merged at once, well under the open file limit
+
+
+def read_chunks(path, start=0, end=None, read_size=READ_SIZE):
+    """
+    Reads part of a file in chunks. Gzip files are decompressed as they are read and always
+    read whole.
+
+    Parameters:
+    path (str): The file.
+    start (int): The first byte to read.
+    end (int): The byte to stop at, or None for the end of the file.
+    read_size (int): The most bytes read at a time.
+
+    Returns:
+    generator: The chunks, as bytes.
+    """
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while end is None or position < end:
+            chunk = f.read(read_size if end is None else min(read_size, end - position))
+            if not chunk:
+                break
+            position += len(chunk)
+            yield chunk
+
+
+def open_tail(data, tokens):
+    """
+    Finds the last token of some data if the bytes after the data may continue it.
+
+    Parameters:
+    data (bytes): The data.
+    tokens (list): The tokens found in the data.
+
+    Returns:
+    int: The offset the last token starts at, or None if it is complete.
+    """
+    end = len(data) - data.endswith(JOINERS)  # A trailing apostrophe or hyphen may join the next letters
+    if tokens and data.endswith(tokens[-1], 0, end):
+        return end - len(tokens[-1])
+    return None
+
+
+def tokenize(path, start=0, end=None, read_size=READ_SIZE):
+    """
+    Splits part of a file into upper case tokens, one list per chunk read. A range owns the tokens
+    that start inside it, so a token cut by the start of the range is skipped and one cut by its
+    end is read to completion.
+
+    Parameters:
+    path (str): The file.
+    start (int): The first byte of the range.
+    end (int): The end of the range, or None for the end of the file.
+    read_size (int): The most bytes read at a time.
+
+    Returns:
+    generator: Lists of tokens, as bytes.
+    """
+    carry = b''
+    owned = 0  # Tokens starting before this offset of the data began before the range
+    if start > 0:
+        # A token reaches into the range from at most a letter and an apostrophe or hyphen before it
+        carry = b''.join(read_chunks(path, max(start - 2, 0), start)).upper()
+        owned = len(carry)
+    for chunk in read_chunks(path, start, end, read_size):
+        data = carry + chunk.upper()  # Only ASCII letters change case
+        tokens = TOKEN.findall(data)
+        tail = open_tail(data, tokens)
+        carry = b'' if tail is None else data[tail:]
+        if tail is not None:
+            tokens.pop()
+        if owned:
+            match = TOKEN.search(data)
+            if match and match.start() < owned:
+                if not tokens:
+                    owned = 1  # The carried token began before the range
+                    continue
+                del tokens[0]
+            owned = 0
+        yield tokens
+    if owned:
+        return  # The range is part of a token that began before it
+    if end is not None and carry:
+        # Finish a token that runs past the end of the range
+        for chunk in read_chunks(path, end, None, 64):
+            data = carry + chunk.upper()
+            carry = data[:TOKEN.match(data).end()]
+            if open_tail(data, [carry]) is None:
+                break
+            carry = data
+    if carry:
+        yield [TOKEN.match(carry).group()]
+
+
+def token_words(token, min_length, max_length):
+    """
+    Turns a token into dictionary words. A token is split at any punctuation that is not ASCII,
+    such as curly quotes and dashes, and the parts are kept if they are plain words. A word joined
+    to other letters by an apostrophe or hyphen, or with a letter that is not ASCII, is dropped.
+
+    Parameters:
+    token (bytes): The token, in upper case.
+    min_length (int): The shortest word kept.
+    max_length (int): The longest word kept.
+
+    Returns:
+    list: The words in upper case, as str.
+
+    Example:
+    >>> text = '\u201cHello,\u201d she said \u2014 quietly\u2014then left. It\u2019s well-known end--of Caf\u00e9s.'
+    >>> [word for token in TOKEN.findall(text.upper().encode()) for word in token_words(token, 2, 20)]
+    ['HELLO', 'SHE', 'SAID', 'QUIETLY', 'THEN', 'LEFT', 'IT', 'END', 'OF']
+    """
+    if token.isascii():
+        if min_length <= len(token) <= max_length and PLAIN.fullmatch(token):
+            return [token.decode('ascii')]
+        return []
+    # Letters that are not ASCII become \x00 and other characters spaces; undecodable bytes count as letters
+    text = ''.join(char if char < '\x80' else '\x00' if unicodedata.category(char)[0] in 'LM' or
+                   '\udc80' <= char <= '\udcff' else ' ' for char in token.decode('utf-8', 'surrogateescape'))
+    return [word for word in WORD.findall(text)
+            if min_length <= len(word) <= max_length and word.isalpha() and word.isascii()]
+
+
+def shard_of(word, shards):
+    """
+    Picks the shard of a word, the same in every process.
+
+    Parameters:
+    word (str): The word.
+    shards (int): The number of shards.
+
+    Returns:
+    int: The shard number.
+    """
+    return zlib.crc32(word.encode('ascii')) % shards
+
+
+def spill(counts, spill_dir, task_index, spill_index, shards):
+    """
+    Writes counts to one sorted file per shard and empties the counter.
+
+    Parameters:
+    counts (Counter): The word counts.
+    spill_dir (str): The directory for spill files.
+    task_index (int): The task writing the files.
+    spill_index (int): The number of earlier spills of the task.
+    shards (int): The number of shards.
+
+    Returns:
+    None
+    """
+    by_shard = [[] for _ in range(shards)]
+    for word, count in counts.items():
+        by_shard[shard_of(word, shards)].append((word, count))
+    for shard, entries in enumerate(by_shard):
+        if not entries:
+            continue
+        entries.sort()
+        write_run(os.path.join(spill_dir, f"{shard}-{task_index}-{spill_index}.txt"), entries)
+    counts.clear()
+
+
+def run_range(task):
+    """
+    Counts the words of one byte range in a worker process.
+
+    Parameters:
+    task (tuple): (path, start, end, min length, max length, spill directory, task index,
+                   shards, spill limit).
+
+    Returns:
+    tuple: The bytes of the range (the compressed size for a gzip file) and the number of tokens
+           and kept words.
+    """
+    path, start, end, min_length, max_length, spill_dir, task_index, shards, spill_limit = task
+    counts = Counter()
+    spills = tokens = kept = 0
+    for batch in tokenize(path, start, end):
+        tokens += len(batch)
+        # Count the tokens of the chunk first, so each distinct token is normalized once
+        for token, count in Counter(batch).items():
+            for word in token_words(token, min_length, max_length):
+                kept += count
+                counts[word] += count
+        if len(counts) >= spill_limit:
+            spill(counts, spill_dir, task_index, spills, shards)
+            spills += 1
+    spill(counts, spill_dir, task_index, spills, shards)
+    size = (end if end is not None else os.path.getsize(path)) - start
+    return size, tokens, kept
+
+
+def read_spill(path):
+    """
+    Reads a spill file.
+
+    Parameters:
+    path (str): The spill file.
+
+    Returns:
+    generator: (word, count) tuples in word order.
+    """
+    with open(path) as f:
+        for line in f:
+            word, count = line.split()
+            yield word, int(count)
+
+
+def merge_shard(paths):
+    """
+    Merges the sorted spill files of one shard, adding up the counts of each word.
+
+    Parameters:
+    paths (list): The spill files.
+
+    Returns:
+    generator: (word, count) tuples in word order, one per word.
+    """
+    current, total = None, 0
+    for word, count in heapq.merge(*(read_spill(path) for path in paths)):
+        if word != current:
+            if current is not None:
+                yield current, total
+            current, total = word, 0
+        total += count
+    if current is not None:
+        yield current, total
+
+
+def write_run(path, entries):
+    """
+    Writes (word, count) tuples to a spill file.
+
+    Parameters:
+    path (str): The file to write.
+    entries (iterable): (word, count) tuples.
+
+    Returns:
+    None
+    """
+    with open(path, 'w') as f:
+        f.writelines(f"{word} {count}\n" for word, count in entries)
+
+
+def reduce_files(paths, prefix, fan_in=MERGE_FAN_IN):
+    """
+    Merges spill files in groups until at most fan_in are left, so the final merge never opens
+    more files than that. Merged files replace the files they were made from.
+
+    Parameters:
+    paths (list): The sorted spill files.
+    prefix (str): The path prefix of the merged files.
+    fan_in (int): The most files merged at once.
+
+    Returns:
+    list: The remaining spill files.
+    """
+    level = 0
+    while len(paths) > fan_in:
+        merged = []
+        for group in range(0, len(paths), fan_in):
+            path = f"{prefix}{level}-{group // fan_in}.txt"
+            write_run(path, merge_shard(paths[group:group + fan_in]))
+            for old in paths[group:group + fan_in]:
+                os.remove(old)
+            merged.append(path)
+        paths = merged
+        level += 1
+    return paths
+
+
+class DictionaryBuilder:
+    def __init__(self, paths, output, min_length=3, max_length=20, min_count=2, max_words=None, processes=None,
+                 range_size=32 << 20, spill_limit=500000, shards=16, temp_dir=None):
+        """
+        Initializes the builder.
+
+        Parameters:
+        paths (list): The corpus files, as plain text or gzip.
+        output (str): The dictionary file to write.
+        min_length (int): The shortest word kept.
+        max_length (int): The longest word kept, at most MAX_LENGTH.
+        min_count (int): The fewest times a word must occur to be kept.
+        max_words (int): Keep only this many of the most frequent words, which are held in memory, or
+                         None for all, which are written through run files on disk.
+        processes (int): The number of worker processes. Defaults to one per core; 1 counts in
+                         the current process.
+        range_size (int): The bytes of a plain file counted by one task.
+        spill_limit (int): The most distinct words a task holds before spilling them to disk,
+                           which bounds the memory of each worker.
+        shards (int): The number of shards the counts are split into for merging.
+        temp_dir (str): Where spill files are written. Defaults to the system temp directory.
+        """
+        self.paths = list(paths)
+        self.output = output
+        self.min_length = min_length
+        self.max_length = min(max_length, MAX_LENGTH)
+        self.min_count = min_count
+        self.max_words = max_words
+        self.processes = processes or multiprocessing.cpu_count()
+        self.range_size = range_size
+        self.spill_limit = spill_limit
+        self.shards = shards
+        self.temp_dir = temp_dir
+
+    def tasks(self, spill_dir):
+        """
+        Splits the corpus into byte range tasks.
+
+        Parameters:
+        spill_dir (str): The directory for spill files.
+
+        Returns:
+        list: A list of task tuples for run_range.
+        """
+        ranges = []
+        for path in self.paths:
+            if path.endswith('.gz'):
+                ranges.append((path, 0, None))
+                continue
+            size = os.path.getsize(path)
+            ranges.extend((path, start, min(start + self.range_size, size))
+                          for start in range(0, size, self.range_size))
+        return [(path, start, end, self.min_length, self.max_length, spill_dir, index, self.shards, self.spill_limit)
+                for index, (path, start, end) in enumerate(ranges)]
+
+    def shard_words(self, spill_dir, shard):
+        """
+        Streams the total count of every word kept from one shard.
+
+        Parameters:
+        spill_dir (str): The directory holding the spill files.
+        shard (int): The shard.
+
+        Returns:
+        generator: (word, count) tuples in word order.
+        """
+        paths = [os.path.join(spill_dir, name) for name in os.listdir(spill_dir) if name.startswith(f"{shard}-")]
+        paths = reduce_files(paths, os.path.join(spill_dir, f"{shard}-merged-"))
+        for word, count in merge_shard(paths):
+            if count >= self.min_count:
+                yield word, count
+
+    def merged(self, spill_dir):
+        """
+        Streams the total count of every word kept, shard by shard.
+
+        Parameters:
+        spill_dir (str): The directory holding the spill files.
+
+        Returns:
+        generator: (word, count) tuples.
+        """
+        for shard in range(self.shards):
+            yield from self.shard_words(spill_dir, shard)
+
+    def write_all(self, spill_dir):
+        """
+        Writes every word kept to the dictionary. The words of each shard are split into one sorted
+        run file per length, then each length is written by merging its runs, so only the number of
+        words of each length is held in memory.
+
+        Parameters:
+        spill_dir (str): The directory holding the spill files.
+
+        Returns:
+        tuple: The number of distinct words kept and the number written.
+        """
+        run_dir = os.path.join(spill_dir, 'lengths')
+        os.mkdir(run_dir)
+        runs = {}  # Length -> run files, one per shard that has words of that length
+        sizes = Counter()
+        max_count = 0
+        for shard in range(self.shards):
+            files = {}
+            try:
+                for word, count in self.shard_words(spill_dir, shard):
+                    f = files.get(len(word))
+                    if f is None:
+                        path = os.path.join(run_dir, f"{len(word)}-{shard}.txt")
+                        runs.setdefault(len(word), []).append(path)
+                        f = files[len(word)] = open(path, 'w')
+                    f.write(f"{word} {count}\n")
+                    sizes[len(word)] += 1
+                    max_count = max(max_count, count)
+            finally:
+                for f in files.values():
+                    f.close()
+
+        buckets = []
+        for length in sorted(runs):
+            paths = reduce_files(runs[length], os.path.join(run_dir, f"{length}-merged-"))
+            records = ((word, frequency_byte(count, max_count), 0)
+                       for word, count in heapq.merge(*(read_spill(path) for path in paths)))
+            buckets.append((length, [sizes[length]] + [0] * (LEVELS - 1), records))
+        distinct = sum(sizes.values())
+        return distinct, write_buckets(self.output, buckets)
+
+    def run(self, progress=None):
+        """
+        Builds the dictionary.
+
+        Parameters:
+        progress (callable): Called with the bytes read so far after each task.
+
+        Returns:
+        dict: 'files', 'bytes', 'tokens', 'kept', 'distinct', 'words', 'count_seconds',
+              'seconds' and 'mb_per_sec'.
+        """
+        start_time = time.perf_counter()
+        read = tokens = kept = 0
+        with tempfile.TemporaryDirectory(prefix='hangman-spill-', dir=self.temp_dir) as spill_dir:
+            tasks = self.tasks(spill_dir)
+            if self.processes == 1:
+                results = map(run_range, tasks)
+                pool = None
+            else:
+                pool = multiprocessing.Pool(self.processes)
+                results = pool.imap_unordered(run_range, tasks)
+            try:
+                for size, found, used in results:
+                    read += size
+                    tokens += found
+                    kept += used
+                    if progress is not None:
+                        progress(read)
+            finally:
+                if pool is not None:
+                    pool.close()
+                    pool.join()
+            count_seconds = time.perf_counter() - start_time
+
+            if self.max_words is None:
+                distinct, words = self.write_all(spill_dir)
+            else:
+                # Keep the most frequent words in a bounded heap
+                distinct = 0
+                entries = []
+                for word, count in self.merged(spill_dir):
+                    distinct += 1
+                    if len(entries) < self.max_words:
+                        heapq.heappush(entries, (count, word))
+                    elif count > entries[0][0]:
+                        heapq.heapreplace(entries, (count, word))
+                words = build_dictionary(self.output, ((word, count) for count, word in entries))
+        seconds = time.perf_counter() - start_time
+        return {
+            'files': len(self.paths),
+            'bytes': read,
+            'tokens': tokens,
+            'kept': kept,
+            'distinct': distinct,
+            'words': words,
+            'count_seconds': count_seconds,
+            'seconds': seconds,
+            'mb_per_sec': read / (1 << 20) / seconds if seconds else 0.0,
+        }
+
+
+def format_report(report):
+    """
+    Formats a build report as readable text.
+
+    Parameters:
+    report (dict): A report returned by DictionaryBuilder.run.
+
+    Returns:
+    str: The report as a multi-line string.
+    """
+    return "\n".join([
+        f"Read {report['bytes'] / (1 << 20):,.1f} MB from {report['files']} files in {report['seconds']:.2f}s "
+        f"({report['mb_per_sec']:,.1f} MB/s, counting took {report['count_seconds']:.2f}s)",
+        f"Tokens: {report['tokens']:,}   Words kept: {report['kept']:,}",
+        f"Distinct words over the minimum count: {report['distinct']:,}   Written: {report['words']:,}",
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a Hangman dictionary from text corpora.")
+    parser.add_argument("corpus", nargs="+", help="text files to read (.gz files are decompressed)")
+    parser.add_argument("--output", required=True, help="dictionary file to write")
+    parser.add_argument("--min-length", type=int, default=3, help="shortest word kept")
+    parser.add_argument("--max-length", type=int, default=20, help=f"longest word kept (at most {MAX_LENGTH})")
+    parser.add_argument("--min-count", type=int, default=2, help="fewest occurrences of a kept word")
+    parser.add_argument("--max-words", type=int, default=None, help="keep only the most frequent words")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--range-mb", type=int, default=32, help="megabytes of a file per task")
+    parser.add_argument("--spill-limit", type=int, default=500000, help="distinct words a worker holds before spilling")
+    parser.add_argument("--temp-dir", default=None, help="directory for spill files")
+    args = parser.parse_args()
+
+    builder = DictionaryBuilder(args.corpus, args.output, args.min_length, args.max_length, args.min_count,
+                                args.max_words, args.processes, args.range_mb << 20, args.spill_limit,
+                                temp_dir=args.temp_dir)
+    print(format_report(builder.run()))
@@ -0,0 +1,203 @@
+import argparse
+import multiprocessing
+import os
+import time
+
+from HangmanGame import HangmanGame
+from HangmanSolver import SOLVERS, STRATEGIES, worker_solver
+from WordDictionary import LETTERS, LEVELS, WordDictionary, write_dictionary
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class scores how hard each dictionary word is by letting HangmanSolver play it with
+# unlimited lives and counting the wrong guesses it needs. The words are played in batches across a process
+# pool. The scores are written into the difficulty byte of the dictionary file, which keeps each length
+# bucket sorted by difficulty, so HangmanGame can pick a word from a difficulty band in constant time. The
+# scores are also kept in a side file next to the dictionary, and rescoring only plays the words that are
+# not in it yet.
+
+SCORES_SUFFIX = '.scores'
+
+
+def read_scores(path, strategy):
+    """
+    Reads the scores kept from an earlier run.
+
+    Parameters:
+    path (str): The scores file.
+    strategy (str): The solver strategy the scores must come from.
+
+    Returns:
+    dict: Maps each scored word to its number of wrong guesses. Empty if the file does not exist
+          or was written with another strategy.
+    """
+    scores = {}
+    if not os.path.exists(path):
+        return scores
+    with open(path) as f:
+        if f.readline().split() != ['strategy', strategy]:
+            return scores
+        for line in f:
+            word, wrong = line.split()
+            scores[word] = int(wrong)
+    return scores
+
+
+def write_scores(path, strategy, scores):
+    """
+    Writes the scores file, replacing it only once it is complete.
+
+    Parameters:
+    path (str): The scores file.
+    strategy (str): The solver strategy the scores come from.
+    scores (dict): Maps each word to its number of wrong guesses.
+
+    Returns:
+    None
+    """
+    with open(path + '.tmp', 'w') as f:
+        f.write(f"strategy {strategy}\n")
+        f.writelines(f"{word} {wrong}\n" for word, wrong in sorted(scores.items()))
+    os.replace(path + '.tmp', path)
+
+
+def run_batch(task):
+    """
+    Plays the words of a batch in a worker process and counts the wrong guesses of each.
+
+    Parameters:
+    task (tuple): (dictionary path, strategy, word ids).
+
+    Returns:
+    list: (word, wrong guesses) tuples.
+    """
+    path, strategy, word_ids = task
+    solver, dictionary = worker_solver(path, strategy)
+    game = HangmanGame(lives=len(LETTERS))  # Enough lives that no word can be lost
+    scores = []
+    for word_id in word_ids:
+        word = dictionary.word(word_id)
+        game.reset_game(word)
+        _, _, wrong = solver.play(game)
+        scores.append((word, wrong))
+    return scores
+
+
+class DifficultyScorer:
+    def __init__(self, path, strategy='entropy', processes=None, batch_size=500, scores_path=None):
+        """
+        Initializes the scorer.
+
+        Parameters:
+        path (str): The dictionary file to score. It is rewritten with the new difficulties.
+        strategy (str): The solver strategy, one of HangmanSolver.STRATEGIES.
+        processes (int): The number of worker processes. Defaults to one per core; 1 plays in
+                         the current process.
+        batch_size (int): The number of words each worker plays per task.
+        scores_path (str): The file scores are kept in between runs. Defaults to the dictionary
+                           path with '.scores' added.
+        """
+        self.path = path
+        self.strategy = strategy
+        self.processes = processes or multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.scores_path = scores_path or path + SCORES_SUFFIX
+
+    def run(self, rescore=False, progress=None):
+        """
+        Scores the words that have no score yet and rewrites the dictionary with every score.
+
+        Parameters:
+        rescore (bool): Whether to score every word again, ignoring the kept scores.
+        progress (callable): Called with the number of words scored after each batch.
+
+        Returns:
+        dict: 'words', 'scored', 'reused', 'distribution' (wrong guesses -> words), 'seconds'
+              and 'words_per_sec'.
+        """
+        start_time = time.perf_counter()
+        kept = {} if rescore else read_scores(self.scores_path, self.strategy)
+        with WordDictionary(self.path) as dictionary:
+            records = list(dictionary)
+        todo = [word_id for word_id, (word, _, _) in enumerate(records) if word not in kept]
+        tasks = [(self.path, self.strategy, todo[start:start + self.batch_size])
+                 for start in range(0, len(todo), self.batch_size)]
+
+        scores = {}
+        if self.processes == 1:
+            batches = map(run_batch, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(self.processes)
+            batches = pool.imap_unordered(run_batch, tasks)
+        try:
+            for batch in batches:
+                scores.update(batch)
+                if progress is not None:
+                    progress(len(scores))
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+            # The dictionary is about to change, so drop a solver built on it in this process
+            solver = SOLVERS.pop((self.path, self.strategy), None)
+            if solver is not None:
+                solver[1].close()
+        seconds = time.perf_counter() - start_time
+
+        # Words removed from the dictionary are dropped from the kept scores
+        reused = 0
+        for word, _, _ in records:
+            if word in kept and word not in scores:
+                scores[word] = kept[word]
+                reused += 1
+        write_dictionary(self.path + '.tmp', ((word, frequency, min(scores[word], LEVELS - 1))
+                                              for word, frequency, _ in records))
+        os.replace(self.path + '.tmp', self.path)
+        write_scores(self.scores_path, self.strategy, scores)
+
+        distribution = {}
+        for wrong in scores.values():
+            distribution[wrong] = distribution.get(wrong, 0) + 1
+        scored = len(scores) - reused
+        return {
+            'words': len(records),
+            'scored': scored,
+            'reused': reused,
+            'distribution': dict(sorted(distribution.items())),
+            'seconds': seconds,
+            'words_per_sec': scored / seconds if seconds else 0.0,
+        }
+
+
+def format_report(report):
+    """
+    Formats a scoring report as readable text.
+
+    Parameters:
+    report (dict): A report returned by DifficultyScorer.run.
+
+    Returns:
+    str: The report as a multi-line string.
+    """
+    lines = [
+        f"Words: {report['words']}   Scored: {report['scored']}   Reused: {report['reused']}",
+        f"Scoring took {report['seconds']:.2f}s ({report['words_per_sec']:,.0f} words/sec)",
+        "Wrong guesses needed:",
+    ]
+    lines.extend(f"  {wrong:2}: {count} words" for wrong, count in report['distribution'].items())
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score the difficulty of every word of a Hangman dictionary.")
+    parser.add_argument("dictionary", help="dictionary file built with WordDictionary.py, rewritten in place")
+    parser.add_argument("--strategy", default="entropy", choices=STRATEGIES, help="how the solver picks letters")
+    parser.add_argument("--rescore", action="store_true", help="score every word again")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--batch-size", type=int, default=500, help="words per worker task")
+    args = parser.parse_args()
+
+    scorer = DifficultyScorer(args.dictionary, args.strategy, args.processes, args.batch_size)
+    print(format_report(scorer.run(args.rescore)))
@@ -0,0 +1,132 @@
+import numpy as np
+
+from HangmanGame import HangmanGame
+from PatternIndex import PatternIndex
+from WordDictionary import LETTERS
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class implements an adversarial ("evil") mode of the Hangman game. Instead of committing
+# to a word when the game starts, it keeps every word of the chosen length that fits the board. After each
+# guess it splits those candidates by the pattern the guessed letter would reveal and keeps the largest
+# group, so the player gets as little as possible. The split is computed for all candidates at once with
+# NumPy. The word shown at the end is one of the remaining candidates, and every other method of
+# HangmanGame works unchanged.
+
+class EvilHangmanGame(HangmanGame):
+    def __init__(self, dictionary=None, min_length=1, max_length=None, min_difficulty=0, max_difficulty=255,
+                 lives=5, index=None):
+        """
+        Initializes the game and starts the first round.
+
+        Parameters:
+        dictionary (WordDictionary): The dictionary to pick word lengths and candidates from. If None,
+                                     the built-in word list is used.
+        min_length (int): The shortest word to play.
+        max_length (int): The longest word to play, or None for no limit.
+        min_difficulty (int): The lowest difficulty of the candidates, from 0 to 255.
+        max_difficulty (int): The highest difficulty of the candidates, from 0 to 255.
+        lives (int): The number of wrong guesses allowed in each game.
+        index (PatternIndex): An index of the dictionary to share between games. Built from the
+                              dictionary or word list if None.
+        """
+        self.index = index
+        self.candidates = None
+        super().__init__(dictionary, min_length, max_length, min_difficulty, max_difficulty, lives)
+
+    def reset_game(self, word=None):
+        """
+        Resets the game with every word of a randomly chosen length as a candidate.
+
+        Parameters:
+        word (str): A word to play fairly, with no other candidates. If None, the length is that
+                    of a randomly chosen word and all words of that length in the difficulty band
+                    are candidates.
+        """
+        super().reset_game(word)
+        if self.index is None:
+            if self.dictionary is not None:
+                self.index = PatternIndex(dictionary=self.dictionary)
+            else:
+                self.index = PatternIndex(self.words)
+        index = self.index.lengths.get(len(self.word))
+        if word is not None or index is None:
+            self.candidates = np.frombuffer(self.word.encode('ascii'), dtype=np.uint8)[None, :] - ord('A')
+        elif self.dictionary is not None:
+            # The band is a run of records in the length's bucket, so a contiguous range of word ids
+            bucket = self.dictionary.buckets[len(self.word)]
+            start, end = bucket.band(*self.filters[2:])
+            ids = index.ids
+            self.candidates = index.letters[(ids >= bucket.first_id + start) & (ids < bucket.first_id + end)]
+        else:
+            self.candidates = index.letters
+
+    def make_guess(self, letter):
+        """
+        Processes a player's guess. The candidates are split by where the letter would appear,
+        the largest group is kept and the word becomes one of its members before the guess is
+        scored as usual.
+
+        Parameters:
+        letter (str): The letter guessed by the player.
+
+        Returns:
+        bool: True if the guess was correct, False otherwise.
+        """
+        letter = letter.upper()
+        if not self.game_over and letter not in self.guesses and len(letter) == 1 and letter in LETTERS:
+            self.candidates = largest_class(self.candidates, LETTERS.index(letter))
+            self.word = (self.candidates[0] + ord('A')).astype(np.uint8).tobytes().decode('ascii')
+        return super().make_guess(letter)
+
+
+# Multiplying eight 0/1 bytes, read as one little-endian 64-bit word, by this constant gathers them into
+# the top byte of the product as eight bits, byte i becoming bit i
+GATHER = np.uint64(0x0102040810204080)
+
+
+def position_codes(candidates, letter):
+    """
+    Finds where a letter appears in each candidate, as a bitmask of positions.
+
+    Parameters:
+    candidates (numpy.ndarray): A (words, length) array of letter numbers, 0 for A to 25 for Z.
+    letter (int): The letter number.
+
+    Returns:
+    numpy.ndarray: For each word, a code with bit p set when the letter is at position p.
+    """
+    count, length = candidates.shape
+    width = (length + 7) // 8 * 8
+    matches = np.zeros((count, width), dtype=np.uint8)
+    np.equal(candidates, letter, out=matches[:, :length].view(bool))
+    blocks = matches.view('<u8')
+    codes = np.zeros(count, dtype=np.uint64)
+    for block in range(width // 8):
+        codes |= ((blocks[:, block] * GATHER) >> np.uint64(56)) << np.uint64(8 * block)
+    return codes.astype(np.int64)
+
+
+def largest_class(candidates, letter):
+    """
+    Splits the candidates by the positions where a letter appears and keeps the largest group.
+    Ties go to the group that reveals nothing, then to the one revealing the fewest positions.
+
+    Parameters:
+    candidates (numpy.ndarray): A (words, length) array of letter numbers, 0 for A to 25 for Z.
+    letter (int): The guessed letter number.
+
+    Returns:
+    numpy.ndarray: The candidates of the kept group.
+    """
+    count, length = candidates.shape
+    codes = position_codes(candidates, letter)
+    if 1 << length <= 4 * count:
+        sizes = np.bincount(codes, minlength=1 << length)
+        classes = np.flatnonzero(sizes == sizes.max())
+    else:
+        classes, sizes = np.unique(codes, return_counts=True)
+        classes = classes[sizes == sizes.max()]
+    best = min(classes.tolist(), key=lambda code: bin(code).count('1'))
+    return np.take(candidates, np.flatnonzero(codes == best), axis=0)
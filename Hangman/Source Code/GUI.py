@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import messagebox
 from HangmanGame import HangmanGame
+from EvilHangmanGame import EvilHangmanGame
 from GLogger import GameLogger
 
 
@@ -10,12 +11,17 @@ from GLogger import GameLogger
 # The game includes a virtual keyboard and tracks game progress and actions through detailed logging.
 
 class GameUI:
-    def __init__(self, root):
+    def __init__(self, root, dictionary=None, evil=False):
         """
         Initializes the game UI and starts a new game session.
         Sets up the main window, labels, and keyboard.
+
+        Parameters:
+        root (tk.Tk): The main application window.
+        dictionary (WordDictionary): The dictionary to pick words from, or None for the built-in list.
+        evil (bool): Whether to play the adversarial mode, which avoids committing to a word.
         """
-        self.game = HangmanGame()  # Create a new Hangman game instance
+        self.game = EvilHangmanGame(dictionary) if evil else HangmanGame(dictionary)  # Create a new game instance
         self.root = root  # Reference to the main application window
         self.root.title("Hangman Game")  # Set the title of the window
         self.create_widgets()  # Create and place all the widgets in the window
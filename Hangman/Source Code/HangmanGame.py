@@ -5,22 +5,44 @@ import random
 # Date: August 5, 2024
 # Description: This class implements the logic for the Hangman game.
 # It handles game initialization, making guesses, tracking lives, and determining the end of the game.
+# Words come from a memory-mapped WordDictionary when one is given, or from a short built-in list.
 
 class HangmanGame:
-    def __init__(self):
+    def __init__(self, dictionary=None, min_length=1, max_length=None, min_difficulty=0, max_difficulty=255,
+                 lives=5):
         """
         Initializes the game with a predefined list of words and resets the game state.
+
+        Parameters:
+        dictionary (WordDictionary): The dictionary to pick words from. If None, the built-in word
+                                     list is used and the filters are ignored.
+        min_length (int): The shortest word to pick from the dictionary.
+        max_length (int): The longest word to pick from the dictionary, or None for no limit.
+        min_difficulty (int): The lowest difficulty to pick from the dictionary, from 0 to 255.
+        max_difficulty (int): The highest difficulty to pick from the dictionary, from 0 to 255.
+        lives (int): The number of wrong guesses allowed in each game.
         """
         self.words = ["programming", "development", "python", "algorithm", "exception"]
+        self.dictionary = dictionary
+        self.filters = (min_length, max_length, min_difficulty, max_difficulty)
+        self.max_lives = lives
         self.reset_game()  # Start a new game session
 
-    def reset_game(self):
+    def reset_game(self, word=None):
         """
         Resets the game to its initial state with a new word, empty guesses, full lives, and game not over.
+
+        Parameters:
+        word (str): The word to play. If None, a word is chosen at random.
         """
-        self.word = random.choice(self.words).upper()  # Randomly choose a word from the list
+        if word is not None:
+            self.word = word.upper()  # Play the given word, such as when benchmarking a solver
+        elif self.dictionary is not None:
+            self.word = self.dictionary.random_word(*self.filters)  # Randomly choose a matching dictionary word
+        else:
+            self.word = random.choice(self.words).upper()  # Randomly choose a word from the list
         self.guesses = set()  # Set to store guessed letters
-        self.lives = 5  # Initial number of lives
+        self.lives = self.max_lives  # Initial number of lives
         self.game_over = False  # Game is not over at the start
         self.word_display = ['_'] * len(self.word)  # Display underscores for each letter in the word
         self.log = []  # List to store game logs
@@ -0,0 +1,350 @@
+import argparse
+import math
+import multiprocessing
+import random
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from HangmanGame import HangmanGame
+from PatternIndex import PatternIndex, parse_pattern
+from WordDictionary import LETTERS, WordDictionary
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class plays Hangman automatically through HangmanGame.make_guess. At each turn it looks
+# at the dictionary words that still fit the board and guesses the letter that tells it the most about the
+# word (the largest expected information), or the letter most likely to be in the word (the fewest expected
+# wrong guesses). Letters are scored for all candidates at once with NumPy, and the choice for each board is
+# cached, since most games pass through the same early boards. The benchmark plays every word of a
+# dictionary across a process pool and reports the win rate, guesses per word and words per second.
+
+STRATEGIES = ('entropy', 'misses')
+FALLBACK_ORDER = 'ETAOINSHRDLCUMWFGYPBVKJXQZ'  # Guessed in this order once no dictionary word fits
+
+
+def letter_scores(candidates, guessed, strategy='entropy'):
+    """
+    Scores every letter against the candidate words.
+
+    Parameters:
+    candidates (numpy.ndarray): A (words, length) array of letter numbers, 0 for A to 25 for Z.
+    guessed (numpy.ndarray): 26 booleans, True for letters already guessed.
+    strategy (str): 'entropy' scores the expected information of the revealed pattern in bits,
+                    'misses' scores how many candidates contain the letter.
+
+    Returns:
+    tuple: The scores and the number of candidates containing each letter, as arrays of 26.
+           Guessed letters score -1.
+    """
+    count, length = candidates.shape
+    alphabet = np.arange(len(LETTERS), dtype=candidates.dtype)
+    # codes[w, c] has bit p set when word w has letter c at position p: the pattern c would reveal
+    codes = np.zeros((count, len(LETTERS)), dtype=np.int64)
+    for position in range(length):
+        codes |= (candidates[:, position, None] == alphabet).astype(np.int64) << position
+    hits = (codes != 0).sum(axis=0)
+    if strategy == 'misses':
+        scores = hits.astype(float)
+    else:
+        # Partition the candidates by pattern for every open letter in one pass: tagging each
+        # pattern with its letter makes the classes of all letters distinct values of one array
+        letters = np.flatnonzero(~guessed & (hits > 0))
+        tagged = codes[:, letters] + (letters.astype(np.int64) << length)
+        classes, sizes = np.unique(tagged, return_counts=True)
+        spread = np.bincount(classes >> length, weights=sizes * np.log2(sizes), minlength=len(LETTERS))
+        scores = np.where(hits > 0, math.log2(count) - spread / count, 0.0)
+    scores[guessed] = -1.0
+    return scores, hits
+
+
+class HangmanSolver:
+    def __init__(self, index, strategy='entropy', cache_size=200000):
+        """
+        Initializes the solver.
+
+        Parameters:
+        index (PatternIndex): The index of the words the solver knows.
+        strategy (str): 'entropy' to maximize the expected information of each guess, or
+                        'misses' to minimize the expected wrong guesses.
+        cache_size (int): The most boards whose choice is remembered.
+
+        Raises:
+        ValueError: If the strategy is unknown.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', choose from {list(STRATEGIES)}")
+        self.index = index
+        self.strategy = strategy
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def candidates(self, pattern, guesses):
+        """
+        Finds the words that fit a board.
+
+        Parameters:
+        pattern (list): The board pattern (see PatternIndex.parse_pattern).
+        guesses (iterable): The letters guessed so far.
+
+        Returns:
+        numpy.ndarray: A (words, length) array of the letter numbers of the matching words.
+        """
+        index, bitset = self.index.match(pattern, guesses)
+        if index is None:
+            return np.zeros((0, len(pattern)), dtype=np.uint8)
+        return index.letters[index.indices(bitset)]
+
+    def choose(self, key, candidates, guesses):
+        """
+        Picks the letter to guess on a board, from the cache when the board has been seen.
+
+        Parameters:
+        key (tuple): The board and guesses, as strings, identifying the cache entry.
+        candidates (numpy.ndarray or callable): The letter numbers of the words that fit the
+                                                board, or a function returning them on a cache miss.
+        guesses (iterable): The letters guessed so far.
+
+        Returns:
+        str: The letter to guess, in upper case.
+        """
+        letter = self.cache.get(key)
+        if letter is not None:
+            self.cache.move_to_end(key)
+            self.cache_hits += 1
+            return letter
+        self.cache_misses += 1
+        if callable(candidates):
+            candidates = candidates()
+        guessed = np.array([char in guesses for char in LETTERS])
+        letter = None
+        if len(candidates):
+            scores, hits = letter_scores(candidates, guessed, self.strategy)
+            # Break ties between equally informative letters with the one more likely to be right
+            best = np.flatnonzero(scores >= scores.max() - 1e-9)
+            choice = best[np.argmax(hits[best])]
+            if scores[choice] > 0 or hits[choice] > 0:
+                letter = LETTERS[choice]
+        if letter is None:
+            letter = next(char for char in FALLBACK_ORDER if char not in guesses)
+        self.cache[key] = letter
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return letter
+
+    def next_guess(self, pattern, guesses):
+        """
+        Picks the letter to guess on a board.
+
+        Parameters:
+        pattern (str or list): The board pattern, such as HangmanGame.word_display.
+        guesses (iterable): The letters guessed so far, such as HangmanGame.guesses.
+
+        Returns:
+        str: The letter to guess, in upper case.
+        """
+        pattern = parse_pattern(pattern)
+        guesses = {guess.upper() for guess in guesses}
+        key = (''.join(char or '_' for char in pattern), ''.join(sorted(guesses)))
+        return self.choose(key, lambda: self.candidates(pattern, guesses), guesses)
+
+    def play(self, game):
+        """
+        Plays a game to the end. The candidate words are found once and then narrowed down
+        after each guess, rather than looked up again in the index.
+
+        Parameters:
+        game (HangmanGame): The game to play.
+
+        Returns:
+        tuple: Whether the word was guessed, the number of guesses and the number of wrong guesses.
+        """
+        candidates = self.candidates(parse_pattern(game.word_display), game.guesses)
+        guesses = wrong = 0
+        while not game.is_game_over():
+            key = (''.join(game.word_display), ''.join(sorted(game.guesses)))
+            letter = self.choose(key, candidates, game.guesses)
+            if game.make_guess(letter):
+                revealed = np.array([char == letter for char in game.word_display])
+            else:
+                wrong += 1
+                revealed = np.zeros(len(game.word_display), dtype=bool)
+            guesses += 1
+            if len(candidates):
+                # Keep the words with the guessed letter at exactly the revealed positions
+                number = LETTERS.index(letter)
+                candidates = candidates[((candidates == number) == revealed).all(axis=1)]
+        return '_' not in game.word_display, guesses, wrong
+
+
+SOLVERS = {}  # Solvers built in this process, by dictionary path and strategy
+
+
+def worker_solver(path, strategy):
+    """
+    Returns this process's solver for a dictionary, building it on first use so each worker
+    indexes the dictionary once rather than once per batch.
+
+    Parameters:
+    path (str): The dictionary file, or None for HangmanGame's built-in words.
+    strategy (str): The solver strategy.
+
+    Returns:
+    tuple: The solver and the WordDictionary (None for the built-in words).
+    """
+    if (path, strategy) not in SOLVERS:
+        if path is None:
+            dictionary = None
+            index = PatternIndex(HangmanGame().words)
+        else:
+            dictionary = WordDictionary(path)
+            index = PatternIndex(dictionary=dictionary)
+        SOLVERS[path, strategy] = (HangmanSolver(index, strategy), dictionary)
+    return SOLVERS[path, strategy]
+
+
+def run_batch(task):
+    """
+    Plays the words of a batch in a worker process.
+
+    Parameters:
+    task (tuple): (dictionary path, strategy, word ids).
+
+    Returns:
+    tuple: The number of words played and won, and the total guesses and wrong guesses.
+    """
+    path, strategy, word_ids = task
+    solver, dictionary = worker_solver(path, strategy)
+    game = HangmanGame()
+    words = game.words
+    wins = guesses = wrong = 0
+    for word_id in word_ids:
+        game.reset_game(dictionary.word(word_id) if dictionary is not None else words[word_id])
+        won, made, missed = solver.play(game)
+        wins += won
+        guesses += made
+        wrong += missed
+    return len(word_ids), wins, guesses, wrong
+
+
+class SolverBenchmark:
+    def __init__(self, path=None, strategy='entropy', processes=None, batch_size=1000, sample=None, seed=None):
+        """
+        Initializes the benchmark.
+
+        Parameters:
+        path (str): The dictionary file whose words are played, or None for HangmanGame's
+                    built-in words. The solver knows the same words.
+        strategy (str): The solver strategy, one of STRATEGIES.
+        processes (int): The number of worker processes. Defaults to one per core; 1 plays in
+                         the current process.
+        batch_size (int): The number of words each worker plays per task.
+        sample (int): Play this many randomly chosen words instead of the whole dictionary.
+        seed (int): The seed for choosing the sample.
+        """
+        self.path = path
+        self.strategy = strategy
+        self.processes = processes or multiprocessing.cpu_count()
+        self.batch_size = batch_size
+        self.sample = sample
+        self.seed = seed
+
+    def tasks(self):
+        """
+        Splits the words to play into batch tasks.
+
+        Returns:
+        list: A list of task tuples for run_batch.
+        """
+        if self.path is None:
+            total = len(HangmanGame().words)
+        else:
+            with WordDictionary(self.path) as dictionary:
+                total = len(dictionary)
+        if self.sample is not None and self.sample < total:
+            word_ids = sorted(random.Random(self.seed).sample(range(total), self.sample))
+        else:
+            word_ids = list(range(total))
+        return [(self.path, self.strategy, word_ids[start:start + self.batch_size])
+                for start in range(0, len(word_ids), self.batch_size)]
+
+    def run(self, progress=None):
+        """
+        Plays the words and summarises the results.
+
+        Parameters:
+        progress (callable): Called with the number of words played after each batch.
+
+        Returns:
+        dict: 'strategy', 'words', 'win_rate', 'mean_guesses', 'mean_wrong', 'seconds' and
+              'words_per_sec'.
+        """
+        start_time = time.perf_counter()
+        words = wins = guesses = wrong = 0
+        tasks = self.tasks()
+        if self.processes == 1:
+            batches = map(run_batch, tasks)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(self.processes)
+            batches = pool.imap_unordered(run_batch, tasks)
+        try:
+            for played, won, made, missed in batches:
+                words += played
+                wins += won
+                guesses += made
+                wrong += missed
+                if progress is not None:
+                    progress(words)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        seconds = time.perf_counter() - start_time
+        return {
+            'strategy': self.strategy,
+            'words': words,
+            'win_rate': wins / words if words else 0.0,
+            'mean_guesses': guesses / words if words else 0.0,
+            'mean_wrong': wrong / words if words else 0.0,
+            'seconds': seconds,
+            'words_per_sec': words / seconds if seconds else 0.0,
+        }
+
+
+def format_report(report):
+    """
+    Formats a benchmark report as readable text.
+
+    Parameters:
+    report (dict): A report returned by SolverBenchmark.run.
+
+    Returns:
+    str: The report as a multi-line string.
+    """
+    return "\n".join([
+        f"Strategy: {report['strategy']}",
+        f"Words: {report['words']} in {report['seconds']:.2f}s ({report['words_per_sec']:,.0f} words/sec)",
+        f"Win rate at 5 lives: {report['win_rate']:.4f}",
+        f"Mean guesses: {report['mean_guesses']:.2f}   Mean wrong guesses: {report['mean_wrong']:.2f}",
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Hangman solver against every word of a dictionary.")
+    parser.add_argument("dictionary", nargs="?", default=None,
+                        help="dictionary file built with WordDictionary.py (default: the built-in words)")
+    parser.add_argument("--strategy", default="entropy", choices=STRATEGIES, help="how the solver picks letters")
+    parser.add_argument("--sample", type=int, default=None, help="play this many random words instead of all")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--batch-size", type=int, default=1000, help="words per worker task")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the sample")
+    args = parser.parse_args()
+
+    benchmark = SolverBenchmark(args.dictionary, args.strategy, args.processes, args.batch_size, args.sample,
+                                args.seed)
+    print(format_report(benchmark.run()))
@@ -0,0 +1,263 @@
+import numpy as np
+
+from WordDictionary import LETTERS, MAX_LENGTH
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class finds the words that fit a Hangman board, given the revealed pattern (such as
+# "_ A _ _ E") and the letters guessed so far. For every word length it keeps one bitset per position and
+# letter, marking the words with that letter at that position, and one bitset per letter marking the words
+# that contain it anywhere. The bitsets are Python integers built from NumPy with packbits, so a query is a
+# handful of whole-bitset ANDs and ORs instead of a scan over the words. Letter counts over the matching
+# words are computed on the packed bytes for solvers and hints.
+
+WORD_BYTES = 8  # Packed bitsets are padded to whole 64-bit words so they can be counted as uint64
+
+
+def popcount(words):
+    """
+    Counts the set bits of each 64-bit word, with NumPy's bitwise_count where it exists (NumPy 2.0)
+    and a parallel bit count otherwise.
+
+    Parameters:
+    words (numpy.ndarray): The uint64 words.
+
+    Returns:
+    numpy.ndarray: The number of set bits in each word.
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & np.uint64(0x3333333333333333)) + ((words >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+
+def parse_pattern(pattern):
+    """
+    Converts a board pattern to one entry per position.
+
+    Parameters:
+    pattern (str or list): The pattern as shown by HangmanGame.get_word_display ("_ A _ _ E"),
+                           written without spaces ("_A__E"), or the word_display list.
+
+    Returns:
+    list: The revealed letter in upper case at each position, or None where it is hidden.
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.replace(' ', '')
+    return [None if char in ('_', None) else char.upper() for char in pattern]
+
+
+def to_bitset(packed):
+    """
+    Converts bits packed in little-endian order to a Python integer, so bit i is word i.
+
+    Parameters:
+    packed (numpy.ndarray): The packed bits.
+
+    Returns:
+    int: The bitset.
+    """
+    return int.from_bytes(packed.tobytes(), 'little')
+
+
+class LengthIndex:
+    __slots__ = ('length', 'count', 'letters', 'ids', 'positions', 'contains', 'packed_contains', 'all')
+
+    def __init__(self, length, letters, ids):
+        """
+        Builds the bitsets for the words of one length.
+
+        Parameters:
+        length (int): The word length.
+        letters (numpy.ndarray): A (words, length) array of letter numbers, 0 for A to 25 for Z.
+        ids (numpy.ndarray): The id of each word.
+        """
+        self.length = length
+        self.count = len(letters)
+        self.letters = letters
+        self.ids = ids
+        self.all = (1 << self.count) - 1
+        alphabet = np.arange(len(LETTERS), dtype=letters.dtype)[:, None]
+        self.positions = []
+        width = (self.count + 8 * WORD_BYTES - 1) // (8 * WORD_BYTES) * WORD_BYTES
+        self.packed_contains = np.zeros((len(LETTERS), width), dtype=np.uint8)
+        for position in range(length):
+            # Row c has bit w set when word w has letter c at this position
+            packed = np.packbits(letters[:, position] == alphabet, axis=1, bitorder='little')
+            self.positions.append([to_bitset(row) for row in packed])
+            self.packed_contains[:, :packed.shape[1]] |= packed
+        self.contains = [to_bitset(row) for row in self.packed_contains]
+
+    def match(self, pattern, guesses):
+        """
+        Finds the words that fit a pattern of this length.
+
+        Parameters:
+        pattern (list): The revealed letter or None at each position, from parse_pattern.
+        guesses (iterable): The letters guessed so far, right or wrong.
+
+        Returns:
+        int: A bitset of the matching words.
+        """
+        revealed = {}
+        hidden = []
+        for position, letter in enumerate(pattern):
+            if letter is None:
+                hidden.append(position)
+            else:
+                revealed.setdefault(LETTERS.index(letter), []).append(position)
+        required = self.all
+        excluded = 0
+        for letter, positions in revealed.items():
+            for position in positions:
+                required &= self.positions[position][letter]
+            # A revealed letter is shown everywhere it occurs, so it cannot be behind a blank
+            for position in hidden:
+                excluded |= self.positions[position][letter]
+        for guess in guesses:
+            letter = LETTERS.find(guess.upper())
+            if letter >= 0 and letter not in revealed:
+                excluded |= self.contains[letter]
+        return required & ~excluded
+
+    def packed(self, bitset):
+        """
+        Converts a bitset of words to packed bytes, the layout of packed_contains.
+
+        Parameters:
+        bitset (int): The bitset.
+
+        Returns:
+        numpy.ndarray: The bits as uint8, little-endian.
+        """
+        return np.frombuffer(bitset.to_bytes(self.packed_contains.shape[1], 'little'), dtype=np.uint8)
+
+    def indices(self, bitset):
+        """
+        Lists the words in a bitset.
+
+        Parameters:
+        bitset (int): The bitset.
+
+        Returns:
+        numpy.ndarray: The positions of the words within this length.
+        """
+        bits = np.unpackbits(self.packed(bitset), count=self.count, bitorder='little')
+        return np.flatnonzero(bits)
+
+
+class PatternIndex:
+    def __init__(self, words=None, dictionary=None):
+        """
+        Builds the index from a list of words or from a WordDictionary. Word ids are positions in
+        the list, or the dictionary's word ids.
+
+        Parameters:
+        words (iterable): The words, in any case. Words with characters other than A to Z, or
+                          longer than MAX_LENGTH, are skipped.
+        dictionary (WordDictionary): A dictionary to index instead of a word list. Its letters are
+                                     read straight from the memory-mapped file.
+
+        Raises:
+        ValueError: If neither words nor a dictionary is given.
+        """
+        self.lengths = {}
+        if dictionary is not None:
+            for length in dictionary.lengths:
+                bucket = dictionary.buckets[length]
+                records = np.frombuffer(dictionary.data, dtype=np.uint8, count=bucket.count * bucket.width,
+                                        offset=bucket.offset).reshape(bucket.count, bucket.width)
+                letters = records[:, :length] - ord('A')
+                ids = np.arange(bucket.first_id, bucket.first_id + bucket.count)
+                self.lengths[length] = LengthIndex(length, letters, ids)
+        elif words is not None:
+            buckets = {}
+            for word_id, word in enumerate(words):
+                word = word.upper()
+                if word.isascii() and word.isalpha() and len(word) <= MAX_LENGTH:
+                    buckets.setdefault(len(word), ([], []))
+                    buckets[len(word)][0].append(word)
+                    buckets[len(word)][1].append(word_id)
+            for length, (bucket_words, ids) in buckets.items():
+                letters = np.frombuffer(''.join(bucket_words).encode('ascii'), dtype=np.uint8)
+                self.lengths[length] = LengthIndex(length, letters.reshape(-1, length) - ord('A'),
+                                                   np.array(ids))
+        else:
+            raise ValueError("A word list or a dictionary is needed to build a pattern index")
+
+    def __len__(self):
+        return sum(index.count for index in self.lengths.values())
+
+    def match(self, pattern, guesses=()):
+        """
+        Finds the words that fit a board.
+
+        Parameters:
+        pattern (str or list): The board pattern (see parse_pattern).
+        guesses (iterable): The letters guessed so far, such as HangmanGame.guesses.
+
+        Returns:
+        tuple: The LengthIndex of the pattern's length (None if no word has that length) and a
+               bitset of the matching words within it.
+        """
+        pattern = parse_pattern(pattern)
+        index = self.lengths.get(len(pattern))
+        if index is None:
+            return None, 0
+        return index, index.match(pattern, guesses)
+
+    def candidate_ids(self, pattern, guesses=()):
+        """
+        Lists the ids of the words that fit a board.
+
+        Parameters:
+        pattern (str or list): The board pattern (see parse_pattern).
+        guesses (iterable): The letters guessed so far.
+
+        Returns:
+        numpy.ndarray: The word ids.
+        """
+        index, bitset = self.match(pattern, guesses)
+        if index is None:
+            return np.zeros(0, dtype=np.int64)
+        return index.ids[index.indices(bitset)]
+
+    def candidates(self, pattern, guesses=()):
+        """
+        Lists the words that fit a board.
+
+        Parameters:
+        pattern (str or list): The board pattern (see parse_pattern).
+        guesses (iterable): The letters guessed so far.
+
+        Returns:
+        list: The words, in upper case.
+        """
+        index, bitset = self.match(pattern, guesses)
+        if index is None:
+            return []
+        letters = (index.letters[index.indices(bitset)] + ord('A')).astype(np.uint8)
+        return [word.decode('ascii') for word in np.ascontiguousarray(letters).view(f'S{index.length}').ravel()]
+
+    def letter_counts(self, pattern, guesses=()):
+        """
+        Counts, without listing them, the words that fit a board and how many of them contain
+        each letter.
+
+        Parameters:
+        pattern (str or list): The board pattern (see parse_pattern).
+        guesses (iterable): The letters guessed so far.
+
+        Returns:
+        tuple: The number of matching words, and an array of 26 counts of the matching words
+               containing each letter from A to Z.
+        """
+        index, bitset = self.match(pattern, guesses)
+        if index is None:
+            return 0, np.zeros(len(LETTERS), dtype=np.int64)
+        packed = index.packed(bitset)
+        counts = popcount((index.packed_contains & packed).view(np.uint64)).sum(axis=1, dtype=np.int64)
+        return int(popcount(packed.view(np.uint64)).sum()), counts
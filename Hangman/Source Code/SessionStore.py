@@ -0,0 +1,374 @@
+import argparse
+import itertools
+import os
+import random
+import struct
+import time
+import tracemalloc
+
+from HangmanGame import HangmanGame
+from WordDictionary import LETTERS, WordDictionary
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class hosts large numbers of concurrent Hangman games. Each game is a small slotted
+# record rather than a HangmanGame: the id of its word in a shared WordDictionary, the guessed letters as a
+# 26-bit mask, the revealed positions as a bitmask and the lives left. Games are kept in memory in least
+# recently used order up to a capacity. Beyond it the least recently used games are written to a snapshot
+# file of fixed-width records, one slot per session id, and read back transparently the next time they are
+# played, so evicting or restoring a game is a single seek. The snapshot starts with a fingerprint of the
+# dictionary, since word ids only mean the same words in the same dictionary file.
+
+SNAPSHOT_MAGIC = b'HANGSESS'
+SNAPSHOT_HEADER = struct.Struct('<8sQI')  # Magic, dictionary word count, dictionary checksum
+RECORD = struct.Struct('<BIIQB')  # In use flag, word id, guessed letters, revealed positions, lives
+IN_USE = 1
+
+
+class HangmanSession:
+    __slots__ = ('word_id', 'guessed', 'revealed', 'lives')
+
+    def __init__(self, word_id, guessed=0, revealed=0, lives=5):
+        """
+        Initializes a game record.
+
+        Parameters:
+        word_id (int): The id of the word in the shared dictionary.
+        guessed (int): The guessed letters, bit 0 for A to bit 25 for Z.
+        revealed (int): The revealed positions of the word, bit 0 for the first letter.
+        lives (int): The number of lives left.
+        """
+        self.word_id = word_id
+        self.guessed = guessed
+        self.revealed = revealed
+        self.lives = lives
+
+    def make_guess(self, word, letter):
+        """
+        Processes a guess the way HangmanGame.make_guess does.
+
+        Parameters:
+        word (str): The session's word, looked up in the dictionary.
+        letter (str): The letter guessed.
+
+        Returns:
+        bool: True if the guess was correct, False otherwise.
+        """
+        index = LETTERS.find(letter.upper())
+        if index < 0 or len(letter) != 1:
+            return False  # Ignore anything that is not a letter
+        bit = 1 << index
+        if self.is_game_over(word) or self.guessed & bit:
+            return False  # Do nothing if the game is over or the letter was already guessed
+        letter = LETTERS[index]
+        self.guessed |= bit
+        positions = 0
+        for position, char in enumerate(word):
+            if char == letter:
+                positions |= 1 << position
+        if positions:
+            self.revealed |= positions
+            return True
+        self.lives -= 1
+        return False
+
+    def is_game_over(self, word):
+        """
+        Checks if the game is over.
+
+        Parameters:
+        word (str): The session's word.
+
+        Returns:
+        bool: True if the word has been guessed or no lives are left.
+        """
+        return self.lives <= 0 or self.revealed == (1 << len(word)) - 1
+
+    def word_display(self, word):
+        """
+        Returns the word with unrevealed letters as underscores, as HangmanGame.get_word_display does.
+
+        Parameters:
+        word (str): The session's word.
+
+        Returns:
+        str: The word display with spaces between letters.
+        """
+        return ' '.join(char if self.revealed >> position & 1 else '_' for position, char in enumerate(word))
+
+    def guesses(self):
+        """
+        Lists the guessed letters.
+
+        Returns:
+        set: The guessed letters, as in HangmanGame.guesses.
+        """
+        return {letter for index, letter in enumerate(LETTERS) if self.guessed >> index & 1}
+
+
+class SessionStore:
+    def __init__(self, dictionary, snapshot_path, capacity=100000, lives=5):
+        """
+        Initializes the store. An existing snapshot file is reopened, so sessions written to it
+        by an earlier store can be played again, as long as it was written for the same dictionary.
+
+        Parameters:
+        dictionary (WordDictionary): The dictionary the sessions' words come from.
+        snapshot_path (str): The snapshot file evicted sessions are written to.
+        capacity (int): The most sessions kept in memory.
+        lives (int): The lives of a new session.
+
+        Raises:
+        ValueError: If the snapshot file was written for a different dictionary, or a rebuilt or
+                    rescored version of it.
+        """
+        self.dictionary = dictionary
+        self.capacity = capacity
+        self.lives = lives
+        self.sessions = {}  # Session id -> HangmanSession, least recently used first
+        header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(dictionary), dictionary.checksum())
+        mode = 'r+b' if os.path.exists(snapshot_path) else 'w+b'
+        self.snapshot = open(snapshot_path, mode)
+        found = self.snapshot.read(SNAPSHOT_HEADER.size)
+        if not found:
+            self.snapshot.write(header)
+        elif found != header:
+            self.snapshot.close()
+            raise ValueError(f"{snapshot_path} was written for a different dictionary")
+        self.snapshot.seek(0, os.SEEK_END)
+        self.next_id = (self.snapshot.tell() - SNAPSHOT_HEADER.size) // RECORD.size
+        self.evictions = 0
+        self.rehydrations = 0
+
+    def close(self):
+        """
+        Writes every session in memory to the snapshot and closes it.
+        """
+        self.evict(len(self.sessions))
+        self.snapshot.close()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def create(self, min_length=1, max_length=None, min_difficulty=0, max_difficulty=255):
+        """
+        Starts a session with a random dictionary word.
+
+        Parameters:
+        min_length (int): The shortest word to pick.
+        max_length (int): The longest word to pick, or None for no limit.
+        min_difficulty (int): The lowest difficulty to pick, from 0 to 255.
+        max_difficulty (int): The highest difficulty to pick, from 0 to 255.
+
+        Returns:
+        int: The session id.
+        """
+        session_id = self.next_id
+        self.next_id += 1
+        word_id = self.dictionary.random_word_id(min_length, max_length, min_difficulty, max_difficulty)
+        self.sessions[session_id] = HangmanSession(word_id, lives=self.lives)
+        if len(self.sessions) > self.capacity:
+            self.evict(len(self.sessions) - self.capacity)
+        return session_id
+
+    def get(self, session_id):
+        """
+        Returns a session, reading it back from the snapshot if it was evicted, and marks it as
+        the most recently used.
+
+        Parameters:
+        session_id (int): The session id.
+
+        Returns:
+        HangmanSession: The session.
+
+        Raises:
+        KeyError: If there is no such session.
+        """
+        session = self.sessions.pop(session_id, None)
+        if session is None:
+            session = self.rehydrate(session_id)
+        self.sessions[session_id] = session  # Reinserting moves it to the most recently used end
+        if len(self.sessions) > self.capacity:
+            self.evict(len(self.sessions) - self.capacity)
+        return session
+
+    def make_guess(self, session_id, letter):
+        """
+        Plays a guess in a session.
+
+        Parameters:
+        session_id (int): The session id.
+        letter (str): The letter guessed.
+
+        Returns:
+        tuple: Whether the guess was correct, the word display, the lives left and whether the
+               game is over.
+        """
+        session = self.get(session_id)
+        word = self.dictionary.word(session.word_id)
+        correct = session.make_guess(word, letter)
+        return correct, session.word_display(word), session.lives, session.is_game_over(word)
+
+    def remove(self, session_id):
+        """
+        Ends a session and frees its snapshot slot.
+
+        Parameters:
+        session_id (int): The session id.
+        """
+        if self.sessions.pop(session_id, None) is None:
+            self.rehydrate(session_id)
+        self.snapshot.seek(SNAPSHOT_HEADER.size + session_id * RECORD.size)
+        self.snapshot.write(bytes(RECORD.size))
+
+    def evict(self, count):
+        """
+        Writes the least recently used sessions to the snapshot and drops them from memory.
+
+        Parameters:
+        count (int): The number of sessions to evict.
+        """
+        for session_id in list(itertools.islice(self.sessions, count)):
+            session = self.sessions.pop(session_id)
+            self.snapshot.seek(SNAPSHOT_HEADER.size + session_id * RECORD.size)
+            self.snapshot.write(RECORD.pack(IN_USE, session.word_id, session.guessed, session.revealed,
+                                            max(session.lives, 0)))
+            self.evictions += 1
+
+    def rehydrate(self, session_id):
+        """
+        Reads an evicted session from the snapshot.
+
+        Parameters:
+        session_id (int): The session id.
+
+        Returns:
+        HangmanSession: The session.
+
+        Raises:
+        KeyError: If the snapshot has no such session.
+        """
+        self.snapshot.seek(SNAPSHOT_HEADER.size + session_id * RECORD.size)
+        data = self.snapshot.read(RECORD.size)
+        if len(data) < RECORD.size or data[0] != IN_USE:
+            raise KeyError(session_id)
+        _, word_id, guessed, revealed, lives = RECORD.unpack(data)
+        self.rehydrations += 1
+        return HangmanSession(word_id, guessed, revealed, lives)
+
+
+def measure(build, count):
+    """
+    Measures the memory taken by a number of objects.
+
+    Parameters:
+    build (callable): Creates the objects and returns something that keeps them alive.
+    count (int): The number of objects created.
+
+    Returns:
+    float: The bytes allocated per object.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / count
+
+
+def benchmark(dictionary_path, sessions=200000, capacity=50000, guesses=3, snapshot_path=None, seed=None):
+    """
+    Compares the memory per game of HangmanGame and of SessionStore, then plays a guess in every
+    session to time eviction and rehydration.
+
+    Parameters:
+    dictionary_path (str): The dictionary file.
+    sessions (int): The number of games to create.
+    capacity (int): The store capacity for the timed run.
+    guesses (int): The guesses made in each game before measuring.
+    snapshot_path (str): The snapshot file, removed afterwards. Defaults to one next to the dictionary.
+    seed (int): The seed for the words and guesses.
+
+    Returns:
+    dict: 'sessions', 'game_bytes', 'session_bytes', 'snapshot_bytes', 'guesses_per_sec',
+          'evictions' and 'rehydrations'.
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    letters = [rng.sample(LETTERS, guesses) for _ in range(1000)]
+    snapshot_path = snapshot_path or dictionary_path + '.sessions'
+    with WordDictionary(dictionary_path) as dictionary:
+        def games():
+            kept = []
+            for index in range(sessions):
+                game = HangmanGame(dictionary)
+                for letter in letters[index % len(letters)]:
+                    game.make_guess(letter)
+                kept.append(game)
+            return kept
+
+        def records():
+            store = SessionStore(dictionary, snapshot_path, capacity=sessions)
+            for index in range(sessions):
+                session_id = store.create()
+                for letter in letters[index % len(letters)]:
+                    store.make_guess(session_id, letter)
+            return store
+
+        game_bytes = measure(games, sessions)
+        session_bytes = measure(records, sessions)
+        os.remove(snapshot_path)
+
+        store = SessionStore(dictionary, snapshot_path, capacity=capacity)
+        for _ in range(sessions):
+            store.create()
+        start_time = time.perf_counter()
+        for session_id in range(sessions):
+            store.make_guess(session_id, rng.choice(LETTERS))
+        seconds = time.perf_counter() - start_time
+        store.close()
+        report = {
+            'sessions': sessions,
+            'game_bytes': game_bytes,
+            'session_bytes': session_bytes,
+            'snapshot_bytes': RECORD.size,
+            'guesses_per_sec': sessions / seconds if seconds else 0.0,
+            'evictions': store.evictions,
+            'rehydrations': store.rehydrations,
+        }
+        os.remove(snapshot_path)
+    return report
+
+
+def format_report(report):
+    """
+    Formats a benchmark report as readable text.
+
+    Parameters:
+    report (dict): A report returned by benchmark.
+
+    Returns:
+    str: The report as a multi-line string.
+    """
+    return "\n".join([
+        f"Sessions: {report['sessions']}",
+        f"Memory per HangmanGame: {report['game_bytes']:,.0f} bytes",
+        f"Memory per stored session: {report['session_bytes']:,.0f} bytes "
+        f"({report['snapshot_bytes']} bytes when evicted to the snapshot)",
+        f"Guesses with eviction: {report['guesses_per_sec']:,.0f}/sec "
+        f"({report['evictions']} evictions, {report['rehydrations']} rehydrations)",
+    ])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the memory per Hangman session.")
+    parser.add_argument("dictionary", help="dictionary file built with WordDictionary.py")
+    parser.add_argument("--sessions", type=int, default=200000, help="number of sessions")
+    parser.add_argument("--capacity", type=int, default=50000, help="sessions kept in memory for the timed run")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    print(format_report(benchmark(args.dictionary, args.sessions, args.capacity, seed=args.seed)))
@@ -0,0 +1,479 @@
+import argparse
+import bisect
+import math
+import mmap
+import random
+import struct
+import zlib
+
+
+# Author: Sohaib Hussain
+# Date: October 18, 2026
+# Description: This class serves Hangman words from a prebuilt dictionary file that is memory-mapped rather
+# than read into Python strings. Words are stored in buckets by length as fixed-width records of the word's
+# letters followed by a frequency byte and a difficulty byte, sorted by difficulty within each bucket. A
+# small index at the start of the file gives each bucket's offset and where each difficulty starts, so
+# opening a dictionary only reads the index, and a random word matching a length range and difficulty band
+# is found by picking a bucket and indexing straight into its records.
+
+MAGIC = b'HANGDICT'
+VERSION = 1
+HEADER = struct.Struct('<8sIII')  # Magic, version, number of buckets, number of words
+BUCKET = struct.Struct('<IIIQ')  # Word length, number of words, id of the first word, offset of the records
+LEVELS = 256  # Difficulty and frequency are stored as one byte each
+STARTS = struct.Struct(f'<{LEVELS + 1}I')  # Index of the first record of each difficulty, plus the count
+EXTRA = 2  # Bytes after the letters of each record: frequency, then difficulty
+LETTERS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+# Longest word stored. The solver packs a word's positions and a 5-bit letter number into one signed 64-bit
+# integer, and game sessions keep the revealed positions in 64 bits
+MAX_LENGTH = 58
+
+
+class Bucket:
+    __slots__ = ('length', 'count', 'first_id', 'offset', 'starts')
+
+    def __init__(self, length, count, first_id, offset, starts):
+        """
+        Describes the records of one word length.
+
+        Parameters:
+        length (int): The length of the words in the bucket.
+        count (int): The number of words in the bucket.
+        first_id (int): The word id of the first record.
+        offset (int): The position of the first record in the file.
+        starts (tuple): The index of the first record of each difficulty, with the count at the end.
+        """
+        self.length = length
+        self.count = count
+        self.first_id = first_id
+        self.offset = offset
+        self.starts = starts
+
+    @property
+    def width(self):
+        """
+        Returns the size of one record in bytes.
+
+        Returns:
+        int: The word length plus the frequency and difficulty bytes.
+        """
+        return self.length + EXTRA
+
+    def band(self, min_difficulty, max_difficulty):
+        """
+        Returns the range of records within a difficulty band.
+
+        Parameters:
+        min_difficulty (int): The lowest difficulty, from 0 to 255.
+        max_difficulty (int): The highest difficulty, from 0 to 255.
+
+        Returns:
+        tuple: The first record and one past the last record in the band.
+        """
+        return self.starts[min_difficulty], self.starts[max_difficulty + 1]
+
+
+class WordDictionary:
+    def __init__(self, path):
+        """
+        Opens a dictionary file and reads its index. The records stay on disk and are paged in
+        by the operating system when words are read.
+
+        Parameters:
+        path (str): The path of a file written by write_dictionary or build_dictionary.
+
+        Raises:
+        ValueError: If the file is not a dictionary of this version.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, bucket_count, self.word_count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError(f"{path} is not a version {VERSION} Hangman dictionary")
+        self.buckets = {}
+        position = HEADER.size
+        for _ in range(bucket_count):
+            length, count, first_id, offset = BUCKET.unpack_from(self.data, position)
+            starts = STARTS.unpack_from(self.data, position + BUCKET.size)
+            self.buckets[length] = Bucket(length, count, first_id, offset, starts)
+            position += BUCKET.size + STARTS.size
+        self.lengths = sorted(self.buckets)
+        self.first_ids = [self.buckets[length].first_id for length in self.lengths]
+        self._checksum = None
+
+    def close(self):
+        """
+        Unmaps the dictionary file.
+        """
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.word_count
+
+    def checksum(self):
+        """
+        Computes a checksum of the whole file, which changes if any word, or the order of the words,
+        is changed. The result is cached, since the file is mapped read only.
+
+        Returns:
+        int: The CRC-32 of the file.
+        """
+        if self._checksum is None:
+            self._checksum = zlib.crc32(self.data)
+        return self._checksum
+
+    def record(self, bucket, index):
+        """
+        Reads one record of a bucket.
+
+        Parameters:
+        bucket (Bucket): The bucket holding the record.
+        index (int): The position of the record within the bucket.
+
+        Returns:
+        tuple: The word (str), its frequency byte and its difficulty byte.
+        """
+        start = bucket.offset + index * bucket.width
+        end = start + bucket.length
+        return self.data[start:end].decode('ascii'), self.data[end], self.data[end + 1]
+
+    def word(self, word_id):
+        """
+        Returns the word with a given id. Ids number the words in file order, from 0.
+
+        Parameters:
+        word_id (int): The id of the word.
+
+        Returns:
+        str: The word, in upper case.
+
+        Raises:
+        IndexError: If there is no word with that id.
+        """
+        if not 0 <= word_id < self.word_count:
+            raise IndexError(f"Word id {word_id} is out of range")
+        bucket = self.buckets[self.lengths[bisect.bisect_right(self.first_ids, word_id) - 1]]
+        return self.record(bucket, word_id - bucket.first_id)[0]
+
+    def ranges(self, min_length=1, max_length=None, min_difficulty=0, max_difficulty=LEVELS - 1):
+        """
+        Finds the records of every bucket that match the filters.
+
+        Parameters:
+        min_length (int): The shortest word length.
+        max_length (int): The longest word length, or None for no limit.
+        min_difficulty (int): The lowest difficulty, from 0 to 255.
+        max_difficulty (int): The highest difficulty, from 0 to 255.
+
+        Returns:
+        list: (bucket, first record, end record) for each bucket with matching words.
+        """
+        min_difficulty = max(min_difficulty, 0)
+        max_difficulty = min(max_difficulty, LEVELS - 1)
+        ranges = []
+        if min_difficulty > max_difficulty:
+            return ranges
+        for length in self.lengths:
+            if length < min_length or (max_length is not None and length > max_length):
+                continue
+            bucket = self.buckets[length]
+            first, end = bucket.band(min_difficulty, max_difficulty)
+            if end > first:
+                ranges.append((bucket, first, end))
+        return ranges
+
+    def count(self, min_length=1, max_length=None, min_difficulty=0, max_difficulty=LEVELS - 1):
+        """
+        Counts the words that match the filters.
+
+        Parameters:
+        min_length (int): The shortest word length.
+        max_length (int): The longest word length, or None for no limit.
+        min_difficulty (int): The lowest difficulty, from 0 to 255.
+        max_difficulty (int): The highest difficulty, from 0 to 255.
+
+        Returns:
+        int: The number of matching words.
+        """
+        return sum(end - first for _, first, end in
+                   self.ranges(min_length, max_length, min_difficulty, max_difficulty))
+
+    def random_word_id(self, min_length=1, max_length=None, min_difficulty=0, max_difficulty=LEVELS - 1,
+                       rng=None):
+        """
+        Picks the id of a word uniformly at random from the words that match the filters. Since
+        each bucket is sorted by difficulty, the matching words of a bucket are one run of records,
+        so this takes one step per word length and never scans the words.
+
+        Parameters:
+        min_length (int): The shortest word length.
+        max_length (int): The longest word length, or None for no limit.
+        min_difficulty (int): The lowest difficulty, from 0 to 255.
+        max_difficulty (int): The highest difficulty, from 0 to 255.
+        rng (random.Random): The random number generator to use. Defaults to the random module.
+
+        Returns:
+        int: The word id.
+
+        Raises:
+        LookupError: If no word matches the filters.
+        """
+        ranges = self.ranges(min_length, max_length, min_difficulty, max_difficulty)
+        total = sum(end - first for _, first, end in ranges)
+        if total == 0:
+            raise LookupError("No dictionary word matches the requested length and difficulty")
+        pick = (rng or random).randrange(total)
+        for bucket, first, end in ranges:
+            if pick < end - first:
+                return bucket.first_id + first + pick
+            pick -= end - first
+
+    def random_word(self, min_length=1, max_length=None, min_difficulty=0, max_difficulty=LEVELS - 1, rng=None):
+        """
+        Picks a word uniformly at random from the words that match the filters (see random_word_id).
+
+        Parameters:
+        min_length (int): The shortest word length.
+        max_length (int): The longest word length, or None for no limit.
+        min_difficulty (int): The lowest difficulty, from 0 to 255.
+        max_difficulty (int): The highest difficulty, from 0 to 255.
+        rng (random.Random): The random number generator to use. Defaults to the random module.
+
+        Returns:
+        str: The word, in upper case.
+
+        Raises:
+        LookupError: If no word matches the filters.
+        """
+        return self.word(self.random_word_id(min_length, max_length, min_difficulty, max_difficulty, rng))
+
+    def records(self, length):
+        """
+        Iterates over the records of one word length, in order of difficulty.
+
+        Parameters:
+        length (int): The word length.
+
+        Returns:
+        generator: (word, frequency, difficulty) tuples.
+        """
+        bucket = self.buckets.get(length)
+        if bucket is None:
+            return
+        for index in range(bucket.count):
+            yield self.record(bucket, index)
+
+    def __iter__(self):
+        """
+        Iterates over every record, in order of word id.
+
+        Returns:
+        generator: (word, frequency, difficulty) tuples.
+        """
+        for length in self.lengths:
+            yield from self.records(length)
+
+
+def normalize(word):
+    """
+    Converts a word to the form stored in a dictionary.
+
+    Parameters:
+    word (str): The word.
+
+    Returns:
+    str: The word in upper case, or None if it has characters other than the letters A to Z or
+         is longer than MAX_LENGTH.
+    """
+    word = word.strip().upper()
+    if not word or len(word) > MAX_LENGTH or any(char not in LETTERS for char in word):
+        return None
+    return word
+
+
+def write_dictionary(path, records):
+    """
+    Writes a dictionary file.
+
+    Parameters:
+    path (str): The path of the file to write.
+    records (iterable): (word, frequency, difficulty) tuples, with the word already normalized
+                        and the frequency and difficulty from 0 to 255. A word listed twice
+                        keeps its first record.
+
+    Returns:
+    int: The number of words written.
+
+    Raises:
+    ValueError: If a word is longer than MAX_LENGTH.
+    """
+    buckets = {}
+    seen = set()
+    for word, frequency, difficulty in records:
+        if word in seen:
+            continue
+        if len(word) > MAX_LENGTH:
+            raise ValueError(f"{word} is longer than {MAX_LENGTH} letters")
+        seen.add(word)
+        buckets.setdefault(len(word), []).append((difficulty, word, frequency))
+
+    groups = []
+    for length in sorted(buckets):
+        entries = buckets[length]
+        entries.sort()
+        counts = [0] * LEVELS
+        for difficulty, _, _ in entries:
+            counts[difficulty] += 1
+        groups.append((length, counts, ((word, frequency, difficulty) for difficulty, word, frequency in entries)))
+    return write_buckets(path, groups)
+
+
+def write_buckets(path, buckets):
+    """
+    Writes a dictionary file from records already grouped by length and sorted. The records are
+    streamed to the file, so they never have to be held in memory at once.
+
+    Parameters:
+    path (str): The path of the file to write.
+    buckets (list): (length, counts, records) tuples in order of length. counts holds the number of
+                    words of each difficulty, and records yields that many (word, frequency, difficulty)
+                    tuples in order of difficulty.
+
+    Returns:
+    int: The number of words written.
+
+    Raises:
+    ValueError: If a bucket yields a different number of records than its counts add up to.
+    """
+    position = HEADER.size + len(buckets) * (BUCKET.size + STARTS.size)
+    first_id = 0
+    index = []
+    for length, counts, _ in buckets:
+        starts = [0]
+        for count in counts:
+            starts.append(starts[-1] + count)
+        index.append(BUCKET.pack(length, starts[-1], first_id, position) + STARTS.pack(*starts))
+        position += starts[-1] * (length + EXTRA)
+        first_id += starts[-1]
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(buckets), first_id))
+        f.writelines(index)
+        for length, counts, records in buckets:
+            written = 0
+            for word, frequency, difficulty in records:
+                f.write(word.encode('ascii') + bytes((frequency, difficulty)))
+                written += 1
+            if written != sum(counts):
+                raise ValueError(f"Expected {sum(counts)} words of length {length}, got {written}")
+    return first_id
+
+
+def frequency_byte(count, max_count):
+    """
+    Scales a word count to a frequency byte on a logarithmic scale, so rare and common words both
+    keep some resolution.
+
+    Parameters:
+    count (int): How often the word occurs.
+    max_count (int): How often the most common word occurs.
+
+    Returns:
+    int: The frequency from 0 (unseen) to 255 (the most common word).
+    """
+    if count <= 0 or max_count <= 0:
+        return 0
+    return max(1, round((LEVELS - 1) * math.log1p(count) / math.log1p(max_count)))
+
+
+def build_dictionary(path, words):
+    """
+    Builds a dictionary file from words with optional counts and difficulties. Words are
+    normalized, the ones that cannot be played are dropped and the counts of repeated words are
+    added together.
+
+    Parameters:
+    path (str): The path of the file to write.
+    words (iterable): Words as strings, or (word, count) or (word, count, difficulty) tuples.
+                      Words without a count get count 1, and without a difficulty get 0.
+
+    Returns:
+    int: The number of words written.
+    """
+    counts = {}
+    difficulties = {}
+    for entry in words:
+        if isinstance(entry, str):
+            entry = (entry,)
+        word = normalize(entry[0])
+        if word is None:
+            continue
+        counts[word] = counts.get(word, 0) + (entry[1] if len(entry) > 1 else 1)
+        if len(entry) > 2:
+            difficulties[word] = min(max(int(entry[2]), 0), LEVELS - 1)
+    max_count = max(counts.values(), default=0)
+    return write_dictionary(path, ((word, frequency_byte(count, max_count), difficulties.get(word, 0))
+                                   for word, count in counts.items()))
+
+
+def read_word_list(path):
+    """
+    Reads a text word list with one word per line, optionally followed by a count and a
+    difficulty separated by whitespace.
+
+    Parameters:
+    path (str): The path of the word list.
+
+    Returns:
+    generator: (word, count, difficulty) tuples.
+    """
+    with open(path, encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            fields = line.split()
+            if not fields:
+                continue
+            count = int(fields[1]) if len(fields) > 1 else 1
+            difficulty = int(fields[2]) if len(fields) > 2 else 0
+            yield fields[0], count, difficulty
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query a memory-mapped Hangman dictionary.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help="build a dictionary from a word list")
+    build.add_argument('words', help="text file with one word per line, optionally with a count and difficulty")
+    build.add_argument('output', help="dictionary file to write")
+    info = commands.add_parser('info', help="show the words per length of a dictionary")
+    info.add_argument('dictionary', help="dictionary file")
+    sample = commands.add_parser('sample', help="print random words from a dictionary")
+    sample.add_argument('dictionary', help="dictionary file")
+    sample.add_argument('--count', type=int, default=10, help="number of words")
+    sample.add_argument('--min-length', type=int, default=1, help="shortest word length")
+    sample.add_argument('--max-length', type=int, default=None, help="longest word length")
+    sample.add_argument('--min-difficulty', type=int, default=0, help="lowest difficulty (0-255)")
+    sample.add_argument('--max-difficulty', type=int, default=LEVELS - 1, help="highest difficulty (0-255)")
+    sample.add_argument('--seed', type=int, default=None, help="random seed")
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        written = build_dictionary(args.output, read_word_list(args.words))
+        print(f"Wrote {written} words to {args.output}")
+    elif args.command == 'info':
+        with WordDictionary(args.dictionary) as dictionary:
+            print(f"{len(dictionary)} words")
+            for length in dictionary.lengths:
+                print(f"Length {length:2}: {dictionary.buckets[length].count} words")
+    else:
+        rng = random.Random(args.seed)
+        with WordDictionary(args.dictionary) as dictionary:
+            for _ in range(args.count):
+                print(dictionary.random_word(args.min_length, args.max_length, args.min_difficulty,
+                                             args.max_difficulty, rng))
@@ -1,9 +1,16 @@
+import argparse
 import tkinter as tk
 from GUI import GameUI
+from WordDictionary import WordDictionary
 
 def main():
+    parser = argparse.ArgumentParser(description="Play Hangman.")
+    parser.add_argument("dictionary", nargs="?", default=None, help="dictionary file built with WordDictionary.py")
+    parser.add_argument("--evil", action="store_true", help="play the adversarial mode")
+    args = parser.parse_args()
+    dictionary = WordDictionary(args.dictionary) if args.dictionary else None
     root = tk.Tk()
-    app = GameUI(root)
+    app = GameUI(root, dictionary, args.evil)
     root.mainloop()
 
 if __name__ == "__main__":
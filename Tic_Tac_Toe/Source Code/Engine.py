@@ -0,0 +1,483 @@
+# Author: Sohaib Hussain
+# Date: 2026-10-18
+# Description: Search engine for the computer player of Tic-Tac-Toe and of larger m,n,k games, where players
+# take turns on an m x n board and the first to get k in a row wins. It searches with negamax and alpha-beta
+# pruning under iterative deepening and a time budget. Positions are stored in a transposition table keyed by
+# a canonical Zobrist hash: the hash of the board under each of its symmetries is kept up to date as stones are
+# placed, and the smallest one is the key, so positions that are rotations or reflections of each other share
+# one entry. The table can be saved to and loaded from disk.
+
+import argparse
+import os
+import random
+import struct
+import time
+
+WIN = 100000  # Score of a won position, less the plies it takes to win
+WIN_THRESHOLD = WIN - 1000  # Scores beyond this are forced wins or losses
+INFINITY = WIN + 1
+
+EXACT, LOWER, UPPER = 0, 1, 2  # Kinds of table entries: exact value, lower bound, upper bound
+NO_MOVE = 0xFFFF
+
+TABLE_MAGIC = b'MNKTABLE'
+TABLE_HEADER = struct.Struct('<8sHHH')  # Magic, rows, columns, k
+TABLE_ENTRY = struct.Struct('<QiBBH')  # Canonical hash, value, depth, kind, best move in the canonical board
+
+CHECK_EVERY = 1024  # Nodes searched between checks of the time budget
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+def count_bits(value):
+    """Counts the set bits of an integer.
+
+    Args:
+        value (int): The integer.
+
+    Returns:
+        int: The number of set bits.
+    """
+    return bin(value).count('1')
+
+
+class MNKEngine:
+    def __init__(self, rows=3, cols=3, k=3, table_path=None, max_entries=2000000):
+        """Sets up the lines, symmetries and hash keys of a board size.
+
+        Args:
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            k (int): The number of stones in a row needed to win.
+            table_path (str): The file the transposition table is saved to, and loaded from if it exists.
+            max_entries (int): The most positions kept in the table before it is cleared.
+        """
+        if not 1 <= k <= max(rows, cols):
+            raise ValueError(f'{k} in a row cannot fit on a {rows}x{cols} board')
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.cells = rows * cols
+        self.table_path = table_path
+        self.max_entries = max_entries
+
+        # Every run of k cells as a bitmask, and the runs through each cell
+        self.lines = []
+        for row in range(rows):
+            for col in range(cols):
+                for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                    if 0 <= end_row < rows and 0 <= end_col < cols:
+                        self.lines.append(sum(1 << ((row + d_row * i) * cols + col + d_col * i) for i in range(k)))
+        self.lines_by_cell = [[line for line in self.lines if line >> cell & 1] for cell in range(self.cells)]
+        self.weights = [0] + [4 ** count for count in range(1, k + 1)]  # Heuristic value of an open line
+
+        # Cells nearest the centre are tried first; on large boards only cells next to a stone are tried
+        center_row, center_col = (rows - 1) / 2, (cols - 1) / 2
+        self.order = sorted(range(self.cells),
+                            key=lambda cell: abs(cell // cols - center_row) + abs(cell % cols - center_col))
+        self.neighbours = []
+        for cell in range(self.cells):
+            row, col = divmod(cell, cols)
+            self.neighbours.append(sum(1 << (r * cols + c) for r in range(max(row - 1, 0), min(row + 2, rows))
+                                       for c in range(max(col - 1, 0), min(col + 2, cols))))
+        self.local_moves = self.cells > 16
+
+        self.symmetries = self.make_symmetries()
+        self.inverses = []
+        for permutation in self.symmetries:
+            inverse = [0] * self.cells
+            for cell, image in enumerate(permutation):
+                inverse[image] = cell
+            self.inverses.append(inverse)
+        # The keys only depend on the board size, so a saved table stays valid between runs
+        rng = random.Random(f'mnk-{rows}x{cols}')
+        self.keys = [[rng.getrandbits(64) for _ in range(self.cells)] for _ in range(2)]
+
+        self.table = {}
+        self.stones = [0, 0]  # Bitboards of the first and second player
+        self.hashes = [0] * len(self.symmetries)  # Hash of the board under each symmetry
+        self.deadline = None
+        self.reset_stats()
+        if table_path and os.path.exists(table_path):
+            self.load(table_path)
+
+    def make_symmetries(self):
+        """Lists the symmetries of the board as cell permutations.
+
+        Returns:
+            list: For each symmetry, the cell each cell is moved to. A square board has 8 (rotations
+                  and reflections), any other board has 4.
+        """
+        rows, cols = self.rows, self.cols
+        maps = [lambda r, c: (r, c), lambda r, c: (rows - 1 - r, c), lambda r, c: (r, cols - 1 - c),
+                lambda r, c: (rows - 1 - r, cols - 1 - c)]
+        if rows == cols:
+            maps += [lambda r, c: (c, r), lambda r, c: (cols - 1 - c, r), lambda r, c: (c, rows - 1 - r),
+                     lambda r, c: (cols - 1 - c, rows - 1 - r)]
+        symmetries = []
+        for transform in maps:
+            permutation = []
+            for cell in range(self.cells):
+                row, col = transform(*divmod(cell, cols))
+                permutation.append(row * cols + col)
+            symmetries.append(permutation)
+        return symmetries
+
+    def reset_stats(self):
+        """Clears the search counters."""
+        self.nodes = 0
+        self.probes = 0
+        self.hits = 0
+        self.depth = 0
+        self.value = 0
+        self.seconds = 0.0
+
+    def place(self, cell, player):
+        """Places or removes a stone, updating the board hash under every symmetry.
+
+        Args:
+            cell (int): The cell index, row * cols + col.
+            player (int): 0 for the first player, 1 for the second.
+        """
+        self.stones[player] ^= 1 << cell
+        keys = self.keys[player]
+        for index, permutation in enumerate(self.symmetries):
+            self.hashes[index] ^= keys[permutation[cell]]
+
+    def canonical(self):
+        """Finds the canonical hash of the board.
+
+        Returns:
+            tuple: The smallest hash over the symmetries, and the index of that symmetry.
+        """
+        key = min(self.hashes)
+        return key, self.hashes.index(key)
+
+    def wins(self, cell, player):
+        """Checks if the stone at a cell completes a line.
+
+        Args:
+            cell (int): The cell of the last stone.
+            player (int): The player who placed it.
+
+        Returns:
+            bool: True if the player has k in a row through the cell.
+        """
+        stones = self.stones[player]
+        return any(stones & line == line for line in self.lines_by_cell[cell])
+
+    def set_position(self, board, symbol):
+        """Loads a board in the layout of Game.get_board.
+
+        Args:
+            board (list): The board as a 2D list of 'X', 'O' and ' '.
+            symbol (str): The symbol of the player to move.
+
+        Returns:
+            int: The index of the player to move, 0 if both sides have as many stones.
+        """
+        other = [cell for row in board for cell in row if cell not in (' ', symbol)]
+        other_symbol = other[0] if other else None
+        mine = sum(cell == symbol for row in board for cell in row)
+        player = 0 if mine == len(other) else 1
+        self.stones = [0, 0]
+        self.hashes = [0] * len(self.symmetries)
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cell = board[row][col]
+                if cell == symbol:
+                    self.place(row * self.cols + col, player)
+                elif cell == other_symbol:
+                    self.place(row * self.cols + col, 1 - player)
+        return player
+
+    def moves(self, first=None):
+        """Lists the legal moves in the order they are searched.
+
+        Args:
+            first (int): A move to search first, such as the best move stored in the table.
+
+        Returns:
+            list: The cells to try.
+        """
+        filled = self.stones[0] | self.stones[1]
+        allowed = ~filled
+        if self.local_moves and filled:
+            near = 0
+            for cell in range(self.cells):
+                if filled >> cell & 1:
+                    near |= self.neighbours[cell]
+            allowed &= near
+        moves = [cell for cell in self.order if allowed >> cell & 1]
+        if not moves and ~filled & ((1 << self.cells) - 1):
+            moves = [cell for cell in self.order if not filled >> cell & 1]  # Only distant cells are left
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def has_won(self, board, symbol):
+        """Checks if a player has k in a row on a board.
+
+        Args:
+            board (list): The board as a 2D list of 'X', 'O' and ' '.
+            symbol (str): The player's symbol.
+
+        Returns:
+            bool: True if the player has won.
+        """
+        stones = sum(1 << (row * self.cols + col) for row in range(self.rows) for col in range(self.cols)
+                     if board[row][col] == symbol)
+        return any(stones & line == line for line in self.lines)
+
+    def evaluate(self, player):
+        """Scores a position that is not searched further by its open lines.
+
+        Args:
+            player (int): The player to move.
+
+        Returns:
+            int: The score for the player to move.
+        """
+        mine, theirs = self.stones[player], self.stones[1 - player]
+        score = 0
+        for line in self.lines:
+            if not line & theirs:
+                score += self.weights[count_bits(line & mine)]
+            elif not line & mine:
+                score -= self.weights[count_bits(line & theirs)]
+        return max(-WIN_THRESHOLD + 1, min(WIN_THRESHOLD - 1, score))
+
+    def search(self, depth, alpha, beta, ply, player):
+        """Searches a position with negamax and alpha-beta pruning.
+
+        Args:
+            depth (int): The plies left to search.
+            alpha (int): The score the player to move is already assured of.
+            beta (int): The score the opponent is already assured of.
+            ply (int): The plies from the root, so faster wins score higher.
+            player (int): The player to move.
+
+        Returns:
+            int: The score for the player to move.
+
+        Raises:
+            SearchTimeout: If the time budget runs out.
+        """
+        self.nodes += 1
+        if self.deadline is not None and self.nodes % CHECK_EVERY == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        key, symmetry = self.canonical()
+        entry = self.table.get(key)
+        self.probes += 1
+        best_move = None
+        if entry is not None:
+            self.hits += 1
+            entry_depth, value, kind, stored_move = entry
+            if stored_move != NO_MOVE:
+                best_move = self.inverses[symmetry][stored_move]
+                if (self.stones[0] | self.stones[1]) >> best_move & 1:
+                    best_move = None  # A hash collision; the move is not legal here
+            if entry_depth >= depth and (ply > 0 or best_move is not None):
+                # Win scores are stored relative to the position, not to the root
+                if value > WIN_THRESHOLD:
+                    value -= ply
+                elif value < -WIN_THRESHOLD:
+                    value += ply
+                if kind == EXACT or (kind == LOWER and value >= beta) or (kind == UPPER and value <= alpha):
+                    if ply == 0:
+                        self.root_move = best_move
+                    return value
+
+        moves = self.moves(best_move)
+        if not moves:
+            return 0  # The board is full: a draw
+        if depth == 0:
+            return self.evaluate(player)
+
+        original_alpha = alpha
+        best_value = -INFINITY
+        best_move = moves[0]
+        for move in moves:
+            self.place(move, player)
+            if self.wins(move, player):
+                value = WIN - ply - 1
+            else:
+                value = -self.search(depth - 1, -beta, -alpha, ply + 1, 1 - player)
+            self.place(move, player)
+            if value > best_value:
+                best_value = value
+                best_move = move
+                if ply == 0:
+                    self.root_move = move
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            kind = UPPER
+        elif best_value >= beta:
+            kind = LOWER
+        else:
+            kind = EXACT
+        stored = best_value
+        if stored > WIN_THRESHOLD:
+            stored += ply
+        elif stored < -WIN_THRESHOLD:
+            stored -= ply
+        if len(self.table) >= self.max_entries:
+            self.table.clear()
+        self.table[key] = (depth, stored, kind, self.symmetries[symmetry][best_move])
+        return best_value
+
+    def best_move(self, board, symbol, time_budget=None, max_depth=None):
+        """Picks a move with iterative deepening: full-width searches one ply deeper each time
+        until the game is solved, the depth limit is reached or the time budget runs out.
+
+        Args:
+            board (list): The board as a 2D list of 'X', 'O' and ' ', as in Game.get_board.
+            symbol (str): The symbol of the player to move.
+            time_budget (float): The seconds to search for, or None for no limit.
+            max_depth (int): The deepest search, or None to search to the end of the game.
+
+        Returns:
+            tuple: The (row, col) of the move, or None if the board is full.
+        """
+        player = self.set_position(board, symbol)
+        moves = self.moves()
+        if not moves:
+            return None
+        self.reset_stats()
+        start_time = time.perf_counter()
+        self.deadline = start_time + time_budget if time_budget is not None else None
+        empty = self.cells - count_bits(self.stones[0] | self.stones[1])
+        limit = min(max_depth, empty) if max_depth is not None else empty
+        choice = moves[0]
+        try:
+            for depth in range(1, limit + 1):
+                self.root_move = None
+                value = self.search(depth, -INFINITY, INFINITY, 0, player)
+                if self.root_move is not None:
+                    choice = self.root_move
+                self.depth, self.value = depth, value
+                if abs(value) > WIN_THRESHOLD:
+                    break  # Forced win or loss found
+        except SearchTimeout:
+            pass
+        finally:
+            self.deadline = None
+            self.seconds = time.perf_counter() - start_time
+        return divmod(choice, self.cols)
+
+    def solve(self):
+        """Searches the empty board to the end of the game, filling the table with every position
+        the search needs.
+
+        Returns:
+            int: The value of the empty board for the first player: positive for a win, 0 for a draw.
+        """
+        board = [[' '] * self.cols for _ in range(self.rows)]
+        self.best_move(board, 'X')
+        return self.value
+
+    def stats(self):
+        """Reports the work of the last search.
+
+        Returns:
+            dict: 'nodes', 'seconds', 'nodes_per_sec', 'probes', 'hits', 'hit_rate', 'depth', 'value'
+                  and 'entries'.
+        """
+        return {
+            'nodes': self.nodes,
+            'seconds': self.seconds,
+            'nodes_per_sec': self.nodes / self.seconds if self.seconds else 0.0,
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': self.hits / self.probes if self.probes else 0.0,
+            'depth': self.depth,
+            'value': self.value,
+            'entries': len(self.table),
+        }
+
+    def save(self, path=None):
+        """Writes the transposition table to a file of fixed-width entries.
+
+        Args:
+            path (str): The file to write. Defaults to the engine's table path.
+        """
+        path = path or self.table_path
+        with open(path + '.tmp', 'wb') as f:
+            f.write(TABLE_HEADER.pack(TABLE_MAGIC, self.rows, self.cols, self.k))
+            f.writelines(TABLE_ENTRY.pack(key, value, min(depth, 255), kind, move)
+                         for key, (depth, value, kind, move) in self.table.items())
+        os.replace(path + '.tmp', path)
+
+    def load(self, path):
+        """Reads a transposition table written by save. A table for another board size is ignored.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            bool: True if the table was loaded.
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < TABLE_HEADER.size or \
+                TABLE_HEADER.unpack_from(data) != (TABLE_MAGIC, self.rows, self.cols, self.k):
+            return False
+        for key, value, depth, kind, move in TABLE_ENTRY.iter_unpack(data[TABLE_HEADER.size:]):
+            self.table[key] = (depth, value, kind, move)
+        return True
+
+
+def format_stats(stats):
+    """Formats search statistics as readable text.
+
+    Args:
+        stats (dict): The statistics returned by MNKEngine.stats.
+
+    Returns:
+        str: The statistics on one line.
+    """
+    return (f"depth {stats['depth']}, value {stats['value']}, {stats['nodes']} nodes in {stats['seconds']:.3f}s "
+            f"({stats['nodes_per_sec']:,.0f} nodes/sec), table hit rate {stats['hit_rate']:.1%} "
+            f"({stats['entries']} entries)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Search m,n,k games, or solve one and save its table.')
+    parser.add_argument('--rows', type=int, default=3, help='board rows')
+    parser.add_argument('--cols', type=int, default=3, help='board columns')
+    parser.add_argument('--k', type=int, default=3, help='stones in a row to win')
+    parser.add_argument('--table', default=None, help='transposition table file to load and save')
+    parser.add_argument('--budget', type=float, default=None, help='seconds per move (default: solve)')
+    parser.add_argument('--self-play', action='store_true', help='play a whole game against itself')
+    args = parser.parse_args()
+
+    engine = MNKEngine(args.rows, args.cols, args.k, table_path=args.table)
+    if args.self_play:
+        board = [[' '] * args.cols for _ in range(args.rows)]
+        symbol = 'X'
+        while True:
+            move = engine.best_move(board, symbol, args.budget)
+            if move is None:
+                print('Draw')
+                break
+            board[move[0]][move[1]] = symbol
+            print(f'{symbol} plays {move}: {format_stats(engine.stats())}')
+            if engine.has_won(board, symbol):
+                print('\n'.join(' '.join(row) for row in board))
+                print(f'{symbol} wins')
+                break
+            symbol = 'O' if symbol == 'X' else 'X'
+    else:
+        board = [[' '] * args.cols for _ in range(args.rows)]
+        engine.best_move(board, 'X', args.budget)
+        print(format_stats(engine.stats()))
+    if args.table:
+        engine.save()
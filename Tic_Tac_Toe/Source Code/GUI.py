@@ -7,8 +7,8 @@ from tkinter import messagebox
 # Date: 2024-08-05
 # Description: GUI class for the Tic-Tac-Toe game, handling the user interface and interactions.
 class TicTacToeGUI:
-    def __init__(self, root):
-        self.game = Game()
+    def __init__(self, root, ai_player=None):
+        self.game = Game(ai_player)
         self.root = root
         self.root.title('Tic-Tac-Toe')
 
@@ -64,6 +64,8 @@ class TicTacToeGUI:
         self.game.start_new_game()
         self.update_player_info()
         self.info_label.config(text=f'{self.game.current_player}\'s turn.')
+        if self.game.is_ai_turn():
+            self.play_ai_turn()
 
     def button_click(self, row, col):
         """Handles the click event for board buttons.
@@ -75,9 +77,27 @@ class TicTacToeGUI:
         if self.game.winner:
             return  # Ignore clicks if the game has already been won
 
+        if self.game.is_ai_turn():
+            return  # Ignore clicks while the computer is to move
+
         result = self.game.make_move(row, col)
         self.update_board()
+        self.show_result(result)
+        if self.game.is_ai_turn():
+            self.play_ai_turn()
+
+    def play_ai_turn(self):
+        """Lets the computer make its move and updates the GUI."""
+        result = self.game.make_ai_move()
+        self.update_board()
+        self.show_result(result)
 
+    def show_result(self, result):
+        """Shows the result of a move, starting the next game if this one is over.
+
+        Args:
+            result (str): The message returned by the game for the move.
+        """
         if 'wins' in result or 'draw' in result:
             self.update_scores()
             self.info_label.config(text=result)
@@ -95,10 +115,22 @@ class TicTacToeGUI:
 
     def update_player_info(self):
         """Updates the player labels with their respective symbols."""
-        self.player1_label.config(text=f'Player 1 (O)')
-        self.player2_label.config(text=f'Player 2 (X)')
+        self.player1_label.config(text=self.player_label('Player 1'))
+        self.player2_label.config(text=self.player_label('Player 2'))
         self.update_scores()
 
+    def player_label(self, player):
+        """Builds the label of a player.
+
+        Args:
+            player (str): 'Player 1' or 'Player 2'.
+
+        Returns:
+            str: The player's name and symbol, marked when the computer plays them.
+        """
+        name = 'Computer' if player == self.game.ai_player else player
+        return f'{name} ({self.game.players[player]})'
+
     def update_scores(self):
         """Updates the scores displayed on the GUI."""
         scores = self.game.get_scores()
@@ -1,13 +1,33 @@
 # Author: Sohaib Hussain
 # Date: 2024-08-05
 # Description: Class to manage the game logic, including player turns, scoring, and game state.
+# Either player can be played by the computer, which picks its moves with the search engine in Engine.py.
 
 from Board import Board
+from Engine import MNKEngine, format_stats
 import random
 import logging
 
+TABLE_PATH = './tic_tac_toe.table'  # Solved positions, saved so the computer does not search them again
+
 class Game:
-    def __init__(self):
+    def __init__(self, ai_player=None, engine=None, time_budget=1.0):
+        """Sets up the scores and starts the first game.
+
+        Args:
+            ai_player (str): The player the computer plays ('Player 1' or 'Player 2'), or None for two humans.
+            engine (MNKEngine): The engine to pick the computer's moves. Defaults to a 3x3 engine whose
+                table is loaded from TABLE_PATH, or solved and saved there the first time.
+            time_budget (float): The most seconds the computer thinks about a move.
+        """
+        self.ai_player = ai_player
+        self.time_budget = time_budget
+        self.engine = engine
+        if ai_player and engine is None:
+            self.engine = MNKEngine(3, 3, 3, table_path=TABLE_PATH)
+            if not self.engine.table:
+                self.engine.solve()
+                self.engine.save()
         self.game_number = 1
         self.scores = {'X': 0, 'O': 0}
         logging.basicConfig(filename='./tic_tac_toe.log', level=logging.INFO,
@@ -57,6 +77,24 @@ class Game:
             logging.info(f'Invalid move by {self.current_player} to ({row}, {col})')
             return 'Invalid move. Try again.'
 
+    def is_ai_turn(self):
+        """Checks if the computer should move next.
+
+        Returns:
+            bool: True if it is the computer's turn in a game that is still being played.
+        """
+        return self.current_player == self.ai_player and not self.winner and not self.board.is_full()
+
+    def make_ai_move(self):
+        """Lets the computer pick and make a move for the current player.
+
+        Returns:
+            str: A message indicating the result of the move, as returned by make_move.
+        """
+        row, col = self.engine.best_move(self.get_board(), self.players[self.current_player], self.time_budget)
+        logging.info(f'{self.current_player} (computer) searched: {format_stats(self.engine.stats())}')
+        return self.make_move(row, col)
+
     def get_board(self):
         """Returns the current state of the game board.
 
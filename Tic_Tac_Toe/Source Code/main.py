@@ -1,3 +1,4 @@
+import argparse
 import tkinter as tk
 from GUI import TicTacToeGUI
 
@@ -6,9 +7,13 @@ from GUI import TicTacToeGUI
 # Description: This script initializes the main window and starts the Tic-Tac-Toe GUI application.
 
 if __name__ == '__main__':
+    # Optionally let the computer play one of the players
+    parser = argparse.ArgumentParser(description='Play Tic-Tac-Toe.')
+    parser.add_argument('--ai', type=int, choices=(1, 2), default=None, help='the player the computer plays')
+    args = parser.parse_args()
     # Create the main application window
     root = tk.Tk()
     # Initialize the TicTacToeGUI with the root window
-    app = TicTacToeGUI(root)
+    app = TicTacToeGUI(root, f'Player {args.ai}' if args.ai else None)
     # Start the Tkinter main event loop
     root.mainloop()